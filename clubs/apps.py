@@ -2,4 +2,9 @@ from django.apps import AppConfig
 
 class ClubsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'clubs'
\ No newline at end of file
+    name = 'clubs'
+
+    def ready(self):
+        """Connect the signal receivers of the app."""
+
+        import clubs.signals
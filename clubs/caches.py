@@ -0,0 +1,213 @@
+"""Shared caches for club data that is read far more often than it changes."""
+from django.conf import settings
+from django.core.cache import cache
+from hashlib import md5
+from random import random
+from time import time_ns
+
+# Cache settings that keep nothing, for measuring the work the caches would otherwise hide.
+NO_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+}
+
+# Returned when there is no cache entry, as None means "known not to be in the club".
+MISSING = object()
+
+# Cached in place of None so that users outside a club are cached too.
+NOT_IN_CLUB = 'none'
+
+AUTHORIZATION_HITS_KEY = 'authorization:hits'
+AUTHORIZATION_MISSES_KEY = 'authorization:misses'
+
+FRAGMENT_HITS_KEY = 'fragment:hits'
+FRAGMENT_MISSES_KEY = 'fragment:misses'
+
+def get_authorization_cache_key(user_id, club_id):
+    """Get the cache key of the authorization of the given user in the given club."""
+
+    return f'authorization:{user_id}:{club_id}'
+
+def increment_counter(key, delta=1):
+    """Increment a counter shared by every process using the cache."""
+
+    if not delta:
+        return
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        # The counter was evicted in between, or the cache does not keep anything.
+        pass
+
+def count_lookups(hits_key, misses_key, hits, misses):
+    """Count the hits and misses of cache lookups, for a random sample of settings.CACHE_STATS_SAMPLE_RATE of them.
+
+    Counting takes round trips to the cache of its own, so counting every lookup would cost more than a hit saves.
+    Hits and misses are sampled alike, so the hit rate is kept.
+    """
+
+    if random() < settings.CACHE_STATS_SAMPLE_RATE:
+        increment_counter(hits_key, hits)
+        increment_counter(misses_key, misses)
+
+def get_cached_authorization(user_id, club_id):
+    """Get the cached authorization of a user in a club, or MISSING if it is not cached."""
+
+    authorization = cache.get(get_authorization_cache_key(user_id, club_id), MISSING)
+    missed = authorization is MISSING
+    count_lookups(AUTHORIZATION_HITS_KEY, AUTHORIZATION_MISSES_KEY, int(not missed), int(missed))
+    if missed:
+        return MISSING
+    if authorization == NOT_IN_CLUB:
+        return None
+    return authorization
+
+def cache_authorization(user_id, club_id, authorization):
+    """Cache the authorization of a user in a club, where None means not in the club."""
+
+    if authorization is None:
+        authorization = NOT_IN_CLUB
+    cache.set(
+        get_authorization_cache_key(user_id, club_id),
+        authorization,
+        timeout=settings.AUTHORIZATION_CACHE_TIMEOUT
+    )
+
+def invalidate_authorizations(user_club_ids):
+    """Remove the cached authorizations of the given (user id, club id) pairs."""
+
+    keys = [get_authorization_cache_key(user_id, club_id) for user_id, club_id in user_club_ids]
+    if keys:
+        cache.delete_many(keys)
+
+def get_my_clubs_cache_key(user_id):
+    """Get the cache key of the clubs the given user is in."""
+
+    return f'my_clubs:{user_id}'
+
+def get_cached_my_clubs(user_id):
+    """Get the cached id and name of each club a user is in, or MISSING if they are not cached."""
+
+    return cache.get(get_my_clubs_cache_key(user_id), MISSING)
+
+def cache_my_clubs(user_id, my_clubs):
+    """Cache the id and name of each club a user is in."""
+
+    cache.set(get_my_clubs_cache_key(user_id), my_clubs, timeout=settings.MY_CLUBS_CACHE_TIMEOUT)
+
+def invalidate_my_clubs(user_ids):
+    """Remove the cached clubs of the given users."""
+
+    keys = [get_my_clubs_cache_key(user_id) for user_id in set(user_ids)]
+    if keys:
+        cache.delete_many(keys)
+
+def get_version_key(kind, object_id):
+    """Get the cache key of the version of the given user or club."""
+
+    return f'version:{kind}:{object_id}'
+
+def get_versions(kind, object_ids):
+    """Get the versions of the given users or clubs, keyed by id.
+
+    A version that is not cached starts from the current time rather than from zero, so that a version which
+    was evicted never comes back to a value that fragments were already cached under.
+    """
+
+    keys = {get_version_key(kind, object_id): object_id for object_id in object_ids}
+    versions = cache.get_many(keys)
+    missing_keys = keys.keys() - versions.keys()
+    if missing_keys:
+        for key in missing_keys:
+            cache.add(key, time_ns(), timeout=None)
+        versions.update(cache.get_many(missing_keys))
+    return {keys[key]: version for key, version in versions.items()}
+
+def bump_versions(kind, object_ids):
+    """Bump the versions of the given users or clubs, so that the fragments cached under them are not used again."""
+
+    for object_id in set(object_ids):
+        key = get_version_key(kind, object_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time_ns(), timeout=None)
+
+def get_fragment_cache_key(fragment_name, vary_on, versions):
+    """Get the cache key of a template fragment from the values it varies on and the versions it depends on.
+
+    The versions are (kind, id, version) in the order the fragment shows the users and clubs, which is part of the
+    key as the same users in another order render another fragment.
+    """
+
+    digest = md5(repr((vary_on, list(versions))).encode()).hexdigest()
+    return f'fragment:{fragment_name}:{digest}'
+
+def get_cached_fragment(key):
+    """Get a cached template fragment, or None if it is not cached."""
+
+    fragment = cache.get(key)
+    count_lookups(FRAGMENT_HITS_KEY, FRAGMENT_MISSES_KEY, int(fragment is not None), int(fragment is None))
+    return fragment
+
+def cache_fragment(key, fragment):
+    """Cache a rendered template fragment."""
+
+    cache.set(key, fragment, timeout=settings.FRAGMENT_CACHE_TIMEOUT)
+
+def invalidate_memberships(user_club_ids):
+    """Invalidate everything cached about the given (user id, club id) memberships."""
+
+    user_club_ids = list(user_club_ids)
+    invalidate_authorizations(user_club_ids)
+    invalidate_my_clubs(user_id for user_id, club_id in user_club_ids)
+    bump_versions('user', (user_id for user_id, club_id in user_club_ids))
+    bump_versions('club', (club_id for user_id, club_id in user_club_ids))
+
+def invalidate_deleted(user_ids, club_ids, user_club_ids):
+    """Invalidate everything cached about deleted users and clubs, and about their (user id, club id) memberships."""
+
+    user_club_ids = list(user_club_ids)
+    invalidate_authorizations(user_club_ids)
+    user_ids = set(user_ids).union(user_id for user_id, club_id in user_club_ids)
+    invalidate_my_clubs(user_ids)
+    bump_versions('user', user_ids)
+    bump_versions('club', set(club_ids).union(club_id for user_id, club_id in user_club_ids))
+
+def get_counter_stats(hits_key, misses_key):
+    """Get the number of hits and misses counted under the given keys and the hit rate.
+
+    The numbers are estimated from the sample of the lookups counted.
+    """
+
+    rate = settings.CACHE_STATS_SAMPLE_RATE
+    hits = round(cache.get(hits_key, 0) / rate) if rate else 0
+    misses = round(cache.get(misses_key, 0) / rate) if rate else 0
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / lookups if lookups else 0.0,
+    }
+
+def get_authorization_cache_stats():
+    """Get the number of hits and misses of the authorization cache and the hit rate."""
+
+    return get_counter_stats(AUTHORIZATION_HITS_KEY, AUTHORIZATION_MISSES_KEY)
+
+def reset_authorization_cache_stats():
+    """Reset the hit and miss counters of the authorization cache."""
+
+    cache.delete_many([AUTHORIZATION_HITS_KEY, AUTHORIZATION_MISSES_KEY])
+
+def get_fragment_cache_stats():
+    """Get the number of hits and misses of the template fragment cache and the hit rate."""
+
+    return get_counter_stats(FRAGMENT_HITS_KEY, FRAGMENT_MISSES_KEY)
+
+def reset_fragment_cache_stats():
+    """Reset the hit and miss counters of the template fragment cache."""
+
+    cache.delete_many([FRAGMENT_HITS_KEY, FRAGMENT_MISSES_KEY])
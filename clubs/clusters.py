@@ -0,0 +1,91 @@
+"""Clusters of the geocoded clubs in the cells of the web map at each zoom level, kept up to date club by club."""
+from clubs.geo import get_map_tile
+from clubs.models import Club_Cluster
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+# Zoom levels the clusters are kept for. Closer in, the clusters of the closest one are shown.
+MAX_CLUSTER_ZOOM = 16
+
+# Cells a side of each map tile, 2 ** 3, making cells of 32 pixels on tiles of 256.
+CELLS_PER_TILE_BITS = 3
+
+def get_cluster_cell(latitude, longitude, zoom):
+    """Return the column and row of the cell a point is clustered in at a zoom level."""
+
+    return get_map_tile(latitude, longitude, zoom + CELLS_PER_TILE_BITS)
+
+def get_cluster_cells(latitude, longitude):
+    """Return the zoom level, column and row of every cluster a point is in."""
+
+    return [(zoom, *get_cluster_cell(latitude, longitude, zoom)) for zoom in range(MAX_CLUSTER_ZOOM + 1)]
+
+def get_cluster_totals(locations):
+    """Return the number of points and the sums of their latitudes and longitudes in each of their clusters."""
+
+    totals = {}
+    for latitude, longitude in locations:
+        for cell in get_cluster_cells(latitude, longitude):
+            total = totals.setdefault(cell, [0, 0.0, 0.0])
+            total[0] += 1
+            total[1] += latitude
+            total[2] += longitude
+    return totals
+
+def add_to_clusters(latitude, longitude, sign=1):
+    """Add a club at the given location to its clusters, or take it away from them with a negative sign."""
+
+    with transaction.atomic():
+        for zoom, x, y in get_cluster_cells(latitude, longitude):
+            clusters = Club_Cluster.objects.filter(zoom=zoom, x=x, y=y)
+            updated = clusters.update(
+                count=F('count') + sign,
+                latitude_sum=F('latitude_sum') + sign * latitude,
+                longitude_sum=F('longitude_sum') + sign * longitude
+            )
+            if sign < 0:
+                clusters.filter(count__lte=0).delete()
+            elif not updated:
+                try:
+                    with transaction.atomic():
+                        Club_Cluster.objects.create(
+                            zoom=zoom, x=x, y=y, count=1, latitude_sum=latitude, longitude_sum=longitude
+                        )
+                except IntegrityError:
+                    # Created by another process in between.
+                    clusters.update(
+                        count=F('count') + 1,
+                        latitude_sum=F('latitude_sum') + latitude,
+                        longitude_sum=F('longitude_sum') + longitude
+                    )
+
+def remove_from_clusters(latitude, longitude):
+    """Take a club at the given location away from its clusters."""
+
+    add_to_clusters(latitude, longitude, sign=-1)
+
+def move_in_clusters(previous_location, location):
+    """Move a club between the clusters of its previous and its new location, either of which may be None."""
+
+    if previous_location == location:
+        return
+    with transaction.atomic():
+        if previous_location is not None:
+            remove_from_clusters(*previous_location)
+        if location is not None:
+            add_to_clusters(*location)
+
+def rebuild_clusters(locations, batch_size=1000):
+    """Replace every cluster by those of the given locations."""
+
+    totals = get_cluster_totals(locations)
+    with transaction.atomic():
+        Club_Cluster.objects.all().delete()
+        Club_Cluster.objects.bulk_create(
+            [
+                Club_Cluster(zoom=zoom, x=x, y=y, count=count, latitude_sum=latitude_sum, longitude_sum=longitude_sum)
+                for (zoom, x, y), (count, latitude_sum, longitude_sum) in totals.items()
+            ],
+            batch_size=batch_size
+        )
+    return len(totals)
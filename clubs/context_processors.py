@@ -0,0 +1,8 @@
+"""Context processors for the clubs app."""
+from clubs.helpers import get_my_clubs_menu
+from django.utils.functional import SimpleLazyObject
+
+def my_clubs(request):
+    """Add the clubs the user is in, for the My Clubs menu, fetched only if a template lists them."""
+
+    return {'my_clubs': SimpleLazyObject(lambda: get_my_clubs_menu(request.user))}
@@ -1,9 +1,9 @@
 """Forms for the clubs app."""
+from clubs.geocoding import schedule_geocoding
 from clubs.models import Club, User
 from django import forms
+from django.conf import settings
 from django.core.validators import RegexValidator
-import requests
-import urllib.parse
 from django.contrib.auth import authenticate
 
 # Used this from clucker project with some modifications
@@ -114,16 +114,9 @@ class CreateClubForm(forms.ModelForm):
         widgets = { 'description': forms.Textarea()}
 
     def save(self):
-        """Create a new club."""
+        """Create a new club, which is geocoded in the background once created."""
 
         super().save(commit=False)
-        # https://stackoverflow.com/questions/25888396/how-to-get-latitude-longitude-with-python
-        full_address = f"{self.cleaned_data.get('address')}, {self.cleaned_data.get('city')}, {self.cleaned_data.get('postal_code')}, {self.cleaned_data.get('country')}"
-        url = 'https://nominatim.openstreetmap.org/search/' + urllib.parse.quote(full_address) +'?format=json'
-
-        response = requests.get(url).json()
-        lat = response[0]['lat']
-        lon = response[0]['lon']
         club = Club.objects.create(
             name=self.cleaned_data.get('name'),
             address=self.cleaned_data.get('address'),
@@ -132,5 +125,53 @@ class CreateClubForm(forms.ModelForm):
             country=self.cleaned_data.get('country'),
             description=self.cleaned_data.get('description'),
         )
+        schedule_geocoding(club)
 
         return club
+
+class NearbyClubsForm(forms.Form):
+    """Form to look for the clubs near a point, the nearest ones or those within a radius."""
+
+    latitude = forms.FloatField(min_value=-90, max_value=90)
+    longitude = forms.FloatField(min_value=-180, max_value=180)
+    radius = forms.FloatField(
+        label='Within (km)',
+        required=False,
+        min_value=0,
+        max_value=settings.NEARBY_CLUBS_MAX_RADIUS
+    )
+    count = forms.IntegerField(
+        label='Number of clubs',
+        required=False,
+        min_value=1,
+        max_value=settings.NEARBY_CLUBS_MAX_COUNT
+    )
+
+    def clean(self):
+        """Clean the data, looking for the default number of clubs, or the most within a radius, unless given."""
+
+        super().clean()
+        if self.cleaned_data.get('count') is None:
+            if self.cleaned_data.get('radius') is None:
+                self.cleaned_data['count'] = settings.NEARBY_CLUBS_DEFAULT_COUNT
+            else:
+                self.cleaned_data['count'] = settings.NEARBY_CLUBS_MAX_COUNT
+        return self.cleaned_data
+
+class ClubClustersForm(forms.Form):
+    """Form to ask for the clusters of clubs in a box of the map at a zoom level."""
+
+    south = forms.FloatField(min_value=-90, max_value=90)
+    west = forms.FloatField(min_value=-180, max_value=180)
+    north = forms.FloatField(min_value=-90, max_value=90)
+    east = forms.FloatField(min_value=-180, max_value=180)
+    zoom = forms.IntegerField(min_value=0, max_value=30)
+
+    def clean(self):
+        """Clean the data and generate messages for any errors."""
+
+        super().clean()
+        south = self.cleaned_data.get('south')
+        north = self.cleaned_data.get('north')
+        if south is not None and north is not None and south > north:
+            self.add_error('north', 'North must not be south of south.')
@@ -0,0 +1,90 @@
+"""Distances on the earth and the grid of cells clubs are indexed by for finding those near a point."""
+from math import asin, cos, floor, log, pi, radians, sin, sqrt, tan
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Distance to the other side of the earth, further than any two points are apart.
+MAX_DISTANCE_KM = EARTH_RADIUS_KM * pi
+
+# Kilometres along a meridian per degree of latitude.
+KM_PER_DEGREE = EARTH_RADIUS_KM * pi / 180
+
+# Side of the cells in degrees. Changing it means storing the grid cell of every club again.
+CELL_DEGREES = 0.1
+GRID_ROWS = round(180 / CELL_DEGREES)
+GRID_COLUMNS = round(360 / CELL_DEGREES)
+
+def get_distance(latitude, longitude, other_latitude, other_longitude):
+    """Return the great-circle distance in kilometres between two points."""
+
+    latitude, longitude = radians(latitude), radians(longitude)
+    other_latitude, other_longitude = radians(other_latitude), radians(other_longitude)
+    a = (
+        sin((other_latitude - latitude) / 2) ** 2
+        + cos(latitude) * cos(other_latitude) * sin((other_longitude - longitude) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+def get_grid_row(latitude):
+    """Return the row of the grid a latitude is in."""
+
+    return min(max(floor((latitude + 90) / CELL_DEGREES), 0), GRID_ROWS - 1)
+
+def get_grid_column(longitude):
+    """Return the column of the grid a longitude is in."""
+
+    return floor((longitude + 180) / CELL_DEGREES) % GRID_COLUMNS
+
+def get_grid_cell(latitude, longitude):
+    """Return the cell of the grid a point is in, numbered row by row so that a row is one range of cells."""
+
+    return get_grid_row(latitude) * GRID_COLUMNS + get_grid_column(longitude)
+
+def get_cell_ranges(latitude, longitude, radius):
+    """Return the ranges of cells, first and last included, covering every point within a radius in kilometres.
+
+    The ranges cover the box around the circle, with the rows of the box each giving a range of columns, split in
+    two where the box crosses the antimeridian. Rows taken whole are merged into one range.
+    """
+
+    latitude_delta = radius / KM_PER_DEGREE
+    first_row = get_grid_row(latitude - latitude_delta)
+    last_row = get_grid_row(latitude + latitude_delta)
+
+    # The box is widest in longitude at its edge furthest from the equator.
+    furthest_latitude = min(abs(latitude) + latitude_delta, 90)
+    width = cos(radians(furthest_latitude)) * KM_PER_DEGREE
+    if furthest_latitude >= 90 or radius / width >= 180:
+        column_ranges = [(0, GRID_COLUMNS - 1)]
+    else:
+        longitude_delta = radius / width
+        first_column = floor((longitude - longitude_delta + 180) / CELL_DEGREES)
+        last_column = floor((longitude + longitude_delta + 180) / CELL_DEGREES)
+        if last_column - first_column + 1 >= GRID_COLUMNS:
+            column_ranges = [(0, GRID_COLUMNS - 1)]
+        elif first_column < 0:
+            column_ranges = [(0, last_column), (first_column % GRID_COLUMNS, GRID_COLUMNS - 1)]
+        elif last_column >= GRID_COLUMNS:
+            column_ranges = [(0, last_column % GRID_COLUMNS), (first_column, GRID_COLUMNS - 1)]
+        else:
+            column_ranges = [(first_column, last_column)]
+
+    if column_ranges == [(0, GRID_COLUMNS - 1)]:
+        return [(first_row * GRID_COLUMNS, last_row * GRID_COLUMNS + GRID_COLUMNS - 1)]
+    return [
+        (row * GRID_COLUMNS + first_column, row * GRID_COLUMNS + last_column)
+        for row in range(first_row, last_row + 1)
+        for first_column, last_column in column_ranges
+    ]
+
+# Furthest latitude the square web map reaches.
+MAX_MAP_LATITUDE = 85.05112878
+
+def get_map_tile(latitude, longitude, zoom):
+    """Return the column and row of the web map tile a point is in at a zoom level, with 2 ** zoom tiles a side."""
+
+    tiles = 2 ** zoom
+    latitude = radians(min(max(latitude, -MAX_MAP_LATITUDE), MAX_MAP_LATITUDE))
+    x = floor((longitude + 180) / 360 * tiles)
+    y = floor((1 - log(tan(latitude) + 1 / cos(latitude)) / pi) / 2 * tiles)
+    return min(max(x, 0), tiles - 1), min(max(y, 0), tiles - 1)
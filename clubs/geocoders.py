@@ -0,0 +1,295 @@
+"""Geocoders finding the location of the address of a club, tried in the order of settings.GEOCODERS."""
+from abc import ABC, abstractmethod
+from clubs.caches import increment_counter
+from clubs.search import normalise_search_text
+from datetime import datetime, timezone
+from django.conf import settings
+from django.core.cache import cache
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from time import monotonic, sleep
+import numpy
+import random
+import requests
+
+GAZETTEER_KEYS_FILE = 'keys.npy'
+GAZETTEER_LOCATIONS_FILE = 'locations.npy'
+
+# Too many requests, and server errors that may pass.
+RETRIED_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# What came of each call to the geocoder, found or not, retried, failed for good, or rejected by the breaker.
+GEOCODER_OUTCOMES = ('success', 'not_found', 'retry', 'failure', 'rejected')
+
+def get_full_address(club):
+    """Return the address of a club in the form the geocoder searches for."""
+
+    return f'{club.address}, {club.city}, {club.postal_code}, {club.country}'
+
+def get_postal_code_key(country, postal_code):
+    """Return the gazetteer key of a postal code, the same however it is spaced and cased."""
+
+    return f"P|{str(country).upper()}|{''.join(postal_code.split()).upper()}"
+
+def get_city_key(country, city):
+    """Return the gazetteer key of a city."""
+
+    return f'C|{str(country).upper()}|{normalise_search_text(city)}'
+
+def get_retry_after(response):
+    """Return the seconds a response asks to be waited for before asking again, or None if it does not say."""
+
+    value = None if response is None else response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    # Otherwise the time to ask again at.
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+@lru_cache(maxsize=8)
+def map_gazetteer(path, modified):
+    """Map the sorted keys and the locations of the gazetteer built at a time into memory."""
+
+    keys = numpy.load(path / GAZETTEER_KEYS_FILE, mmap_mode='r')
+    locations = numpy.load(path / GAZETTEER_LOCATIONS_FILE, mmap_mode='r')
+    return keys, locations
+
+def load_gazetteer(path):
+    """Return the sorted keys and the locations of a gazetteer, or None if it was not built."""
+
+    path = Path(path)
+    try:
+        # The keys are saved last, so a gazetteer built again, even by another process, is mapped again.
+        modified = (path / GAZETTEER_KEYS_FILE).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return map_gazetteer(path, modified)
+
+class Geocoder(ABC):
+    """Base of the geocoders."""
+
+    # Whether what the geocoder finds is kept in the geocode cache, for geocoders slower than reading it.
+    cached = False
+
+    @abstractmethod
+    def geocode(self, club):
+        """Return the latitude and longitude of the address of a club, or None if it is not known."""
+
+class GeocoderUnavailable(Exception):
+    """Raised without asking the geocoder while its circuit breaker is open."""
+
+class GeocoderError(Exception):
+    """Raised when the geocoder answered with something that is not a location."""
+
+class CircuitBreaker:
+    """Circuit breaker of a process, failing calls fast once enough of them in a row have failed.
+
+    It opens after settings.GEOCODER_CIRCUIT_FAILURES failed calls in a row. After
+    settings.GEOCODER_CIRCUIT_RESET_TIMEOUT seconds it lets one call through, which closes it again if it succeeds.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def allow(self):
+        """Return whether a call may be made now."""
+
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if self.trial_running or monotonic() - self.opened_at < settings.GEOCODER_CIRCUIT_RESET_TIMEOUT:
+                return False
+            self.trial_running = True
+            return True
+
+    def record_success(self):
+        """Close the breaker after a call succeeded."""
+
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        """Count a failed call, opening the breaker if there have been too many in a row."""
+
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.opened_at is not None or self.failures >= settings.GEOCODER_CIRCUIT_FAILURES:
+                self.opened_at = monotonic()
+
+    def reset(self):
+        """Close the breaker and forget the failures."""
+
+        self.record_success()
+
+nominatim_circuit_breaker = CircuitBreaker()
+
+class RateLimiter:
+    """Rate limiter spacing out the calls made from every thread of a process.
+
+    There are at most settings.GEOCODER_RATE_LIMIT calls a second.
+    """
+
+    def __init__(self):
+        self.lock = Lock()
+        self.next_call_at = 0.0
+
+    def wait(self):
+        """Wait until the next call may be made."""
+
+        rate = settings.GEOCODER_RATE_LIMIT
+        if not rate:
+            return
+        with self.lock:
+            now = monotonic()
+            call_at = max(now, self.next_call_at)
+            self.next_call_at = call_at + 1 / rate
+        if call_at > now:
+            sleep(call_at - now)
+
+nominatim_rate_limiter = RateLimiter()
+
+def get_geocoder_metric_key(outcome):
+    """Get the key of the counter of an outcome of the calls to the geocoder."""
+
+    return f'geocoder:{outcome}'
+
+def count_geocoder_outcome(outcome):
+    """Count an outcome of a call to the geocoder, in the counters shared by every process."""
+
+    increment_counter(get_geocoder_metric_key(outcome))
+
+def get_geocoder_stats():
+    """Get the number of calls to the geocoder with each outcome."""
+
+    counts = cache.get_many([get_geocoder_metric_key(outcome) for outcome in GEOCODER_OUTCOMES])
+    return {outcome: counts.get(get_geocoder_metric_key(outcome), 0) for outcome in GEOCODER_OUTCOMES}
+
+def reset_geocoder_stats():
+    """Reset the counters of the outcomes of the calls to the geocoder."""
+
+    cache.delete_many([get_geocoder_metric_key(outcome) for outcome in GEOCODER_OUTCOMES])
+
+class NominatimGeocoder(Geocoder):
+    """Geocoder asking a Nominatim server for the full address.
+
+    Requests are spaced out by the rate limiter, and each has a connect and a read timeout. Failures that may pass,
+    such as timeouts, lost connections, throttling and server errors, are retried a bounded number of times after a
+    random delay growing with each attempt, so that workers do not retry in step, or after as long as the server
+    asks. Those failures and rejected requests count towards opening the circuit breaker, and while it is open the
+    server is not asked at all.
+    """
+
+    cached = True
+
+    def request(self, club):
+        """Ask the server for the address of a club once, returning the response."""
+
+        nominatim_rate_limiter.wait()
+        return requests.get(
+            settings.GEOCODER_URL,
+            params={'q': get_full_address(club), 'format': 'json', 'limit': 1},
+            headers={'User-Agent': settings.GEOCODER_USER_AGENT},
+            timeout=(settings.GEOCODER_CONNECT_TIMEOUT, settings.GEOCODER_READ_TIMEOUT)
+        )
+
+    def get_retry_delay(self, attempt, retry_after=None):
+        """Return the seconds to wait before retrying after the given attempt, chosen at random up to a limit.
+
+        It is no less than the seconds the server asked to be waited for, if it did.
+        """
+
+        delay = random.uniform(0, settings.GEOCODER_RETRY_DELAY * 2 ** attempt)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def geocode(self, club):
+        if not nominatim_circuit_breaker.allow():
+            count_geocoder_outcome('rejected')
+            raise GeocoderUnavailable('The geocoder has failed too often, it is not asked for now.')
+
+        attempt = 0
+        while True:
+            try:
+                response = self.request(club)
+                if response.status_code in RETRIED_STATUS_CODES:
+                    response.raise_for_status()
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as error:
+                retry_after = get_retry_after(error.response)
+                waits_too_long = retry_after is not None and retry_after > settings.GEOCODER_MAX_RETRY_AFTER
+                if attempt >= settings.GEOCODER_RETRIES or waits_too_long:
+                    count_geocoder_outcome('failure')
+                    nominatim_circuit_breaker.record_failure()
+                    raise
+                count_geocoder_outcome('retry')
+                sleep(self.get_retry_delay(attempt, retry_after))
+                attempt += 1
+
+        if not response.ok:
+            # Rejected, such as for a banned user agent, which asking again does not change.
+            count_geocoder_outcome('failure')
+            nominatim_circuit_breaker.record_failure()
+            response.raise_for_status()
+
+        try:
+            results = response.json()
+            location = (float(results[0]['lat']), float(results[0]['lon'])) if results else None
+        except (ValueError, LookupError, TypeError) as error:
+            # The server answered, so it is up, but the answer cannot be used.
+            count_geocoder_outcome('failure')
+            nominatim_circuit_breaker.record_success()
+            raise GeocoderError(f'The geocoder answered with something that is not a location: {error}') from error
+
+        count_geocoder_outcome('success' if location else 'not_found')
+        nominatim_circuit_breaker.record_success()
+        return location
+
+class GazetteerGeocoder(Geocoder):
+    """Geocoder looking up the centre of the postal code, or else of the city, in a local gazetteer.
+
+    The gazetteer is built by the build_gazetteer command into settings.GAZETTEER_PATH, as a sorted array of keys
+    and an array of locations in the same order. Both are memory-mapped, so processes share one copy of them and
+    a lookup is a binary search. Without a gazetteer nothing is found.
+    """
+
+    def get_keys(self, club):
+        """Return the gazetteer keys to look the club up by, most precise first."""
+
+        keys = [get_postal_code_key(club.country, club.postal_code)]
+        # The outward code, which gazetteers without full postal codes have.
+        postal_code_parts = club.postal_code.split()
+        if len(postal_code_parts) > 1:
+            keys.append(get_postal_code_key(club.country, postal_code_parts[0]))
+        keys.append(get_city_key(club.country, club.city))
+        return keys
+
+    def geocode(self, club):
+        gazetteer = load_gazetteer(str(settings.GAZETTEER_PATH))
+        if gazetteer is None:
+            return None
+        keys, locations = gazetteer
+        for key in self.get_keys(club):
+            key = key.encode()
+            index = numpy.searchsorted(keys, key)
+            if index < len(keys) and keys[index] == key:
+                latitude, longitude = locations[index]
+                return float(latitude), float(longitude)
+        return None
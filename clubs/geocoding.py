@@ -0,0 +1,229 @@
+"""Geocoding of club addresses in the background, so that creating a club never waits for the geocoder."""
+from clubs.caches import MISSING
+from clubs.clusters import move_in_clusters
+from clubs.geo import get_grid_cell
+from clubs.geocoders import GeocoderError, GeocoderUnavailable
+from clubs.models import Club, Geocoded_Address
+from clubs.search import normalise_search_text
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import timedelta
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from threading import Lock
+import logging
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Errors of the geocoder that leave a club pending, to be geocoded again later.
+GEOCODING_ERRORS = (GeocoderUnavailable, GeocoderError, requests.RequestException)
+
+_executor = None
+_executor_lock = Lock()
+_pending_jobs = set()
+
+class LocationMemoryCache:
+    """Least recently used locations of addresses, kept by each process in front of the database."""
+
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        """Return the location cached for an address key, or MISSING if there is none that is still fresh."""
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return MISSING
+            location, expires_at = entry
+            if expires_at <= timezone.now():
+                del self.entries[key]
+                return MISSING
+            self.entries.move_to_end(key)
+            return location
+
+    def set(self, key, location, expires_at):
+        """Cache the location of an address key until the given time, dropping the least recently used ones."""
+
+        size = settings.GEOCODE_MEMORY_CACHE_SIZE
+        with self.lock:
+            self.entries[key] = (location, expires_at)
+            self.entries.move_to_end(key)
+            while len(self.entries) > size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached location."""
+
+        with self.lock:
+            self.entries.clear()
+
+location_memory_cache = LocationMemoryCache()
+
+def get_address_key(club):
+    """Return the key of the address of a club, the same for addresses differing only in case and spacing."""
+
+    parts = (club.address, club.city, club.postal_code, str(club.country))
+    return '|'.join(normalise_search_text(part) for part in parts)
+
+def get_expiry(location, geocoded_at):
+    """Return when a location found at the given time stops being trusted."""
+
+    timeout = settings.GEOCODE_CACHE_TIMEOUT if location else settings.GEOCODE_NOT_FOUND_CACHE_TIMEOUT
+    return geocoded_at + timedelta(seconds=timeout)
+
+def get_cached_location(key):
+    """Return the location cached for an address key, None if it is known not to exist, or MISSING."""
+
+    location = location_memory_cache.get(key)
+    if location is not MISSING:
+        return location
+
+    geocoded_address = Geocoded_Address.objects.filter(address_key=key).first()
+    if geocoded_address is None:
+        return MISSING
+    location = None
+    if geocoded_address.latitude is not None:
+        location = (geocoded_address.latitude, geocoded_address.longitude)
+    expires_at = get_expiry(location, geocoded_address.geocoded_at)
+    if expires_at <= timezone.now():
+        return MISSING
+    location_memory_cache.set(key, location, expires_at)
+    return location
+
+def cache_location(key, location):
+    """Cache the location the geocoder gave for an address key, None if it did not know it."""
+
+    latitude, longitude = location or (None, None)
+    geocoded_at = timezone.now()
+    # Writing straight away rather than reading first, so that threads caching at once wait for each other.
+    fields = {'latitude': latitude, 'longitude': longitude, 'geocoded_at': geocoded_at}
+    if not Geocoded_Address.objects.filter(address_key=key).update(**fields):
+        try:
+            with transaction.atomic():
+                Geocoded_Address.objects.create(address_key=key, **fields)
+        except IntegrityError:
+            # Cached by another thread in between.
+            Geocoded_Address.objects.filter(address_key=key).update(**fields)
+    location_memory_cache.set(key, location, get_expiry(location, geocoded_at))
+
+def geocode_cached(club, geocoder):
+    """Return the location of the address of a club, only asking the geocoder about addresses not cached."""
+
+    key = get_address_key(club)
+    location = get_cached_location(key)
+    if location is MISSING:
+        location = geocoder.geocode(club)
+        cache_location(key, location)
+    return location
+
+def get_geocoders():
+    """Return the geocoders to try, in order."""
+
+    return [import_string(path)() for path in settings.GEOCODERS]
+
+def geocode(club):
+    """Return the location of the address of a club from the first geocoder that knows it, or None."""
+
+    for geocoder in get_geocoders():
+        location = geocode_cached(club, geocoder) if geocoder.cached else geocoder.geocode(club)
+        if location is not None:
+            return location
+    return None
+
+def geocode_without_cache(club):
+    """Return the location of the address of a club and whether to cache it, asking every geocoder in turn.
+
+    The geocode cache is neither read nor written, so this needs no database.
+    """
+
+    cached = False
+    for geocoder in get_geocoders():
+        location = geocoder.geocode(club)
+        cached = cached or geocoder.cached
+        if location is not None:
+            return location, geocoder.cached
+    return None, cached
+
+def get_location_fields(location):
+    """Return the values of the fields of a club found at the given location, or not found if it is None."""
+
+    if location is None:
+        return {'latitude': None, 'longitude': None, 'grid_cell': None, 'geocode_status': Club.NOT_FOUND}
+    latitude, longitude = location
+    return {
+        'latitude': latitude,
+        'longitude': longitude,
+        'grid_cell': get_grid_cell(latitude, longitude),
+        'geocode_status': Club.GEOCODED,
+    }
+
+def geocode_club(club_id):
+    """Find and store the location of a club, leaving it pending if the geocoder could not be reached."""
+
+    club = Club.objects.filter(id=club_id).only(
+        'address', 'city', 'postal_code', 'country', 'latitude', 'longitude'
+    ).first()
+    if club is None:
+        # Deleted before its turn came.
+        return
+    previous_location = None if club.latitude is None else (club.latitude, club.longitude)
+    try:
+        location = geocode(club)
+    except GEOCODING_ERRORS:
+        logger.exception('Could not geocode club %s', club_id)
+        return
+
+    # Only the location is written, so the club is not saved over any change made in the meantime.
+    with transaction.atomic():
+        updated = Club.objects.filter(id=club_id).update(**get_location_fields(location))
+        # Unless it was deleted while being geocoded, which took it away from its clusters already.
+        if updated:
+            move_in_clusters(previous_location, location)
+
+def run_geocoding_job(club_id):
+    """Geocode a club on a worker thread, closing the database connection of the thread afterwards."""
+
+    try:
+        geocode_club(club_id)
+    except Exception:
+        logger.exception('Geocoding job of club %s failed', club_id)
+    finally:
+        connections.close_all()
+
+def get_executor():
+    """Return the thread pool running the geocoding jobs, starting it on first use."""
+
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.GEOCODING_WORKERS,
+                thread_name_prefix='geocoding'
+            )
+        return _executor
+
+def submit_geocoding(club_id):
+    """Geocode a club now, in the background unless there are no geocoding workers."""
+
+    if not settings.GEOCODING_WORKERS:
+        geocode_club(club_id)
+        return
+    job = get_executor().submit(run_geocoding_job, club_id)
+    _pending_jobs.add(job)
+    job.add_done_callback(_pending_jobs.discard)
+
+def schedule_geocoding(club):
+    """Geocode a club once the transaction saving it commits, as the job cannot see it before."""
+
+    club_id = club.id
+    transaction.on_commit(lambda: submit_geocoding(club_id))
+
+def wait_for_geocoding(timeout=None):
+    """Wait until every geocoding job submitted so far has finished."""
+
+    wait(list(_pending_jobs), timeout=timeout)
@@ -1,2 +1,3 @@
 from .club_helpers import *
-from .user_helpers import *
+from .pagination_helpers import *
+from .user_helpers import *
\ No newline at end of file
@@ -1,7 +1,14 @@
 "Helper methods for club-related purposes."
+from clubs.helpers.pagination_helpers import get_keyset_page, get_ordering_values
 from clubs.helpers.user_helpers import *
-from clubs.models import Club, Club_Member
+from clubs.caches import MISSING, cache_my_clubs, get_cached_my_clubs
+from clubs.clusters import CELLS_PER_TILE_BITS, MAX_CLUSTER_ZOOM, get_cluster_cell
+from clubs.geo import MAX_DISTANCE_KM, get_cell_ranges, get_distance
+from clubs.models import Club, Club_Cluster, Club_Member, Club_Word
+from clubs.search import get_search_filter, get_word_range_filter, matches_search, normalise_search_text
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Case, CharField, Q, Value, When
 
 def get_club(club_id):
     """Get the club from the given club id."""
@@ -12,6 +19,16 @@ def get_club(club_id):
         return None
     return club
 
+def get_club_member(user, club_id):
+    """Get the membership of the given user in the given club, with the club fetched alongside it."""
+
+    if user is None or user.is_anonymous:
+        return None
+    return (Club_Member.objects
+        .select_related('club')
+        .filter(user=user, club_id=club_id)
+        .first())
+
 def get_all_clubs():
     """Get all the existing clubs."""
 
@@ -27,6 +44,22 @@ def get_my_clubs(user):
         return None
     return my_clubs
 
+def get_my_clubs_menu(user):
+    """Get the id and name of each club the given user is in, for the My Clubs menu, cached per user."""
+
+    if user is None or user.is_anonymous:
+        return []
+
+    my_clubs = get_cached_my_clubs(user.id)
+    if my_clubs is MISSING:
+        # In club id order, read from the (user, club, authorization) index rather than sorted.
+        my_clubs = list(Club.objects
+            .filter(club_member__user=user)
+            .order_by('club_member__club')
+            .values('id', 'name'))
+        cache_my_clubs(user.id, my_clubs)
+    return my_clubs
+
 def get_other_clubs(user):
     """Get all other clubs the user is not in."""
 
@@ -37,14 +70,147 @@ def get_other_clubs(user):
         return None
     return other_clubs
 
-def get_club_to_auth(user, my_clubs):
-    """Get the user authorization for eacn club the given user is in."""
+def search_clubs(clubs, search):
+    """Get the given clubs with a word of their name starting with the search, or all of them if the search is empty."""
+
+    search = normalise_search_text(search)
+    if not search:
+        return clubs
+    # The clubs with a word in the range of the search, from the index of the words, then those matching in full.
+    club_ids = Club_Word.objects.filter(get_word_range_filter(search)).values('club')
+    return clubs.filter(id__in=club_ids).filter(get_search_filter(search))
+
+# The orderings clubs can be sorted by, each walking an index.
+CLUBS_SORT_ORDERINGS = {
+    'name': ('search_name', 'id'),
+    'city': ('city', 'id'),
+    # By the ISO code of the country, not its name.
+    'country': ('country', 'id'),
+}
+
+def get_clubs_ordering(sort, search=''):
+    """Get the ordering of a list of clubs, by name when searching and by creation otherwise unless sorted."""
+
+    if sort in CLUBS_SORT_ORDERINGS:
+        return CLUBS_SORT_ORDERINGS[sort]
+    return CLUBS_SORT_ORDERINGS['name'] if normalise_search_text(search) else ('id',)
+
+def get_other_clubs_page(user, cursor=None, page_size=None, search='', sort=''):
+    """Get a page of the other clubs the user is not in, and the cursor of the next page if there is one.
+
+    When searching, only the clubs with a word of their name starting with the search are listed.
+    """
+
+    return get_keyset_page(
+        search_clubs(get_other_clubs(user), search),
+        ordering=get_clubs_ordering(sort, search),
+        cursor=cursor,
+        page_size=page_size or settings.CLUBS_PAGE_SIZE
+    )
+
+def get_club_distances_within(latitude, longitude, radius):
+    """Get the distance in kilometres and the id of each club within a radius of a point, nearest first.
+
+    Only the cells of the grid around the point are read, from the index that has the location of each club.
+    """
+
+    cells = Q()
+    for first_cell, last_cell in get_cell_ranges(latitude, longitude, radius):
+        cells |= Q(grid_cell__range=(first_cell, last_cell))
+    distances = []
+    for club_id, club_latitude, club_longitude in Club.objects.filter(cells).values_list('id', 'latitude', 'longitude'):
+        distance = get_distance(latitude, longitude, club_latitude, club_longitude)
+        if distance <= radius:
+            distances.append((distance, club_id))
+    distances.sort()
+    return distances
+
+def get_nearby_clubs(latitude, longitude, count=None, radius=None):
+    """Get the clubs nearest to a point, at most the given number of them and within the given radius.
+
+    Each club has its distance from the point in kilometres. There are never more than
+    settings.NEARBY_CLUBS_MAX_COUNT clubs, however large the radius. The nearest clubs are looked for within a
+    radius growing until there are enough of them, so only the clubs around the point are read.
+    """
+
+    count = min(count or settings.NEARBY_CLUBS_MAX_COUNT, settings.NEARBY_CLUBS_MAX_COUNT)
+    search_radius = settings.NEARBY_CLUBS_SEARCH_RADIUS
+    while True:
+        if radius is not None and search_radius >= radius:
+            search_radius = radius
+        distances = get_club_distances_within(latitude, longitude, search_radius)
+        # Every club within the search radius is found, so once there are enough the nearest ones are exact.
+        if len(distances) >= count or search_radius == radius or search_radius >= MAX_DISTANCE_KM:
+            break
+        search_radius *= 4
+    distances = distances[:count]
+
+    clubs = Club.objects.in_bulk([club_id for distance, club_id in distances])
+    nearby_clubs = []
+    for distance, club_id in distances:
+        club = clubs[club_id]
+        club.distance = distance
+        nearby_clubs.append(club)
+    return nearby_clubs
+
+def get_club_clusters(south, west, north, east, zoom):
+    """Get the zoom level the clusters of clubs in a box are shown at, and the clusters.
+
+    The zoom level is lowered until the box has at most settings.CLUSTERS_MAX_CELLS cells, so that however many
+    clubs there are, and however large the box, there are never more clusters than that. A box whose west edge is
+    east of its east edge crosses the antimeridian.
+    """
+
+    zoom = min(zoom, MAX_CLUSTER_ZOOM)
+    while True:
+        west_x, north_y = get_cluster_cell(north, west, zoom)
+        east_x, south_y = get_cluster_cell(south, east, zoom)
+        columns = 2 ** (zoom + CELLS_PER_TILE_BITS)
+        crosses_antimeridian = west > east
+        width = (columns - west_x + east_x + 1) if crosses_antimeridian else (east_x - west_x + 1)
+        if zoom == 0 or width * (south_y - north_y + 1) <= settings.CLUSTERS_MAX_CELLS:
+            break
+        zoom -= 1
+
+    if crosses_antimeridian:
+        columns_filter = Q(x__gte=west_x) | Q(x__lte=east_x)
+    else:
+        columns_filter = Q(x__range=(west_x, east_x))
+    clusters = (Club_Cluster.objects
+        .filter(columns_filter, zoom=zoom, y__range=(north_y, south_y))
+        .order_by('y', 'x'))
+    return zoom, list(clusters)
+
+def get_my_clubs_with_authorization_text(user):
+    """Get all the clubs the given user is in, each annotated with the full text of the user's authorization."""
+
+    return (Club.objects
+        .filter(club_member__user=user)
+        .annotate(authorization_text=Case(
+            *[When(club_member__authorization=authorization, then=Value(authorization_text))
+                for authorization, authorization_text in Club_Member.AUTHORIZATION_CHOICES],
+            output_field=CharField()
+        )))
+
+def get_club_to_auth(user):
+    """Get each club the given user is in paired with the user's authorization in it, from a single query."""
+
+    return [(club, club.authorization_text) for club in get_my_clubs_with_authorization_text(user)]
+
+def search_club_to_auth(club_auth, search):
+    """Get the clubs paired with an authorization with a word of their name starting with the search.
+
+    A user is in few clubs, and all of them are listed in the navigation bar anyway, so they are searched in memory.
+    """
+
+    search = normalise_search_text(search)
+    return [(club, auth) for club, auth in club_auth if matches_search(club.search_name, search)]
+
+def sort_club_to_auth(club_auth, sort):
+    """Sort the clubs paired with an authorization in the same order as a page of clubs, in memory like the search."""
 
-    auth_list = []
-    for club in my_clubs:
-        auth_list.append(get_authorization_text(user, club))
-    club_auth = list(zip(list(my_clubs), auth_list))
-    return club_auth
+    ordering = get_clubs_ordering(sort)
+    return sorted(club_auth, key=lambda pair: get_ordering_values(pair[0], ordering))
 
 def is_user_in_club(user, club):
     """Check if the given user is in the given club."""
@@ -77,7 +243,7 @@ def remove_clubs(user, clubs):
             continue
         # In club table, delete where only applicants in club and (the 1 owner(the request user) is only deleted)
         if is_owner(user, club):
-            count_applicants_in_club = get_count_of_specific_user_in_club(club, 'AP')
+            count_applicants_in_club = get_count_of_specific_user_in_club(club, Club_Member.APPLICANT)
             if count_applicants_in_club + 1 == count_all_users_in_club:
                 club.delete()
             else:
@@ -0,0 +1,107 @@
+"Helper methods for pagination-related purposes."
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+import json
+
+def encode_cursor(values):
+    """Encode the ordering values of the last item of a page into a URL-safe cursor."""
+
+    return urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+def decode_cursor(cursor, length):
+    """Decode a cursor into the ordering values it holds, or None if it is not a valid cursor."""
+
+    if not cursor:
+        return None
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (DecodeError, UnicodeError, ValueError):
+        return None
+    if not isinstance(values, list) or len(values) != length:
+        return None
+    return values
+
+def get_ordering_field(queryset, name):
+    """Get the field of the queryset's model, or of its annotation, with the given name."""
+
+    if name in queryset.query.annotations:
+        return queryset.query.annotations[name].output_field
+    return queryset.model._meta.get_field(name)
+
+def clean_cursor_values(queryset, ordering, values):
+    """Convert the values of a cursor to the types of the fields of the ordering, or None if any is not valid."""
+
+    cleaned_values = []
+    for field, value in zip(ordering, values):
+        try:
+            value = get_ordering_field(queryset, field.lstrip('-')).to_python(value)
+        except ValidationError:
+            return None
+        if value is None:
+            return None
+        cleaned_values.append(value)
+    return cleaned_values
+
+def get_keyset_filter(ordering, values):
+    """Get the filter for the items that come after the given ordering values in the given ordering."""
+
+    keyset_filter = Q()
+    equal_filter = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        keyset_filter |= equal_filter & Q(**{f'{name}__{lookup}': value})
+        equal_filter &= Q(**{name: value})
+    return keyset_filter
+
+def get_ordering_values(item, ordering):
+    """Get the values of the given item for each field of the ordering."""
+
+    values = []
+    for field in ordering:
+        value = getattr(item, field.lstrip('-'))
+        if not isinstance(value, (int, float, str, type(None))):
+            value = str(value)
+        values.append(value)
+    return values
+
+def get_keyset_page(queryset, ordering, cursor, page_size):
+    """Get the page of items that comes after the cursor, and the cursor of the next page if there is one.
+
+    The ordering must be a total order, ending on a unique field, and the queryset must allow a
+    range lookup on each of its fields or annotations.
+    """
+
+    values = decode_cursor(cursor, len(ordering))
+    if values is not None:
+        # A cursor may have been changed by hand, so it is only used if its values fit the ordering.
+        values = clean_cursor_values(queryset, ordering, values)
+    if values is not None:
+        queryset = queryset.filter(get_keyset_filter(ordering, values))
+
+    items = list(queryset.order_by(*ordering)[:page_size + 1])
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    return items, encode_cursor(get_ordering_values(items[-1], ordering))
+
+def get_page_url(request, cursor=None, path=None):
+    """Get the URL of the current page, or of the given path, with the given cursor, keeping the other query parameters."""
+
+    query = request.GET.copy()
+    query.pop('cursor', None)
+    if cursor:
+        query['cursor'] = cursor
+    path = path or request.path
+    return f'{path}?{query.urlencode()}' if query else path
+
+def add_page_urls(context, request, cursor, next_cursor):
+    """Add the URLs of the first and next pages to the context, when there is such a page to go to."""
+
+    if cursor:
+        context['first_page_url'] = get_page_url(request)
+    if next_cursor:
+        context['next_page_url'] = get_page_url(request, next_cursor)
@@ -1,6 +1,11 @@
 "Helper methods for user-related purposes."
+from clubs.caches import MISSING, cache_authorization, get_cached_authorization
+from clubs.helpers.pagination_helpers import get_keyset_page
 from clubs.models import User, Club_Member
+from clubs.search import get_search_filter, normalise_search_text
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
 from django.contrib import messages
 
 def get_user(user_id):
@@ -15,57 +20,168 @@ def get_user(user_id):
 def get_users(search_club, search_authorization):
     """Get all the users from the given club with the given authorization."""
 
-    authorizationFilter = (Club_Member.objects
-        .filter(club=search_club)
-        .filter(authorization=search_authorization)
-        .values_list('user__id', flat=True))
-    return User.objects.filter(id__in=authorizationFilter)
+    return User.objects.filter(
+        club_member__club=search_club,
+        club_member__authorization=search_authorization
+    )
+
+def get_users_with_authorization(search_club, minimum_authorization):
+    """Get all the users from the given club with at least the given authorization."""
+
+    return User.objects.filter(
+        club_member__club=search_club,
+        club_member__authorization__gte=minimum_authorization
+    )
+
+# The orderings users can be sorted by, each read in order from an index of the memberships of the club, highest
+# authorization first as the users are listed by authorization. Names and experience are those copied onto the
+# memberships.
+USERS_SORT_ORDERINGS = {
+    # Newest users first, walking the (club, authorization, user) index backwards.
+    'role': ('-authorization', '-member_id'),
+    'name': ('-authorization', 'member_search_name', 'member_id'),
+    # Most experienced users first, walking the (club, authorization, experience, user) index backwards.
+    'experience': ('-authorization', '-member_experience_level', '-member_id'),
+}
+
+# The fields needed to list users, and to take a cursor from any of their orderings.
+LISTED_USER_FIELDS = (
+    'id', 'first_name', 'last_name', 'email', 'gravatar_hash', 'search_name', 'chess_experience_level'
+)
+
+def get_users_sort(sort, search=''):
+    """Get the sort of a list of users, by name when searching and by role otherwise unless another is asked for."""
+
+    if sort in USERS_SORT_ORDERINGS:
+        return sort
+    return 'name' if normalise_search_text(search) else 'role'
+
+def get_listed_users(users):
+    """Annotate users filtered by club with their authorization, fetching only the fields needed to list them."""
+
+    return (users
+        .annotate(
+            authorization=F('club_member__authorization'),
+            member_id=F('club_member__user'),
+            member_search_name=F('club_member__search_name'),
+            member_experience_level=F('club_member__chess_experience_level')
+        )
+        .only(*LISTED_USER_FIELDS))
+
+def group_by_authorization(users, minimum_authorization=Club_Member.APPLICANT):
+    """Group users annotated with their authorization by authorization."""
+
+    roster = {
+        authorization: []
+        for authorization, authorization_text in Club_Member.AUTHORIZATION_CHOICES
+        if authorization >= minimum_authorization
+    }
+    for user in users:
+        roster[user.authorization].append(user)
+    return roster
+
+def get_users_page(club, minimum_authorization, maximum_authorization=Club_Member.OWNER,
+        cursor=None, page_size=None, search='', sort=''):
+    """Get a page of the users of the given club within the given authorizations, and the cursor of the next page.
+
+    When searching, only the users with a word of their full name starting with the search are listed. The users
+    are found from the memberships of the club, so a page of a small club reads none of the other users.
+    """
+
+    search = normalise_search_text(search)
+    sort = get_users_sort(sort, search)
+    users = get_listed_users(User.objects.filter(
+        club_member__club=club,
+        club_member__authorization__gte=minimum_authorization,
+        club_member__authorization__lte=maximum_authorization
+    ))
+    if search:
+        users = users.filter(get_search_filter(search))
+
+    return get_keyset_page(
+        users,
+        ordering=USERS_SORT_ORDERINGS[sort],
+        cursor=cursor,
+        page_size=page_size or settings.USERS_PAGE_SIZE
+    )
+
+def get_roster_page(club, minimum_authorization=Club_Member.APPLICANT, cursor=None, page_size=None,
+        search='', sort=''):
+    """Get a page of the roster of the given club, and the cursor of the next page if there is one."""
+
+    users, next_cursor = get_users_page(
+        club,
+        minimum_authorization,
+        cursor=cursor,
+        page_size=page_size,
+        search=search,
+        sort=sort
+    )
+    return group_by_authorization(users, minimum_authorization), next_cursor
+
+def is_authorization_at_least(authorization, minimum_authorization):
+    """Check if an authorization, which may be missing, is at least the given authorization."""
+
+    return bool(authorization) and authorization >= minimum_authorization
 
 def get_applicants(club):
     """Get all the applicants from the given club."""
 
-    return get_users(club, 'AP')
+    return get_users(club, Club_Member.APPLICANT)
+
+def get_applicants_page(club, cursor=None, page_size=None, search='', sort=''):
+    """Get a page of the applicants from the given club, and the cursor of the next page if there is one."""
+
+    return get_users_page(
+        club,
+        Club_Member.APPLICANT,
+        Club_Member.APPLICANT,
+        cursor=cursor,
+        page_size=page_size,
+        search=search,
+        sort=sort
+    )
 
 def is_applicant(user, club):
     """Check if a user is an applicant in the given club."""
 
-    if get_authorization(user, club) == 'AP':
+    if get_authorization(user, club) == Club_Member.APPLICANT:
         return True
     return False
 
 def get_members(club):
     """Get all the members from the given club."""
 
-    return get_users(club, 'ME')
+    return get_users(club, Club_Member.MEMBER)
 
 def is_member(user, club):
     """Check if a user is a member in the given club."""
 
-    if get_authorization(user, club) == 'ME':
+    if get_authorization(user, club) == Club_Member.MEMBER:
         return True
     return False
 
 def get_officers(club):
     """Get all the officers from the given club."""
 
-    return get_users(club, 'OF')
+    return get_users(club, Club_Member.OFFICER)
 
 def is_officer(user, club):
     """Check if a user is an officer in the given club."""
 
-    if get_authorization(user, club) == 'OF':
+    if get_authorization(user, club) == Club_Member.OFFICER:
         return True
     return False
 
 def get_owners(club):
     """Get all the owners from the given club."""
 
-    return get_users(club, 'OW')
+    return get_users(club, Club_Member.OWNER)
 
 def is_owner(user, club):
     """Check if a user is an owner in the given club."""
 
-    if get_authorization(user, club) == 'OW':
+    if get_authorization(user, club) == Club_Member.OWNER:
         return True
     return False
 
@@ -74,21 +190,27 @@ def get_authorization(user, club):
 
     if user is None or user.is_anonymous:
         return ""
+    if club is None:
+        return None
+
+    authorization = get_cached_authorization(user.id, club.id)
+    if authorization is not MISSING:
+        return authorization
+
     try:
         authorization = Club_Member.objects.filter(club=club).get(user=user).authorization
     except ObjectDoesNotExist:
-        return None
+        authorization = None
+    cache_authorization(user.id, club.id, authorization)
     return authorization
 
 def get_authorization_text(user, club):
     """Get the full text of the authorization of the given user in the given club."""
 
-    try:
-        authorization_text = (Club_Member.objects.filter(club=club).get(user=user)
-                             .get_authorization_display())
-    except ObjectDoesNotExist:
+    authorization = get_authorization(user, club)
+    if not authorization:
         return None
-    return authorization_text
+    return dict(Club_Member.AUTHORIZATION_CHOICES)[authorization]
 
 def set_authorization(user, club, authorization):
     """Set the authorization of the given user in the given club."""
@@ -0,0 +1,221 @@
+"""The URL benchmark."""
+from clubs.clusters import rebuild_clusters
+from clubs.geo import get_grid_cell
+from clubs.models import Club, Club_Member, User
+from clubs.snapshots import generate_snapshot, restore_snapshot
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import get_resolver, reverse
+from time import perf_counter
+import json
+import numpy
+
+# A cache of the process alone, so that what the benchmark caches never reaches the shared cache.
+BENCH_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'bench',
+    }
+}
+
+# Box the benchmark clubs are placed in at random, around Great Britain.
+CLUB_LATITUDES = (50.0, 58.5)
+CLUB_LONGITUDES = (-6.0, 1.8)
+NEARBY_QUERY = 'latitude=51.5&longitude=-0.12'
+CLUSTERS_QUERY = 'south=49&west=-8&north=59&east=2&zoom=5'
+
+# Every named URL with the user requesting it, the club or users its arguments are the ids of, its query string,
+# whether it changes data, the status it answers with, and the most queries it may make however large the dataset
+# is. Those changing data redirect once they have, rather than showing a page. Users are named by their
+# part in the benchmark club, None being logged out. Logged in requests make two queries loading the session and the
+# user, and the nearby clubs are searched for again further out while too few are found, up to the largest radius.
+BENCHMARKS = [
+    ('home', None, {}, '', False, 200, 0),
+    ('sign_up', None, {}, '', False, 200, 0),
+    ('log_in', None, {}, '', False, 200, 0),
+    ('log_out', 'member', {}, '', True, 302, 4),
+    ('update_user', 'member', {}, '', False, 200, 3),
+    ('change_password', 'member', {}, '', False, 200, 2),
+    ('approve_applicant', 'officer', {'club_id': 'club', 'applicant_id': 'applicant'}, '', True, 302, 7),
+    ('reject_applicant', 'officer', {'club_id': 'club', 'applicant_id': 'applicant'}, '', True, 302, 7),
+    ('promote_member', 'owner', {'club_id': 'club', 'member_id': 'member'}, '', True, 302, 7),
+    ('demote_officer', 'owner', {'club_id': 'club', 'member_id': 'officer'}, '', True, 302, 7),
+    ('remove_user', 'owner', {'club_id': 'club', 'user_id': 'member'}, '', True, 302, 7),
+    ('transfer_ownership', 'owner', {'club_id': 'club', 'member_id': 'officer'}, '', True, 302, 9),
+    ('leave_club', 'member', {'club_id': 'club', 'member_id': 'member'}, '', True, 302, 5),
+    ('apply_club', 'outsider', {'club_id': 'club'}, '', True, 302, 5),
+    ('delete_account', 'member', {}, '', True, 302, 11),
+    ('members_list', 'member', {'club_id': 'club'}, '', False, 200, 5),
+    ('applicants_list', 'officer', {'club_id': 'club'}, '', False, 200, 5),
+    ('dashboard', 'member', {}, '', False, 200, 4),
+    ('other_clubs', 'member', {}, '', False, 200, 3),
+    ('nearby_clubs', 'member', {}, NEARBY_QUERY, False, 200, 10),
+    ('nearby_clubs_search', 'member', {}, NEARBY_QUERY, False, 200, 10),
+    ('club_clusters', 'member', {}, CLUSTERS_QUERY, False, 200, 3),
+    ('create_club', 'member', {}, '', False, 200, 2),
+    ('waiting_list', 'applicant', {'club_id': 'club'}, '', False, 200, 4),
+    ('show_club', 'outsider', {'club_id': 'club'}, '', False, 200, 6),
+    ('show_member', 'officer', {'club_id': 'club', 'member_id': 'member'}, '', False, 200, 8),
+    ('show_applicant', 'officer', {'club_id': 'club', 'applicant_id': 'applicant'}, '', False, 200, 8),
+]
+
+class Command(BaseCommand):
+    """The URL benchmark."""
+
+    help = (
+        'Seed a dataset, request every named URL through the test client and report the median and 95th '
+        'percentile latency and the queries of each, failing if any answers with another status than expected '
+        'or makes more queries than its budget. '
+        'The dataset is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clubs', type=int, default=200, help='Number of clubs.')
+        parser.add_argument('--users', type=int, default=5000, help='Number of random users.')
+        parser.add_argument(
+            '--memberships-per-club', type=int, default=200, help='Number of random users in each club besides its owner.'
+        )
+        parser.add_argument('--repeat', type=int, default=20, help='Number of timed requests to each URL.')
+        parser.add_argument('--output', default='bench.json', help='File the results are written to as JSON.')
+
+    def seed(self, options):
+        """Restore a dataset of the given size and place its clubs, returning the club benchmarked and its users."""
+
+        columns = generate_snapshot(options['users'], options['clubs'], options['memberships_per_club'])
+        try:
+            restore_snapshot(columns)
+        except IntegrityError:
+            raise CommandError('The database already has the seeded users, unseed it first.')
+
+        clubs = list(Club.objects.only('id'))
+        random = numpy.random.default_rng(0)
+        latitudes = random.uniform(*CLUB_LATITUDES, size=len(clubs)).tolist()
+        longitudes = random.uniform(*CLUB_LONGITUDES, size=len(clubs)).tolist()
+        for club, latitude, longitude in zip(clubs, latitudes, longitudes):
+            club.latitude, club.longitude = latitude, longitude
+            club.grid_cell = get_grid_cell(latitude, longitude)
+            club.geocode_status = Club.GEOCODED
+        Club.objects.bulk_update(clubs, ['latitude', 'longitude', 'grid_cell', 'geocode_status'], batch_size=1000)
+        rebuild_clusters(zip(latitudes, longitudes))
+
+        # The first club of the snapshot, joined by a user of each authorization made for the benchmark.
+        club = Club.objects.get(name='Kerbal Chess Club')
+        parts = {'club': club, 'owner': Club_Member.objects.get(club=club, authorization=Club_Member.OWNER).user}
+        for part in ['officer', 'member', 'applicant', 'outsider']:
+            parts[part] = User.objects.create(first_name='Bench', last_name=part.title(), email=f'{part}@bench.example.org')
+        for part, authorization in [
+            ('officer', Club_Member.OFFICER), ('member', Club_Member.MEMBER), ('applicant', Club_Member.APPLICANT)
+        ]:
+            Club_Member.objects.create(user=parts[part], club=club, authorization=authorization)
+        return parts
+
+    def get_url(self, name, arguments, query, parts):
+        """Return the URL of a benchmark, with the ids of the club and users it is about."""
+
+        url = reverse(name, kwargs={argument: parts[part].id for argument, part in arguments.items()})
+        return f'{url}?{query}' if query else url
+
+    def get_client(self, user):
+        """Return a test client logged in as the given user, or logged out for None."""
+
+        client = Client()
+        if user is not None:
+            client.force_login(user)
+        return client
+
+    def request(self, client, url, user, changes):
+        """Request a URL with a client, returning the response, the seconds it took and the queries it made.
+
+        Whatever a request changing data changes is rolled back, the cache and the login included.
+        """
+
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                start = perf_counter()
+                response = client.get(url)
+                seconds = perf_counter() - start
+            transaction.set_rollback(True)
+        if changes:
+            cache.clear()
+            if user is not None:
+                client.force_login(user)
+        return response, seconds, len(queries)
+
+    def check_benchmarks(self):
+        """Raise CommandError if a named URL has no benchmark."""
+
+        names = {pattern.name for pattern in get_resolver().url_patterns if getattr(pattern, 'name', None)}
+        missing = names - {name for name, *_ in BENCHMARKS}
+        if missing:
+            raise CommandError(f"There is no benchmark of {', '.join(sorted(missing))}.")
+
+    def get_unexpected_statuses(self, results):
+        """Return the names of the URLs that answered with another status than expected."""
+
+        return [name for name, result in results.items() if result['status'] != result['expected_status']]
+
+    def get_over_budget(self, results):
+        """Return the names of the URLs that made more queries than their budget."""
+
+        return [name for name, result in results.items() if result['queries'] > result['query_budget']]
+
+    def handle(self, *args, **options):
+        self.check_benchmarks()
+        results = {}
+        with override_settings(CACHES=BENCH_CACHES, ALLOWED_HOSTS=['testserver']), transaction.atomic():
+            parts = self.seed(options)
+            for name, user, arguments, query, changes, expected_status, query_budget in BENCHMARKS:
+                url = self.get_url(name, arguments, query, parts)
+                user = parts.get(user)
+                # Clients are made for each URL, as a client loads the middleware on its first request, which is
+                # not timed, and fills the caches, but the queries of every request are budgeted.
+                client = self.get_client(user)
+                response, _, queries = self.request(client, url, user, changes)
+                statuses = [response.status_code]
+                timings = []
+                for _ in range(options['repeat']):
+                    response, seconds, repeat_queries = self.request(client, url, user, changes)
+                    statuses.append(response.status_code)
+                    timings.append(seconds * 1000)
+                    queries = max(queries, repeat_queries)
+                # The first status of any request answered otherwise, as the status of every request is checked.
+                status = next((status for status in statuses if status != expected_status), expected_status)
+                results[name] = {
+                    'url': url,
+                    'status': status,
+                    'expected_status': expected_status,
+                    'p50_ms': round(float(numpy.percentile(timings, 50)), 3) if timings else None,
+                    'p95_ms': round(float(numpy.percentile(timings, 95)), 3) if timings else None,
+                    'queries': queries,
+                    'query_budget': query_budget,
+                }
+                self.stdout.write(
+                    f"{name}: {status}, {results[name]['p50_ms']} ms p50, "
+                    f"{results[name]['p95_ms']} ms p95, {queries} queries of {query_budget}"
+                )
+            transaction.set_rollback(True)
+            cache.clear()
+
+        with open(options['output'], 'w') as file:
+            json.dump({
+                'dataset': {
+                    'clubs': options['clubs'],
+                    'users': options['users'],
+                    'memberships_per_club': options['memberships_per_club'],
+                },
+                'repeat': options['repeat'],
+                'results': results,
+            }, file, indent=2)
+
+        unexpected_statuses = self.get_unexpected_statuses(results)
+        if unexpected_statuses:
+            raise CommandError(f"Unexpected status: {', '.join(unexpected_statuses)}.")
+        over_budget = self.get_over_budget(results)
+        if over_budget:
+            raise CommandError(f"Over the query budget: {', '.join(over_budget)}.")
+        self.stdout.write(self.style.SUCCESS(
+            f"Every URL answered as expected within its query budget, results written to {options['output']}"
+        ))
@@ -0,0 +1,95 @@
+"""The user table benchmark."""
+from clubs.caches import NO_CACHES
+from clubs.helpers import get_users_page
+from clubs.models import Club, Club_Member, User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.template.loader import get_template
+from django.test.utils import override_settings
+from time import perf_counter
+
+EMAIL_DOMAIN = 'user-table.benchmark'
+
+class Command(BaseCommand):
+    """The user table benchmark."""
+
+    help = (
+        'Time the rendering of a user table of a large club, with the stored gravatar hashes and with each email '
+        'hashed as it is rendered, and report the cost of each row both ways.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Number of members in the table.')
+        parser.add_argument('--repeat', type=int, default=3, help='Number of renders to keep the fastest of.')
+
+    def create_members(self, club, rows):
+        """Create the given number of members of the club, with their fields set as on save."""
+
+        users = []
+        for i in range(rows):
+            user = User(
+                first_name=f'First{i}',
+                last_name=f'Last{i}',
+                email=f'member{i}@{EMAIL_DOMAIN}',
+                password='!'
+            )
+            user.search_name = user.get_search_name()
+            user.chess_experience_level = user.get_chess_experience_level()
+            user.gravatar_hash = user.get_gravatar_hash()
+            users.append(user)
+        User.objects.bulk_create(users, batch_size=1000)
+
+        user_ids = User.objects.filter(email__endswith=f'@{EMAIL_DOMAIN}').values_list('id', flat=True)
+        Club_Member.objects.bulk_create(
+            [Club_Member(user_id=user_id, club=club, authorization=Club_Member.MEMBER) for user_id in user_ids],
+            batch_size=1000
+        )
+
+    def time_render(self, template, context, repeat):
+        """Return the fastest of the given number of renders of the template."""
+
+        timings = []
+        for _ in range(repeat):
+            start = perf_counter()
+            template.render(context)
+            timings.append(perf_counter() - start)
+        return min(timings)
+
+    def write_timing(self, rows, timing, description):
+        """Report the time a render took, in all and for each row."""
+
+        self.stdout.write(
+            f'Rendered {rows} rows {description} in {timing * 1000:.1f} ms, '
+            f'{timing / max(rows, 1) * 1000000:.1f} µs per row'
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        template = get_template('partials/user_partials/user_table.html')
+
+        # The table would be rendered from the fragment cache after the first time, and the benchmark club and
+        # its members are rolled back once timed.
+        with override_settings(CACHES=NO_CACHES), transaction.atomic():
+            club = Club.objects.create(name='User table benchmark', description='Benchmark')
+            self.create_members(club, rows)
+            users, next_cursor = get_users_page(club, Club_Member.MEMBER, page_size=rows)
+            context = {
+                'redirect_url': 'show_member',
+                'club_id': club.id,
+                'table_title': 'Members',
+                'user_list': users,
+                'size': 'col-12',
+            }
+
+            stored_timing = self.time_render(template, context, options['repeat'])
+            # Without a stored hash, gravatar() hashes the email on every call, as every row did before.
+            for user in users:
+                user.gravatar_hash = ''
+            hashing_timing = self.time_render(template, context, options['repeat'])
+            transaction.set_rollback(True)
+
+        self.write_timing(len(users), hashing_timing, 'hashing each email')
+        self.write_timing(len(users), stored_timing, 'with the stored gravatar hashes')
+        self.stdout.write(
+            f'The stored hashes save {(hashing_timing - stored_timing) / max(len(users), 1) * 1000000:.1f} µs per row'
+        )
@@ -0,0 +1,65 @@
+"""The gazetteer builder."""
+from clubs.geocoders import GAZETTEER_KEYS_FILE, GAZETTEER_LOCATIONS_FILE, get_city_key, get_postal_code_key
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from pathlib import Path
+import csv
+import numpy
+import os
+
+class Command(BaseCommand):
+    """The gazetteer builder."""
+
+    help = (
+        'Build the local gazetteer of the centres of postal codes and cities from a GeoNames postal code file, '
+        'such as GB_full.txt from https://download.geonames.org/export/zip/.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('source', help='GeoNames postal code file, tab separated.')
+        parser.add_argument('--output', default=settings.GAZETTEER_PATH, help='Directory to build the gazetteer in.')
+
+    def read_locations(self, source):
+        """Return the sums of the latitudes and longitudes of the places under each key, and how many there are."""
+
+        sums = {}
+        with open(source, newline='', encoding='utf-8') as file:
+            for row in csv.reader(file, delimiter='\t', quoting=csv.QUOTE_NONE):
+                if len(row) < 11:
+                    continue
+                country, postal_code, city = row[0], row[1], row[2]
+                try:
+                    latitude, longitude = float(row[9]), float(row[10])
+                except ValueError:
+                    continue
+                for key in (get_postal_code_key(country, postal_code), get_city_key(country, city)):
+                    total = sums.setdefault(key, [0.0, 0.0, 0])
+                    total[0] += latitude
+                    total[1] += longitude
+                    total[2] += 1
+        return sums
+
+    def save(self, path, array):
+        """Save an array in place of the one at the path, so that readers never see it half written."""
+
+        temporary_path = path.with_name(f'{path.stem}.tmp.npy')
+        numpy.save(temporary_path, array)
+        os.replace(temporary_path, path)
+
+    def handle(self, *args, **options):
+        sums = self.read_locations(options['source'])
+        if not sums:
+            raise CommandError('The source file has no places.')
+
+        keys = sorted(sums)
+        # The centre of a postal code or city is the mean of the places in it.
+        locations = numpy.array(
+            [(sums[key][0] / sums[key][2], sums[key][1] / sums[key][2]) for key in keys],
+            dtype=numpy.float32
+        )
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+        self.save(output / GAZETTEER_LOCATIONS_FILE, locations)
+        self.save(output / GAZETTEER_KEYS_FILE, numpy.array([key.encode() for key in keys]))
+
+        self.stdout.write(f'Built a gazetteer of {len(keys)} postal codes and cities in {output}')
@@ -0,0 +1,28 @@
+"""The cache statistics report."""
+from clubs.caches import (get_authorization_cache_stats, get_fragment_cache_stats,
+    reset_authorization_cache_stats, reset_fragment_cache_stats)
+from django.core.management.base import BaseCommand
+
+class Command(BaseCommand):
+    """The cache statistics report."""
+
+    help = 'Report the hits, misses and hit rate of the shared caches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after reporting them.')
+
+    def write_stats(self, name, stats):
+        """Write the hits, misses and hit rate of a cache."""
+
+        self.stdout.write(
+            f"{name}: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['hit_rate']:.1%} hit rate"
+        )
+
+    def handle(self, *args, **options):
+        self.write_stats('Authorization cache', get_authorization_cache_stats())
+        self.write_stats('Fragment cache', get_fragment_cache_stats())
+
+        if options['reset']:
+            reset_authorization_cache_stats()
+            reset_fragment_cache_stats()
@@ -0,0 +1,120 @@
+"""The query plan checker."""
+from clubs.caches import NO_CACHES
+from clubs.helpers import *
+from clubs.models import Club_Member
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import override_settings
+
+class Command(BaseCommand):
+    """The query plan checker."""
+
+    help = 'Explain every query of the club and user helpers and fail if one of them scans a table.'
+
+    def get_helper_calls(self, user, club):
+        """Return the name of each helper, a call to it, and the tables its result is allowed to scan."""
+
+        return [
+            ('get_club', lambda: get_club(club.id), set()),
+            ('get_club_member', lambda: get_club_member(user, club.id), set()),
+            ('get_my_clubs', lambda: list(get_my_clubs(user)), set()),
+            ('get_my_clubs_menu', lambda: get_my_clubs_menu(user), set()),
+            # Every other club is the result, the dashboard uses get_other_clubs_page instead.
+            ('get_other_clubs', lambda: list(get_other_clubs(user)), {'clubs_club'}),
+            # Pages of every other club walk the clubs in order, skipping only the few the user is in, so they stop
+            # at the end of the page.
+            ('get_other_clubs_page', lambda: get_other_clubs_page(user, page_size=10), {'clubs_club'}),
+            ('get_other_clubs_page searching',
+                lambda: get_other_clubs_page(user, page_size=10, search=club.name[:1]), set()),
+            ('get_other_clubs_page searching a later word',
+                lambda: get_other_clubs_page(user, page_size=10, search=club.name.split()[-1]), set()),
+            *[(f'get_other_clubs_page sorted by {sort}',
+                lambda sort=sort: get_other_clubs_page(user, page_size=10, sort=sort), {'clubs_club'})
+                for sort in CLUBS_SORT_ORDERINGS],
+            ('get_nearby_clubs', lambda: get_nearby_clubs(51.5128, -0.1173, count=10), set()),
+            ('get_nearby_clubs within a radius', lambda: get_nearby_clubs(51.5128, -0.1173, radius=100), set()),
+            ('get_club_clusters', lambda: get_club_clusters(51, -1, 52, 1, 8), set()),
+            ('get_club_to_auth', lambda: get_club_to_auth(user), set()),
+            ('is_user_in_club', lambda: is_user_in_club(user, club), set()),
+            ('get_count_of_users_in_club', lambda: get_count_of_users_in_club(club), set()),
+            ('get_count_of_specific_user_in_club',
+                lambda: get_count_of_specific_user_in_club(club, Club_Member.APPLICANT), set()),
+            ('get_user', lambda: get_user(user.id), set()),
+            ('get_users', lambda: list(get_users(club, Club_Member.MEMBER)), set()),
+            ('get_users_with_authorization',
+                lambda: list(get_users_with_authorization(club, Club_Member.OFFICER)), set()),
+            ('get_roster_page', lambda: get_roster_page(club, Club_Member.MEMBER, page_size=10), set()),
+            ('get_applicants_page', lambda: get_applicants_page(club, page_size=10), set()),
+            ('get_roster_page searching',
+                lambda: get_roster_page(club, Club_Member.MEMBER, page_size=10, search=user.first_name[:1]), set()),
+            *[(f'get_roster_page sorted by {sort}',
+                lambda sort=sort: get_roster_page(club, Club_Member.MEMBER, page_size=10, sort=sort), set())
+                for sort in USERS_SORT_ORDERINGS],
+            ('get_authorization', lambda: get_authorization(user, club), set()),
+            ('get_authorization_text', lambda: get_authorization_text(user, club), set()),
+            ('set_authorization', lambda: set_authorization(user, club, Club_Member.MEMBER), set()),
+            ('remove_user_from_club', lambda: remove_user_from_club(user, club), set()),
+            ('get_chess_experience_text', lambda: get_chess_experience_text(user), set()),
+        ]
+
+    def capture_queries(self, call):
+        """Run the call and return the SQL and parameters of every query it made."""
+
+        queries = []
+
+        def capture(execute, sql, params, many, context):
+            queries.append((sql, params))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(capture):
+            call()
+        return queries
+
+    def explain(self, sql, params):
+        """Return the lines of the query plan of a query."""
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'sqlite':
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+                return [row[-1] for row in cursor.fetchall()]
+            cursor.execute(f'EXPLAIN {sql}', params)
+            return [row[0] for row in cursor.fetchall()]
+
+    def get_scanned_tables(self, plan):
+        """Return the tables that a query plan reads from start to end, in the order of an index or not.
+
+        A walk stopping at a limit is a scan too, as it reads the whole table when too few rows match.
+        """
+
+        scanned_tables = set()
+        for line in plan:
+            words = line.replace('"', '').split()
+            if connection.vendor == 'sqlite' and words[:1] == ['SCAN']:
+                scanned_tables.add(words[1])
+            elif 'Seq Scan on' in line:
+                scanned_tables.add(words[words.index('on') + 1])
+        return scanned_tables
+
+    def handle(self, *args, **options):
+        club_members = Club_Member.objects.order_by('id')
+        club_member = club_members.first()
+        if club_member is None:
+            raise CommandError('There are no club members to check the queries with, seed the database first.')
+
+        failures = []
+        # The cache would hide the queries, and the writes are rolled back.
+        with override_settings(CACHES=NO_CACHES), transaction.atomic():
+            for name, call, allowed_tables in self.get_helper_calls(club_member.user, club_member.club):
+                self.stdout.write(name)
+                for sql, params in self.capture_queries(call):
+                    plan = self.explain(sql, params)
+                    scanned_tables = self.get_scanned_tables(plan) - allowed_tables
+                    for line in plan:
+                        self.stdout.write(f'    {line}')
+                    if scanned_tables:
+                        failures.append(f"{name} scans {', '.join(sorted(scanned_tables))}")
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError('\n'.join(failures))
+        self.stdout.write(self.style.SUCCESS('No helper query scans a table.'))
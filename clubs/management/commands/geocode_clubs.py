@@ -0,0 +1,127 @@
+"""The club geocoding backfill."""
+from clubs.caches import MISSING
+from clubs.clusters import rebuild_clusters
+from clubs.geocoders import nominatim_circuit_breaker
+from clubs.geocoding import (GEOCODING_ERRORS, cache_location, geocode_without_cache, get_address_key,
+    get_cached_location, get_location_fields)
+from clubs.models import Club
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand, CommandError
+from pathlib import Path
+import json
+import os
+
+LOCATION_FIELDS = ['latitude', 'longitude', 'grid_cell', 'geocode_status']
+
+class Command(BaseCommand):
+    """The club geocoding backfill."""
+
+    help = (
+        'Geocode every club still pending, such as those seeded or created in the admin, on a pool of threads. '
+        'Requests to the geocoder are rate limited, and progress can be saved to resume from.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Number of threads geocoding at once.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of clubs geocoded and saved at once.')
+        parser.add_argument('--checkpoint', help='File the last club done is saved to after each batch, and resumed from.')
+        parser.add_argument('--restart', action='store_true', help='Start from the first club whatever the checkpoint.')
+        parser.add_argument('--not-found', action='store_true', help='Also geocode the clubs not found before.')
+
+    def read_checkpoint(self, path):
+        """Return the id of the last club done according to the checkpoint file, or 0."""
+
+        if path is None or not path.exists():
+            return 0
+        return json.loads(path.read_text())['last_id']
+
+    def write_checkpoint(self, path, last_id):
+        """Save the id of the last club done in place of the checkpoint file."""
+
+        if path is None:
+            return
+        temporary_path = path.with_name(f'{path.name}.tmp')
+        temporary_path.write_text(json.dumps({'last_id': last_id}))
+        os.replace(temporary_path, path)
+
+    def geocode_address(self, club):
+        """Geocode the address of a club on a worker thread, returning MISSING if it could not be geocoded."""
+
+        try:
+            return geocode_without_cache(club)
+        except GEOCODING_ERRORS:
+            return MISSING
+
+    def geocode_batch(self, executor, clubs):
+        """Geocode each distinct address of a batch of clubs once, returning the location of each club.
+
+        The geocode cache is read and written here, so that the worker threads only wait for the geocoders.
+        """
+
+        clubs_by_address = {}
+        for club in clubs:
+            clubs_by_address.setdefault(get_address_key(club), []).append(club)
+        locations = {address: get_cached_location(address) for address in clubs_by_address}
+        addresses = [address for address, location in locations.items() if location is MISSING]
+        results = executor.map(self.geocode_address, [clubs_by_address[address][0] for address in addresses])
+        for address, result in zip(addresses, results):
+            if result is MISSING:
+                continue
+            location, cached = result
+            if cached:
+                cache_location(address, location)
+            locations[address] = location
+
+        return [(club, locations[address]) for address, clubs in clubs_by_address.items() for club in clubs]
+
+    def handle(self, *args, **options):
+        checkpoint = Path(options['checkpoint']) if options['checkpoint'] else None
+        last_id = 0 if options['restart'] else self.read_checkpoint(checkpoint)
+        statuses = [Club.PENDING, Club.NOT_FOUND] if options['not_found'] else [Club.PENDING]
+        clubs = (Club.objects
+            .filter(geocode_status__in=statuses)
+            .only('address', 'city', 'postal_code', 'country')
+            .order_by('id'))
+
+        found = not_found = failed = 0
+        try:
+            with ThreadPoolExecutor(max_workers=options['workers'], thread_name_prefix='geocode_clubs') as executor:
+                while True:
+                    batch = list(clubs.filter(id__gt=last_id)[:options['batch_size']])
+                    if not batch:
+                        break
+
+                    updated_clubs = []
+                    for club, location in self.geocode_batch(executor, batch):
+                        if location is MISSING:
+                            failed += 1
+                            continue
+                        for field, value in get_location_fields(location).items():
+                            setattr(club, field, value)
+                        updated_clubs.append(club)
+                        if location is None:
+                            not_found += 1
+                        else:
+                            found += 1
+                    Club.objects.bulk_update(updated_clubs, LOCATION_FIELDS, batch_size=options['batch_size'])
+
+                    if nominatim_circuit_breaker.opened_at is not None:
+                        # The rest of the batch is still pending, so it is done again when resumed.
+                        raise CommandError(
+                            f'Stopped as the geocoder is failing, after geocoding {found} clubs. '
+                            'Run the command again to resume.'
+                        )
+                    last_id = batch[-1].id
+                    self.write_checkpoint(checkpoint, last_id)
+                    self.stdout.write(
+                        f'Geocoded clubs up to {last_id}: {found} found, {not_found} not found, {failed} failed'
+                    )
+        finally:
+            # Saving in bulk bypasses the clusters of the map, so they are built again from every location at once,
+            # even when stopping part way, for the clubs saved before.
+            if found or not_found:
+                locations = Club.objects.filter(latitude__isnull=False).values_list('latitude', 'longitude')
+                rebuild_clusters(locations.iterator())
+        self.stdout.write(self.style.SUCCESS(
+            f'Geocoded {found + not_found + failed} clubs: {found} found, {not_found} not found, {failed} failed'
+        ))
@@ -0,0 +1,18 @@
+"""The geocoder statistics report."""
+from clubs.geocoders import get_geocoder_stats, reset_geocoder_stats
+from django.core.management.base import BaseCommand
+
+class Command(BaseCommand):
+    """The geocoder statistics report."""
+
+    help = 'Report how many calls to the geocoder succeeded, found nothing, were retried, failed or were rejected.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after reporting them.')
+
+    def handle(self, *args, **options):
+        stats = get_geocoder_stats()
+        self.stdout.write(', '.join(f"{count} {outcome.replace('_', ' ')}" for outcome, count in stats.items()))
+
+        if options['reset']:
+            reset_geocoder_stats()
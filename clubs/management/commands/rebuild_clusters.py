@@ -0,0 +1,14 @@
+"""The club cluster rebuilder."""
+from clubs.clusters import rebuild_clusters
+from clubs.models import Club
+from django.core.management.base import BaseCommand
+
+class Command(BaseCommand):
+    """The club cluster rebuilder."""
+
+    help = 'Rebuild the clusters of clubs on the map from the location of every club, after writes that bypassed them.'
+
+    def handle(self, *args, **options):
+        locations = Club.objects.filter(latitude__isnull=False).values_list('latitude', 'longitude')
+        clusters = rebuild_clusters(locations.iterator())
+        self.stdout.write(f'Rebuilt {clusters} clusters')
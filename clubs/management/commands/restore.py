@@ -0,0 +1,28 @@
+"""The database snapshot restorer."""
+from clubs.snapshots import read_snapshot, restore_snapshot
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+from time import perf_counter
+
+class Command(BaseCommand):
+    """The database snapshot restorer."""
+
+    help = 'Insert the users, clubs and club members of a snapshot written by seed --snapshot, in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('snapshot', help='File the snapshot was written to.')
+        parser.add_argument('--batch-size', type=int, default=10000, help='Number of rows inserted at once.')
+
+    def handle(self, *args, **options):
+        start = perf_counter()
+        try:
+            columns = read_snapshot(options['snapshot'])
+        except (OSError, ValueError) as error:
+            raise CommandError(f"Could not read the snapshot: {error}")
+        try:
+            users, clubs, memberships = restore_snapshot(columns, batch_size=options['batch_size'])
+        except IntegrityError as error:
+            raise CommandError(f'The snapshot clashes with the rows in the database, unseed it first: {error}')
+        self.stdout.write(
+            f'Restored {users} users, {clubs} clubs and {memberships} memberships in {perf_counter() - start:.1f} s'
+        )
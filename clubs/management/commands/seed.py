@@ -1,149 +1,70 @@
 """The database seeder."""
-from clubs.models import Club, Club_Member, User
-from django.core.management.base import BaseCommand
-from django.db import IntegrityError
-
-from faker import Faker
-import numpy
+from clubs.models import Club, User
+from clubs.snapshots import TEST_USERS, generate_snapshot, restore_snapshot, write_snapshot
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max
+from time import perf_counter
 
 class Command(BaseCommand):
     """The database seeder."""
-    def __init__(self):
-        super().__init__()
-        self.faker = Faker('en_GB', 0)
-        self.CHESS_EXPERIENCE_CHOICES = ['BG', 'IM', 'AV']
-        self.AUTHORIZATION_CHOICES = ['AP', 'ME', 'OF']
-        self.counter = 0
-
-    def seed_random_user(self):
-        first_name=self.faker.first_name()
-        last_name=self.faker.last_name()
-        email = f'{first_name.lower()}{last_name.lower()}{self.counter}@example.org'
-        bio=self.faker.sentence()
-        personal_statement=self.faker.sentence()
-        chess_experience= numpy.random.choice(self.CHESS_EXPERIENCE_CHOICES)
 
-        randUser = User.objects.create_user(
-            first_name=first_name,
-            last_name=last_name,
-            email=email,
-            bio=bio,
-            personal_statement=personal_statement,
-            chess_experience= chess_experience,
-            password = 'Password123',
+    help = (
+        'Seed the database with random users and clubs, and the test users. '
+        'Rows are generated as a snapshot and inserted in bulk, so that large datasets can be seeded for load '
+        'testing, or the snapshot written to restore with the restore command.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clubs', type=int, default=5, help='Number of clubs.')
+        parser.add_argument('--users', type=int, default=105, help='Number of random users.')
+        parser.add_argument(
+            '--memberships-per-club', type=int, default=20, help='Number of random users in each club besides its owner.'
         )
-
-        self.counter += 1
-        return randUser
-
-    def seed_random_club(self):
-        name = self.faker.text(max_nb_chars=20)
-        address = self.faker.street_address()
-        city = self.faker.city()
-        postal_code = self.faker.postcode()
-        country = self.faker.country_code()
-        description = self.faker.sentence()
-
-        newClub = Club.objects.create(
-            name = name,
-            address = address,
-            city = city,
-            postal_code = postal_code,
-            country = country,
-            description = description,
+        parser.add_argument('--batch-size', type=int, default=5000, help='Number of rows inserted at once.')
+        parser.add_argument('--snapshot', help='File to write the dataset to instead of the database.')
+        parser.add_argument(
+            '--random-seed', type=int, default=0, help='Seed the dataset is generated from, the same for the same seed.'
         )
+        parser.add_argument('--workers', type=int, help='Number of processes generating the dataset.')
 
-        return newClub
+    def get_last_id(self, model):
+        """Return the id of the last row of a model, or 0 if there are none."""
 
-    def seed_test_users(self):
-
-        jeb = User.objects.create_user(
-            first_name='Jebediah',
-            last_name='Kerman',
-            email='jeb@example.org',
-            bio='I am Test User 1',
-            personal_statement='I Like Chess',
-            chess_experience= 'BG',
-            password = 'Password123',
-        )
-
-        val = User.objects.create_user(
-            first_name='Valentina',
-            last_name='Kerman',
-            email='val@example.org',
-            bio='I am Test User 2',
-            personal_statement='I Like Chess',
-            chess_experience= 'BG',
-            password = 'Password123',
-        )
-
-        bil = User.objects.create_user(
-            first_name='Billie',
-            last_name='Kerman',
-            email='billie@example.org',
-            bio='I am Test User 3',
-            personal_statement='I Like Chess',
-            chess_experience= 'BG',
-            password = 'Password123',
-        )
-
-        return [jeb, val, bil]
+        return model.objects.aggregate(last_id=Max('id'))['last_id'] or 0
 
     def handle(self, *args, **options):
-        add_test_data = False
-        try:
-            test_users = self.seed_test_users()
-            add_test_data = True
-        except IntegrityError:
-            add_test_data = False
-
-        for i in range(0, 5):
-            owner = self.seed_random_user()
-            newClub = self.seed_random_club()
-
-            # if structure to ensure data is set up to non-functional requirement
-            if(i == 0 and add_test_data):
-                Club.objects.filter(id=newClub.id).update(name='Kerbal Chess Club')
-                Club_Member.objects.create(
-                    user=test_users[0],
-                    club=newClub,
-                    authorization='ME',
-                )
-                Club_Member.objects.create(
-                    user=test_users[1],
-                    club=newClub,
-                    authorization='ME',
-                )
-                Club_Member.objects.create(
-                    user=test_users[2],
-                    club=newClub,
-                    authorization='ME',
-                )
-            elif(i==1 and add_test_data):
-                Club_Member.objects.create(
-                    user=test_users[0],
-                    club=newClub,
-                    authorization='OF',
-                )
-            elif(i==2 and add_test_data):
-                owner = test_users[1]
-            elif(i==3 and add_test_data):
-                Club_Member.objects.create(
-                    user=test_users[2],
-                    club=newClub,
-                    authorization='ME',
-                )
-
-            Club_Member.objects.create(
-                user=owner,
-                club=newClub,
-                authorization='OW',
+        if options['users'] < 1 or options['clubs'] < 0 or options['memberships_per_club'] < 0:
+            raise CommandError('There must be at least one user, and no negative number of clubs or members.')
+        if options['memberships_per_club'] >= options['users']:
+            raise CommandError('There must be more users than memberships per club, as the owner is a user too.')
+
+        start = perf_counter()
+        if options['snapshot']:
+            columns = generate_snapshot(
+                options['users'], options['clubs'], options['memberships_per_club'],
+                seed=options['random_seed'], workers=options['workers']
             )
-
-            for j in range(0, 20):
-                randUser = self.seed_random_user()
-                Club_Member.objects.create(
-                    user=randUser,
-                    club=newClub,
-                    authorization=numpy.random.choice(self.AUTHORIZATION_CHOICES)
-                )
+            write_snapshot(options['snapshot'], columns)
+            self.stdout.write(
+                f"Wrote {len(columns['user.email'])} users, {len(columns.get('club.name', []))} clubs and "
+                f"{len(columns['club_member.user'])} memberships to {options['snapshot']} "
+                f'in {perf_counter() - start:.1f} s'
+            )
+            return
+
+        # Seeding again adds random rows only, numbered after the last ones to keep emails and names unique.
+        with_test_users = not User.objects.filter(email__in=[email for _, _, email, _ in TEST_USERS]).exists()
+        columns = generate_snapshot(
+            options['users'], options['clubs'], options['memberships_per_club'],
+            seed=options['random_seed'], workers=options['workers'], with_test_users=with_test_users,
+            user_number=self.get_last_id(User), club_number=self.get_last_id(Club)
+        )
+        # The new rows take ids never handed out before, so nothing is cached about them and inserting them without
+        # signals invalidates nothing.
+        restore_snapshot(columns, batch_size=options['batch_size'])
+
+        memberships = options['clubs'] * (options['memberships_per_club'] + 1)
+        self.stdout.write(
+            f"Seeded {options['users']} users, {options['clubs']} clubs and {memberships} memberships "
+            f'in {perf_counter() - start:.1f} s'
+        )
@@ -1,6 +1,8 @@
 """Managers for models."""
 import clubs.models
+from clubs.caches import invalidate_memberships
 from django.contrib.auth.base_user import BaseUserManager
+from django.db import models
 
 class UserManager(BaseUserManager):
     """Manager for the user model."""
@@ -32,6 +34,64 @@ class UserManager(BaseUserManager):
 
         user = self.create_user(email, password, **other_fields)
         club = clubs.models.Club.objects.create(name=f'{user.first_name.lower()}{user.last_name.lower()}', description="Admin Club")
-        clubs.models.Club_Member.objects.create(user=user, club=club, authorization="OW")
+        clubs.models.Club_Member.objects.create(user=user, club=club, authorization=clubs.models.Club_Member.OWNER)
 
         return user
+
+class ClubMemberQuerySet(models.QuerySet):
+    """Query set for club members that keeps the shared caches in step with bulk writes."""
+
+    def update(self, **kwargs):
+        """Update the club members and invalidate everything cached about them."""
+
+        if kwargs.keys() <= {'search_name', 'chess_experience_level'}:
+            # Only the copies of the user's fields changed, which nothing cached depends on.
+            return super().update(**kwargs)
+        if 'user' in kwargs or 'user_id' in kwargs:
+            # The rows are moved to another user, whose sort keys they take.
+            user = kwargs.get('user') or clubs.models.User.objects.get(pk=kwargs['user_id'])
+            kwargs.update(search_name=user.search_name, chess_experience_level=user.chess_experience_level)
+        user_club_ids = list(self.values_list('user_id', 'club_id'))
+        rows = super().update(**kwargs)
+        invalidate_memberships(user_club_ids)
+        if any(field in kwargs for field in ('user', 'user_id', 'club', 'club_id')):
+            # The rows may have moved to another user or club.
+            user_id = kwargs.get('user_id', getattr(kwargs.get('user'), 'pk', None))
+            club_id = kwargs.get('club_id', getattr(kwargs.get('club'), 'pk', None))
+            invalidate_memberships(
+                (user_id or old_user_id, club_id or old_club_id)
+                for old_user_id, old_club_id in user_club_ids
+            )
+        return rows
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Create the club members and invalidate everything cached about them."""
+
+        objs = list(objs)
+        # No pre_save is sent, so the sort keys are copied here from the users, those not given loaded at once.
+        user_ids = {obj.user_id for obj in objs if not self.model.user.is_cached(obj)}
+        users = clubs.models.User.objects.only('search_name', 'chess_experience_level').in_bulk(user_ids)
+        for obj in objs:
+            if obj.user_id in users:
+                obj.user = users[obj.user_id]
+            if self.model.user.is_cached(obj):
+                obj.set_user_sort_keys()
+        objs = super().bulk_create(objs, *args, **kwargs)
+        invalidate_memberships((obj.user_id, obj.club_id) for obj in objs)
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """Update the given club members and invalidate everything cached about them, before and after."""
+
+        objs = list(objs)
+        user_club_ids = [(obj.user_id, obj.club_id) for obj in objs]
+        if any(field in fields for field in ('user', 'user_id')):
+            for obj in objs:
+                obj.set_user_sort_keys()
+            fields = [*fields, 'search_name', 'chess_experience_level']
+        if any(field in fields for field in ('user', 'user_id', 'club', 'club_id')):
+            # The rows may be moved from another user or club.
+            user_club_ids += self.model.objects.filter(pk__in=[obj.pk for obj in objs]).values_list('user_id', 'club_id')
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        invalidate_memberships(user_club_ids)
+        return rows
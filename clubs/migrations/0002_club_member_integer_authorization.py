@@ -0,0 +1,40 @@
+from django.db import migrations, models
+
+AUTHORIZATION_LEVELS = {'AP': 1, 'ME': 2, 'OF': 3, 'OW': 4}
+
+
+def authorization_codes_to_levels(apps, schema_editor):
+    Club_Member = apps.get_model('clubs', 'Club_Member')
+    for code, level in AUTHORIZATION_LEVELS.items():
+        Club_Member.objects.filter(authorization=code).update(authorization_level=level)
+
+
+def authorization_levels_to_codes(apps, schema_editor):
+    Club_Member = apps.get_model('clubs', 'Club_Member')
+    for code, level in AUTHORIZATION_LEVELS.items():
+        Club_Member.objects.filter(authorization_level=level).update(authorization=code)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club_member',
+            name='authorization_level',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Applicant'), (2, 'Member'), (3, 'Officer'), (4, 'Owner')], default=1),
+        ),
+        migrations.RunPython(authorization_codes_to_levels, authorization_levels_to_codes),
+        migrations.RemoveField(
+            model_name='club_member',
+            name='authorization',
+        ),
+        migrations.RenameField(
+            model_name='club_member',
+            old_name='authorization_level',
+            new_name='authorization',
+        ),
+    ]
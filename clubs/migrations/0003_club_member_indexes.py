@@ -0,0 +1,33 @@
+# Generated by Django 3.2.5 on 2026-10-18 20:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0002_club_member_integer_authorization'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='club_member',
+            name='club',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to='clubs.club'),
+        ),
+        migrations.AlterField(
+            model_name='club_member',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='club_member',
+            index=models.Index(fields=['club', 'authorization', 'user'], name='club_member_club_auth_user'),
+        ),
+        migrations.AddIndex(
+            model_name='club_member',
+            index=models.Index(fields=['user', 'club', 'authorization'], name='club_member_user_club_auth'),
+        ),
+    ]
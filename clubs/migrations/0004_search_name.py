@@ -0,0 +1,46 @@
+# Generated by Django 3.2.5 on 2026-10-18 20:53
+
+from clubs.search import normalise_search_text
+from django.db import migrations, models
+
+
+def set_search_names(apps, schema_editor):
+    User = apps.get_model('clubs', 'User')
+    Club = apps.get_model('clubs', 'Club')
+    users = list(User.objects.only('first_name', 'last_name'))
+    for user in users:
+        user.search_name = normalise_search_text(f'{user.first_name} {user.last_name}')
+    User.objects.bulk_update(users, ['search_name'], batch_size=500)
+    clubs = list(Club.objects.only('name'))
+    for club in clubs:
+        club.search_name = normalise_search_text(club.name)
+    Club.objects.bulk_update(clubs, ['search_name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0003_club_member_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=101),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['search_name', 'id'], name='club_search_name_id'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['search_name', 'id'], name='user_search_name_id'),
+        ),
+        migrations.RunPython(set_search_names, migrations.RunPython.noop),
+    ]
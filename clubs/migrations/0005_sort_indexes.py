@@ -0,0 +1,39 @@
+# Generated by Django 3.2.5 on 2026-10-18 20:58
+
+from django.db import migrations, models
+
+CHESS_EXPERIENCE_LEVELS = {'BG': 1, 'IM': 2, 'AV': 3}
+
+
+def set_chess_experience_levels(apps, schema_editor):
+    User = apps.get_model('clubs', 'User')
+    for chess_experience, level in CHESS_EXPERIENCE_LEVELS.items():
+        User.objects.filter(chess_experience=chess_experience).update(chess_experience_level=level)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0004_search_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='chess_experience_level',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['city', 'id'], name='club_city_id'),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['country', 'id'], name='club_country_id'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['chess_experience_level', 'id'], name='user_experience_id'),
+        ),
+        migrations.RunPython(set_chess_experience_levels, migrations.RunPython.noop),
+    ]
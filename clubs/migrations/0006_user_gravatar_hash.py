@@ -0,0 +1,28 @@
+# Generated by Django 3.2.5 on 2026-10-18 21:03
+
+from django.db import migrations, models
+from libgravatar import md5_hash, sanitize_email
+
+
+def set_gravatar_hashes(apps, schema_editor):
+    User = apps.get_model('clubs', 'User')
+    users = list(User.objects.only('email'))
+    for user in users:
+        user.gravatar_hash = md5_hash(sanitize_email(user.email))
+    User.objects.bulk_update(users, ['gravatar_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0005_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='gravatar_hash',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.RunPython(set_gravatar_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.5 on 2026-10-18 21:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0006_user_gravatar_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='geocode_status',
+            field=models.PositiveSmallIntegerField(choices=[(1, 'Pending'), (2, 'Geocoded'), (3, 'Not found')], default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='latitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='club',
+            name='longitude',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.5 on 2026-10-18 21:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0007_club_location'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Geocoded_Address',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address_key', models.CharField(max_length=175, unique=True)),
+                ('latitude', models.FloatField(blank=True, null=True)),
+                ('longitude', models.FloatField(blank=True, null=True)),
+                ('geocoded_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.5 on 2026-10-18 21:28
+
+from clubs.geo import get_grid_cell
+from django.db import migrations, models
+
+
+def set_grid_cells(apps, schema_editor):
+    Club = apps.get_model('clubs', 'Club')
+    clubs = list(Club.objects.filter(latitude__isnull=False).only('latitude', 'longitude'))
+    for club in clubs:
+        club.grid_cell = get_grid_cell(club.latitude, club.longitude)
+    Club.objects.bulk_update(clubs, ['grid_cell'], batch_size=500)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0008_geocoded_address'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club',
+            name='grid_cell',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['grid_cell', 'latitude', 'longitude'], name='club_grid_cell_location'),
+        ),
+        migrations.RunPython(set_grid_cells, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 3.2.5 on 2026-10-18 21:31
+
+from clubs.clusters import get_cluster_totals
+from django.db import migrations, models
+
+
+def build_clusters(apps, schema_editor):
+    Club = apps.get_model('clubs', 'Club')
+    Club_Cluster = apps.get_model('clubs', 'Club_Cluster')
+    locations = Club.objects.filter(latitude__isnull=False).values_list('latitude', 'longitude')
+    Club_Cluster.objects.bulk_create(
+        [
+            Club_Cluster(zoom=zoom, x=x, y=y, count=count, latitude_sum=latitude_sum, longitude_sum=longitude_sum)
+            for (zoom, x, y), (count, latitude_sum, longitude_sum) in get_cluster_totals(locations).items()
+        ],
+        batch_size=500
+    )
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0009_club_grid_cell'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Club_Cluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zoom', models.PositiveSmallIntegerField()),
+                ('x', models.PositiveIntegerField()),
+                ('y', models.PositiveIntegerField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('latitude_sum', models.FloatField(default=0)),
+                ('longitude_sum', models.FloatField(default=0)),
+            ],
+            options={
+                'unique_together': {('zoom', 'y', 'x')},
+            },
+        ),
+        migrations.RunPython(build_clusters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.5 on 2026-10-18 22:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0010_club_cluster'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_search_name_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='user',
+            name='user_experience_id',
+        ),
+    ]
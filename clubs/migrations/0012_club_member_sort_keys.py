@@ -0,0 +1,43 @@
+# Generated by Django 3.2.5 on 2026-10-18 23:07
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def set_user_sort_keys(apps, schema_editor):
+    User = apps.get_model('clubs', 'User')
+    Club_Member = apps.get_model('clubs', 'Club_Member')
+    users = User.objects.filter(id=OuterRef('user_id'))
+    Club_Member.objects.update(
+        search_name=Subquery(users.values('search_name')[:1]),
+        chess_experience_level=Subquery(users.values('chess_experience_level')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0011_remove_user_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='club_member',
+            name='chess_experience_level',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='club_member',
+            name='search_name',
+            field=models.CharField(blank=True, editable=False, max_length=101),
+        ),
+        migrations.RunPython(set_user_sort_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='club_member',
+            index=models.Index(fields=['club', '-authorization', 'search_name', 'user'], name='club_member_club_auth_name'),
+        ),
+        migrations.AddIndex(
+            model_name='club_member',
+            index=models.Index(fields=['club', 'authorization', 'chess_experience_level', 'user'], name='club_member_club_auth_exp'),
+        ),
+    ]
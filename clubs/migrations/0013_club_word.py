@@ -0,0 +1,39 @@
+# Generated by Django 3.2.5 on 2026-10-18 23:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def set_club_words(apps, schema_editor):
+    Club = apps.get_model('clubs', 'Club')
+    Club_Word = apps.get_model('clubs', 'Club_Word')
+    Club_Word.objects.bulk_create(
+        [
+            Club_Word(word=word, club_id=club_id)
+            for club_id, search_name in Club.objects.values_list('id', 'search_name')
+            for word in set(search_name.split())
+        ],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0012_club_member_sort_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Club_Word',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=50)),
+                ('club', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='clubs.club')),
+            ],
+            options={
+                'unique_together': {('word', 'club')},
+            },
+        ),
+        migrations.RunPython(set_club_words, migrations.RunPython.noop),
+    ]
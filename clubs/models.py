@@ -1,9 +1,10 @@
 """Models in the clubs app."""
-from clubs.managers import UserManager
+from clubs.managers import ClubMemberQuerySet, UserManager
+from clubs.search import normalise_search_text
 from django.contrib.auth.models import AbstractUser
 from django_countries.fields import CountryField
 from django.db import models
-from libgravatar import Gravatar
+from libgravatar import md5_hash, sanitize_email
 
 class User(AbstractUser):
     """User model for authentication."""
@@ -28,18 +29,49 @@ class User(AbstractUser):
         default=BEGINNER
     )
 
+    # Ordered so that users can be sorted from the least to the most experienced.
+    CHESS_EXPERIENCE_LEVELS = {
+        BEGINNER: 1,
+        INTERMEDIATE: 2,
+        ADVANCED: 3,
+    }
+    # Kept in step with the chess experience when saved, see clubs.signals.
+    chess_experience_level = models.PositiveSmallIntegerField(default=1, editable=False)
+
     personal_statement = models.CharField(max_length=720, blank=True)
 
+    # Kept in step with the full name when saved, see clubs.signals.
+    search_name = models.CharField(max_length=101, blank=True, editable=False)
+
+    # Kept in step with the email when saved, see clubs.signals, so showing a gravatar hashes nothing.
+    gravatar_hash = models.CharField(max_length=32, blank=True, editable=False)
+
+    GRAVATAR_URL = 'https://www.gravatar.com/avatar/{gravatar_hash}?size={size}&default=mp'
+
     objects = UserManager()
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name','last_name']
 
+    def get_search_name(self):
+        """Return the normalised full name the user is searched by."""
+
+        return normalise_search_text(self.get_full_name())
+
+    def get_chess_experience_level(self):
+        """Return the level of the chess experience of the user, higher being more experienced."""
+
+        return self.CHESS_EXPERIENCE_LEVELS[self.chess_experience]
+
+    def get_gravatar_hash(self):
+        """Return the hash of the email that identifies the user's gravatar."""
+
+        return md5_hash(sanitize_email(self.email))
+
     def gravatar(self, size=100):
         """Return a URL to the user's gravatar."""
 
-        gravatar_object = Gravatar(self.email)
-        gravatar_url = gravatar_object.get_image(size=size, default='mp')
-        return gravatar_url
+        gravatar_hash = self.gravatar_hash or self.get_gravatar_hash()
+        return self.GRAVATAR_URL.format(gravatar_hash=gravatar_hash, size=size)
 
     def mini_gravatar(self):
         """Return a URL to a smaller version of user's gravatar."""
@@ -56,16 +88,72 @@ class Club(models.Model):
     country = CountryField(blank_label='(select country)')
     description = models.CharField(max_length=500, blank=False)
 
+    # Kept in step with the name when saved, see clubs.signals.
+    search_name = models.CharField(max_length=50, blank=True, editable=False)
+
+    # Found from the address in the background once the club is created, see clubs.geocoding.
+    PENDING = 1
+    GEOCODED = 2
+    NOT_FOUND = 3
+    GEOCODE_STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (GEOCODED, 'Geocoded'),
+        (NOT_FOUND, 'Not found')
+    ]
+
+    latitude = models.FloatField(null=True, blank=True, editable=False)
+    longitude = models.FloatField(null=True, blank=True, editable=False)
+    # The cell of the grid the location is in, see clubs.geo.
+    grid_cell = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    geocode_status = models.PositiveSmallIntegerField(
+        choices=GEOCODE_STATUS_CHOICES,
+        default=PENDING,
+        editable=False
+    )
+
+    class Meta:
+        """Model options."""
+
+        indexes = [
+            # Clubs in name order, as they are searched.
+            models.Index(fields=['search_name', 'id'], name='club_search_name_id'),
+            # Clubs in city and in country order.
+            models.Index(fields=['city', 'id'], name='club_city_id'),
+            models.Index(fields=['country', 'id'], name='club_country_id'),
+            # Clubs in a range of cells of the grid, with their location to tell how far they are.
+            models.Index(fields=['grid_cell', 'latitude', 'longitude'], name='club_grid_cell_location'),
+        ]
+
+    def get_search_name(self):
+        """Return the normalised name the club is searched by."""
+
+        return normalise_search_text(self.name)
+
+class Club_Word(models.Model):
+    """Word of the search name of a club, so that clubs are found by any word of their name from an index."""
+
+    # Kept in step with the search name of the club when it is saved, see clubs.signals.
+    word = models.CharField(max_length=50)
+    club = models.ForeignKey(Club, on_delete=models.CASCADE)
+
+    class Meta:
+        """Model options."""
+
+        # Also the index of the clubs with a word in a range, covering the club id.
+        unique_together = (("word", "club"),)
+
 class Club_Member(models.Model):
     """Authorization for each member in a club."""
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, blank=False)
-    club = models.ForeignKey(Club, on_delete=models.CASCADE, blank=False)
+    # Both foreign keys lead one of the composite indexes below, so they need no index of their own.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, blank=False, db_index=False)
+    club = models.ForeignKey(Club, on_delete=models.CASCADE, blank=False, db_index=False)
 
-    APPLICANT = 'AP'
-    MEMBER = 'ME'
-    OFFICER = 'OF'
-    OWNER = 'OW'
+    # Ordered so that a higher authorization has every right of the lower ones.
+    APPLICANT = 1
+    MEMBER = 2
+    OFFICER = 3
+    OWNER = 4
     AUTHORIZATION_CHOICES = [
         (APPLICANT, 'Applicant'),
         (MEMBER, 'Member'),
@@ -73,13 +161,72 @@ class Club_Member(models.Model):
         (OWNER, 'Owner')
     ]
 
-    authorization = models.CharField(
-        max_length=2,
+    authorization = models.PositiveSmallIntegerField(
         choices=AUTHORIZATION_CHOICES,
         default=APPLICANT
     )
 
+    # Copies of the search name and chess experience level of the user, which the members of a club are sorted
+    # by from the indexes below. Kept in step with the user when either is saved, see clubs.signals.
+    search_name = models.CharField(max_length=101, blank=True, editable=False)
+    chess_experience_level = models.PositiveSmallIntegerField(default=1, editable=False)
+
+    objects = ClubMemberQuerySet.as_manager()
+
     class Meta:
         """Model options."""
 
         unique_together = (("user", "club"),)
+        indexes = [
+            # Users of a club with a given authorization, covering the user id.
+            models.Index(fields=['club', 'authorization', 'user'], name='club_member_club_auth_user'),
+            # Clubs of a user and the user's authorization in them.
+            models.Index(fields=['user', 'club', 'authorization'], name='club_member_user_club_auth'),
+            # Users of a club by authorization, highest first, then by name.
+            models.Index(
+                fields=['club', '-authorization', 'search_name', 'user'], name='club_member_club_auth_name'
+            ),
+            # Users of a club by authorization then experience, walked backwards for the highest of both first.
+            models.Index(
+                fields=['club', 'authorization', 'chess_experience_level', 'user'], name='club_member_club_auth_exp'
+            ),
+        ]
+
+    def set_user_sort_keys(self):
+        """Copy the search name and chess experience level of the user, which the members of a club are sorted by."""
+
+        self.search_name = self.user.search_name
+        self.chess_experience_level = self.user.chess_experience_level
+
+class Geocoded_Address(models.Model):
+    """Location the geocoder gave for an address, so that each address is only looked up once."""
+
+    # The address, city, postal code and country normalised and joined, see clubs.geocoding.
+    address_key = models.CharField(max_length=175, unique=True)
+    # Both None when the geocoder does not know the address.
+    latitude = models.FloatField(null=True, blank=True)
+    longitude = models.FloatField(null=True, blank=True)
+    geocoded_at = models.DateTimeField()
+
+class Club_Cluster(models.Model):
+    """Number of geocoded clubs in a cell of the web map at a zoom level, and where they are on average."""
+
+    zoom = models.PositiveSmallIntegerField()
+    # Column and row of the cell, see clubs.clusters.
+    x = models.PositiveIntegerField()
+    y = models.PositiveIntegerField()
+    count = models.PositiveIntegerField(default=0)
+    # Sums of the locations of the clubs, as the mean of a cluster changes with each club added or taken away.
+    latitude_sum = models.FloatField(default=0)
+    longitude_sum = models.FloatField(default=0)
+
+    class Meta:
+        """Model options."""
+
+        # Also the index of the cells of a zoom level in a box, row by row.
+        unique_together = (("zoom", "y", "x"),)
+
+    def get_location(self):
+        """Return the mean latitude and longitude of the clubs in the cluster."""
+
+        return self.latitude_sum / self.count, self.longitude_sum / self.count
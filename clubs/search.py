@@ -0,0 +1,38 @@
+"""Normalised names that users and clubs are searched by."""
+from django.db.models import Q
+
+# Sorts after any character of a word, to end the range of the words starting with a search.
+SEARCH_PREFIX_END = '\U0010ffff'
+
+def normalise_search_text(text):
+    """Lowercase the text and collapse its whitespace, so names and searches compare alike."""
+
+    return ' '.join(text.split()).lower()
+
+def get_search_filter(search):
+    """Get the filter for the search names with a word that starts with the given normalised search.
+
+    Words after the first cannot be looked up as a range of a search name index. Clubs are first looked up by their
+    indexed words with get_word_range_filter, and the members of a club are filtered while walking its memberships.
+    """
+
+    return Q(search_name__startswith=search) | Q(search_name__contains=f' {search}')
+
+def get_search_words(search_name):
+    """Get the distinct words of a normalised search name, which clubs are looked up by."""
+
+    return set(search_name.split())
+
+def get_word_range_filter(search):
+    """Get the filter for the indexed words starting with the first word of the given normalised search.
+
+    Every search name matching the search has such a word, so the range narrows the names to filter.
+    """
+
+    word = search.split()[0]
+    return Q(word__gte=word, word__lt=word + SEARCH_PREFIX_END)
+
+def matches_search(search_name, search):
+    """Check if a search name has a word that starts with the given normalised search, as get_search_filter does."""
+
+    return search_name.startswith(search) or f' {search}' in search_name
@@ -0,0 +1,121 @@
+"""Signal receivers that keep the shared caches and derived fields in step with the database."""
+from clubs.caches import bump_versions, invalidate_memberships, invalidate_my_clubs
+from clubs.clusters import move_in_clusters, remove_from_clusters
+from clubs.models import Club, Club_Member, Club_Word, User
+from clubs.search import get_search_words
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+# The fields of a user that the search name and chess experience level are set from.
+USER_SORT_FIELDS = {'first_name', 'last_name', 'chess_experience'}
+
+@receiver(pre_save, sender=Club_Member)
+def invalidate_previous_membership(sender, instance, raw, **kwargs):
+    """Invalidate the membership the club member was before being moved to another user or club."""
+
+    if instance.pk is None or raw:
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list('user_id', 'club_id').first()
+    if previous is not None and previous != (instance.user_id, instance.club_id):
+        invalidate_memberships([previous])
+
+@receiver(post_save, sender=Club_Member)
+@receiver(post_delete, sender=Club_Member)
+def invalidate_club_member(sender, instance, **kwargs):
+    """Invalidate everything cached about a club member that was saved or deleted."""
+
+    invalidate_memberships([(instance.user_id, instance.club_id)])
+
+@receiver(post_save, sender=Club)
+def invalidate_saved_club(sender, instance, created, raw, **kwargs):
+    """Bump the version of a saved club, and invalidate the cached clubs of its members in case it was renamed."""
+
+    bump_versions('club', [instance.pk])
+    if created or raw:
+        return
+    invalidate_my_clubs(Club_Member.objects.filter(club=instance).values_list('user_id', flat=True))
+
+@receiver(post_delete, sender=Club)
+def bump_deleted_club_version(sender, instance, **kwargs):
+    """Bump the version of a deleted club."""
+
+    bump_versions('club', [instance.pk])
+
+@receiver(pre_save, sender=Club)
+def remember_previous_location(sender, instance, raw, **kwargs):
+    """Remember where a club was before being saved, to move it between clusters if it moved."""
+
+    instance._previous_location = None
+    if instance.pk is None or raw:
+        return
+    previous = sender.objects.filter(pk=instance.pk, latitude__isnull=False).values_list('latitude', 'longitude')
+    instance._previous_location = previous.first()
+
+@receiver(post_save, sender=Club)
+def move_saved_club_in_clusters(sender, instance, raw, **kwargs):
+    """Move a saved club to the clusters of its location, adding it to them if it was just geocoded."""
+
+    if raw:
+        return
+    location = None if instance.latitude is None else (instance.latitude, instance.longitude)
+    move_in_clusters(getattr(instance, '_previous_location', None), location)
+
+@receiver(post_delete, sender=Club)
+def remove_deleted_club_from_clusters(sender, instance, **kwargs):
+    """Take a deleted club away from the clusters of its location."""
+
+    if instance.latitude is not None:
+        remove_from_clusters(instance.latitude, instance.longitude)
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def bump_user_version(sender, instance, **kwargs):
+    """Bump the version of a user that was saved or deleted."""
+
+    bump_versions('user', [instance.pk])
+
+@receiver(pre_save, sender=User)
+@receiver(pre_save, sender=Club)
+def set_search_name(sender, instance, **kwargs):
+    """Set the search name of a user or club from its name, fixtures included."""
+
+    instance.search_name = instance.get_search_name()
+
+@receiver(pre_save, sender=User)
+def set_chess_experience_level(sender, instance, **kwargs):
+    """Set the chess experience level of a user from its chess experience, fixtures included."""
+
+    instance.chess_experience_level = instance.get_chess_experience_level()
+
+@receiver(pre_save, sender=User)
+def set_gravatar_hash(sender, instance, **kwargs):
+    """Set the gravatar hash of a user from its email, fixtures included."""
+
+    instance.gravatar_hash = instance.get_gravatar_hash()
+
+@receiver(post_save, sender=Club)
+def set_club_words(sender, instance, created, **kwargs):
+    """Index the words of the search name of a saved club, fixtures included."""
+
+    words = get_search_words(instance.search_name)
+    indexed_words = set() if created else set(Club_Word.objects.filter(club=instance).values_list('word', flat=True))
+    if indexed_words - words:
+        Club_Word.objects.filter(club=instance, word__in=indexed_words - words).delete()
+    Club_Word.objects.bulk_create(Club_Word(word=word, club=instance) for word in words - indexed_words)
+
+@receiver(pre_save, sender=Club_Member)
+def set_user_sort_keys(sender, instance, **kwargs):
+    """Copy the search name and chess experience level of the user of a club member, fixtures included."""
+
+    instance.set_user_sort_keys()
+
+@receiver(post_save, sender=User)
+def update_member_sort_keys(sender, instance, created, raw, update_fields, **kwargs):
+    """Copy the search name and chess experience level of a saved user to its club members, if they changed."""
+
+    if created or raw or (update_fields is not None and not USER_SORT_FIELDS.intersection(update_fields)):
+        return
+    (Club_Member.objects
+        .filter(user=instance)
+        .exclude(search_name=instance.search_name, chess_experience_level=instance.chess_experience_level)
+        .update(search_name=instance.search_name, chess_experience_level=instance.chess_experience_level))
@@ -0,0 +1,379 @@
+"""Snapshots of seeded users, clubs and club members, generated in parallel and restored in bulk.
+
+A snapshot is a NumPy .npz file of one array per column of each model, named '<model>.<field>'. Rows refer to
+each other by their position, so they can be restored after the rows already in the database. Each shard of rows
+is generated from its own random seed, so a snapshot only depends on its sizes and seed, not on the number of
+processes it is generated by.
+"""
+from clubs.models import Club, Club_Member, Club_Word, User
+from clubs.search import get_search_words
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from faker import Faker
+import django
+import numpy
+
+SNAPSHOT_VERSION = 1
+
+PASSWORD = 'Password123'
+
+# Number of users or clubs generated by each task, which fixes which rows each random seed generates.
+SHARD_SIZE = 10000
+
+# Number of fake names, addresses and sentences made with Faker, which is slow, for the rows to pick from at random.
+POOL_SIZE = 1000
+
+TEST_USERS = [
+    ('Jebediah', 'Kerman', 'jeb@example.org', 'I am Test User 1'),
+    ('Valentina', 'Kerman', 'val@example.org', 'I am Test User 2'),
+    ('Billie', 'Kerman', 'billie@example.org', 'I am Test User 3'),
+]
+
+# Rows of the club members that the test users are, as positions of the test user and club, and authorizations.
+TEST_MEMBERSHIPS = [
+    (0, 0, Club_Member.MEMBER),
+    (1, 0, Club_Member.MEMBER),
+    (2, 0, Club_Member.MEMBER),
+    (0, 1, Club_Member.OFFICER),
+    (2, 3, Club_Member.MEMBER),
+]
+TEST_OWNED_CLUB = 2
+TEST_OWNER = 1
+TEST_CLUB_NAME = 'Kerbal Chess Club'
+
+SNAPSHOT_MODELS = [User, Club, Club_Member, Club_Word]
+
+# Kinds of shards, each with its own random seeds.
+USER_SHARDS = 1
+CLUB_SHARDS = 2
+
+def get_random(seed, kind, shard):
+    """Return the NumPy and Faker random generators of a shard of rows of a kind."""
+
+    faker = Faker('en_GB')
+    faker.seed_instance(f'{seed}-{kind}-{shard}')
+    return numpy.random.default_rng([seed, kind, shard]), faker
+
+def make_pool(make):
+    """Return an array of fake values made by calling the given function."""
+
+    return numpy.array([make() for _ in range(POOL_SIZE)], dtype=object)
+
+def pick(random, pool, size):
+    """Return the given number of values picked at random from a pool."""
+
+    return pool[random.integers(len(pool), size=size)].tolist()
+
+def get_user_columns(users):
+    """Return the columns of the given unsaved users, with the fields derived when they are saved."""
+
+    return {
+        'first_name': [user.first_name for user in users],
+        'last_name': [user.last_name for user in users],
+        'email': [user.email for user in users],
+        'bio': [user.bio for user in users],
+        'personal_statement': [user.personal_statement for user in users],
+        'chess_experience': [user.chess_experience for user in users],
+        'chess_experience_level': [user.get_chess_experience_level() for user in users],
+        'search_name': [user.get_search_name() for user in users],
+        'gravatar_hash': [user.get_gravatar_hash() for user in users],
+    }
+
+def generate_users(seed, shard, start, count, number=0):
+    """Return the columns of a shard of the given number of random users, the first at the given position.
+
+    Emails are numbered by position after the given number.
+    """
+
+    random, faker = get_random(seed, USER_SHARDS, shard)
+    first_names = make_pool(faker.first_name)
+    last_names = make_pool(faker.last_name)
+    sentences = make_pool(faker.sentence)
+    users = [
+        User(
+            first_name=first_name,
+            last_name=last_name,
+            email=f'{first_name.lower()}{last_name.lower()}{number + start + i}@example.org',
+            bio=bio,
+            personal_statement=personal_statement,
+            chess_experience=chess_experience,
+        )
+        for i, (first_name, last_name, bio, personal_statement, chess_experience) in enumerate(zip(
+            pick(random, first_names, count),
+            pick(random, last_names, count),
+            pick(random, sentences, count),
+            pick(random, sentences, count),
+            random.choice([User.BEGINNER, User.INTERMEDIATE, User.ADVANCED], size=count).tolist()
+        ))
+    ]
+    return get_user_columns(users)
+
+def generate_clubs(seed, shard, start, owners, first_user, users, memberships_per_club, number=0):
+    """Return the columns of a shard of random clubs, the first at the given position, and of their members.
+
+    Each club has the user at its position in owners as its owner, and the given number of other users picked at
+    random from the given number of users after the first one. Names are numbered by position after the given
+    number, the first club being the one the test users join if they come first.
+    """
+
+    random, faker = get_random(seed, CLUB_SHARDS, shard)
+    names = make_pool(lambda: faker.text(max_nb_chars=20).rstrip('.'))
+    count = len(owners)
+    clubs = [
+        Club(name=f'{name} {number + start + i + 1}', address=address, city=city, postal_code=postal_code,
+            country=country, description=description)
+        for i, (name, address, city, postal_code, country, description) in enumerate(zip(
+            pick(random, names, count),
+            pick(random, make_pool(faker.street_address), count),
+            pick(random, make_pool(faker.city), count),
+            pick(random, make_pool(faker.postcode), count),
+            pick(random, make_pool(faker.country_code), count),
+            pick(random, make_pool(faker.sentence), count)
+        ))
+    ]
+    if start == 0 and count > 0 and first_user == len(TEST_USERS):
+        clubs[0].name = TEST_CLUB_NAME
+
+    # Picked from every user but the last, with the owner standing in for the last if picked.
+    others = numpy.array([
+        random.choice(users - 1, size=memberships_per_club, replace=False) for _ in range(count)
+    ], dtype=int).reshape(count, memberships_per_club)
+    others[others == owners[:, None] - first_user] = users - 1
+    authorizations = random.choice(
+        [Club_Member.APPLICANT, Club_Member.MEMBER, Club_Member.OFFICER], size=(count, memberships_per_club)
+    )
+    return {
+        'name': [club.name for club in clubs],
+        'address': [club.address for club in clubs],
+        'city': [club.city for club in clubs],
+        'postal_code': [club.postal_code for club in clubs],
+        'country': [club.country.code for club in clubs],
+        'description': [club.description for club in clubs],
+        'search_name': [club.get_search_name() for club in clubs],
+    }, {
+        'user': numpy.concatenate([owners, others.ravel() + first_user]),
+        'club': numpy.concatenate([
+            numpy.arange(count), numpy.repeat(numpy.arange(count), memberships_per_club)
+        ]) + start,
+        'authorization': numpy.concatenate([
+            numpy.full(count, Club_Member.OWNER), authorizations.ravel()
+        ]),
+    }
+
+def concatenate_columns(shards):
+    """Join the columns of shards of rows in order, as arrays, strings being of fixed width to load unpickled."""
+
+    return {column: numpy.concatenate([numpy.asarray(shard[column]) for shard in shards]) for column in shards[0]}
+
+def generate_snapshot(users, clubs, memberships_per_club, seed=0, workers=None, shard_size=SHARD_SIZE,
+        with_test_users=True, user_number=0, club_number=0):
+    """Return the columns of the test users and the given numbers of random users, clubs and club members.
+
+    Shards of users and clubs are generated on a pool of processes. Positions of users and clubs are counted from
+    0, the test users coming first and owning and joining the first clubs, unless left out for having been
+    restored before. The emails of the random users and names of the clubs are numbered after the given numbers,
+    to keep them apart from those of rows restored before.
+    """
+
+    test_users = [
+        User(first_name=first_name, last_name=last_name, email=email, bio=bio, personal_statement='I Like Chess',
+            chess_experience=User.BEGINNER)
+        for first_name, last_name, email, bio in TEST_USERS
+    ] if with_test_users else []
+    # The random users come after the test users, one of which owns a club.
+    owners = numpy.random.default_rng([seed]).choice(users, size=clubs, replace=clubs > users) + len(test_users)
+    if test_users and clubs > TEST_OWNED_CLUB:
+        owners[TEST_OWNED_CLUB] = TEST_OWNER
+    user_shards = [
+        (shard, start, min(shard_size, users - start)) for shard, start in enumerate(range(0, users, shard_size))
+    ]
+    club_shards = [
+        (shard, start, owners[start:start + shard_size]) for shard, start in enumerate(range(0, clubs, shard_size))
+    ]
+    test_memberships = [
+        (user, club, authorization) for user, club, authorization in TEST_MEMBERSHIPS if test_users and club < clubs
+    ]
+
+    # Processes that are spawned rather than forked set up Django before running any task.
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        user_futures = [
+            executor.submit(generate_users, seed, *user_shard, number=user_number) for user_shard in user_shards
+        ]
+        club_futures = [
+            executor.submit(
+                generate_clubs, seed, shard, start, shard_owners, len(test_users), users, memberships_per_club,
+                number=club_number
+            )
+            for shard, start, shard_owners in club_shards
+        ]
+        user_columns = concatenate_columns(
+            ([get_user_columns(test_users)] if test_users else []) + [future.result() for future in user_futures]
+        )
+        club_results = [future.result() for future in club_futures]
+
+    club_columns = concatenate_columns([club_shard for club_shard, _ in club_results]) if club_results else {}
+    member_columns = concatenate_columns(
+        [{
+            'user': numpy.array([user for user, _, _ in test_memberships], dtype=int),
+            'club': numpy.array([club for _, club, _ in test_memberships], dtype=int),
+            'authorization': numpy.array([authorization for _, _, authorization in test_memberships], dtype=int),
+        }]
+        + [member_shard for _, member_shard in club_results]
+    )
+
+    columns = {'version': numpy.array(SNAPSHOT_VERSION)}
+    for model, model_columns in [(User, user_columns), (Club, club_columns), (Club_Member, member_columns)]:
+        for column, values in model_columns.items():
+            columns[f'{model._meta.model_name}.{column}'] = values
+    return columns
+
+def write_snapshot(path, columns):
+    """Write the columns of a snapshot to a compressed file at the given path."""
+
+    with open(path, 'wb') as file:
+        numpy.savez_compressed(file, **columns)
+
+def read_snapshot(path):
+    """Read the columns of a snapshot, raising ValueError if it is not a snapshot of this version."""
+
+    with numpy.load(path) as snapshot:
+        columns = dict(snapshot)
+    if columns.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f'{path} is not a version {SNAPSHOT_VERSION} snapshot.')
+    return columns
+
+def get_model_columns(columns, model):
+    """Return the columns of a snapshot of the rows of a model, by name."""
+
+    prefix = f'{model._meta.model_name}.'
+    return {name[len(prefix):]: values for name, values in columns.items() if name.startswith(prefix)}
+
+@contextmanager
+def indexes_dropped(model):
+    """Drop the indexes of a model while inside the context, building them again at once when leaving it.
+
+    Only on SQLite and PostgreSQL, which can drop and create indexes inside the transaction of a restore, with the
+    SQL of a schema editor that is never entered to run any of its own. Elsewhere the indexes are left in place.
+    """
+
+    if connection.vendor not in ('sqlite', 'postgresql'):
+        yield
+        return
+    schema_editor = connection.schema_editor()
+    with connection.cursor() as cursor:
+        for index in model._meta.indexes:
+            cursor.execute(str(index.remove_sql(model, schema_editor)))
+        yield
+        for index in model._meta.indexes:
+            cursor.execute(str(index.create_sql(model, schema_editor)))
+
+def get_next_id(model):
+    """Return the id after every id the database has handed out for a model, those of deleted rows included.
+
+    Users, clubs and memberships may still be cached under the ids of deleted rows, so those are not used again.
+    Only SQLite and PostgreSQL keep track of them, elsewhere the id after the last row is returned.
+    """
+
+    next_id = (model.objects.aggregate(last_id=Max('id'))['last_id'] or 0) + 1
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute('SELECT seq FROM sqlite_sequence WHERE name = %s', [model._meta.db_table])
+            row = cursor.fetchone()
+            return max(next_id, row[0] + 1) if row else next_id
+        if connection.vendor == 'postgresql':
+            # Taking a value leaves the sequence past it, and resetting the sequences after the restore moves it on.
+            cursor.execute("SELECT nextval(pg_get_serial_sequence(%s, 'id'))", [model._meta.db_table])
+            return max(next_id, cursor.fetchone()[0])
+    return next_id
+
+def insert_rows(model, first_id, columns, batch_size):
+    """Insert the rows of a model with ids from the one given, taking the fields not in the columns as default.
+
+    Rows are inserted with executemany rather than bulk_create, as building model instances for each row would
+    take longer than inserting them.
+    """
+
+    if not columns:
+        return 0
+    count = len(next(iter(columns.values())))
+    fields = [field for field in model._meta.concrete_fields if not field.primary_key]
+    defaults = {
+        field.name: field.get_db_prep_save(field.get_default(), connection)
+        for field in fields if field.name not in columns
+    }
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        connection.ops.quote_name(model._meta.db_table),
+        ', '.join(connection.ops.quote_name(column) for column in ['id'] + [field.column for field in fields]),
+        ', '.join(['%s'] * (len(fields) + 1))
+    )
+    with connection.cursor() as cursor:
+        for start in range(0, count, batch_size):
+            end = min(start + batch_size, count)
+            values = [
+                columns[field.name][start:end].tolist() if field.name in columns else [defaults[field.name]] * (end - start)
+                for field in fields
+            ]
+            cursor.executemany(sql, list(zip(range(first_id + start, first_id + end), *values)))
+    return count
+
+def get_word_columns(search_names, first_club_id):
+    """Return the columns of the words of the search names of clubs, given in order from the club with the given id.
+
+    The words are in the order of their unique index with the club, which is then filled from one end.
+    """
+
+    words, club_ids = [], []
+    for club_id, search_name in enumerate(search_names, first_club_id):
+        for word in get_search_words(search_name):
+            words.append(word)
+            club_ids.append(club_id)
+    words, club_ids = numpy.array(words, dtype=str), numpy.array(club_ids, dtype=int)
+    order = numpy.lexsort((club_ids, words))
+    return {'word': words[order], 'club': club_ids[order]} if len(words) else {}
+
+def restore_snapshot(columns, batch_size=10000):
+    """Insert the rows of a snapshot after those in the database, returning how many of each model there were."""
+
+    user_columns = get_model_columns(columns, User)
+    club_columns = get_model_columns(columns, Club)
+    member_columns = get_model_columns(columns, Club_Member)
+    # Hashing is slow by design, so every restored user shares the hash of the one password.
+    user_columns['password'] = numpy.full(len(user_columns['email']), make_password(PASSWORD))
+
+    with transaction.atomic():
+        first_user_id = get_next_id(User)
+        first_club_id = get_next_id(Club)
+        first_member_id = get_next_id(Club_Member)
+        # In the order of the unique index of users and clubs, which is then filled from one end.
+        order = numpy.lexsort((member_columns['club'], member_columns['user']))
+        member_columns = {
+            'user': member_columns['user'][order] + first_user_id,
+            'club': member_columns['club'][order] + first_club_id,
+            'authorization': member_columns['authorization'][order],
+            # Copies of the fields of the users the members of a club are sorted by.
+            'search_name': user_columns['search_name'][member_columns['user'][order]],
+            'chess_experience_level': user_columns['chess_experience_level'][member_columns['user'][order]],
+        }
+        counts = []
+        for model, first_id, model_columns in [
+            (User, first_user_id, user_columns),
+            (Club, first_club_id, club_columns),
+            (Club_Member, first_member_id, member_columns),
+        ]:
+            # Building an index from all the rows at once is quicker than adding each row to it.
+            with indexes_dropped(model):
+                counts.append(insert_rows(model, first_id, model_columns, batch_size))
+        # The words of the names of the clubs, which they are searched by.
+        insert_rows(
+            Club_Word, get_next_id(Club_Word), get_word_columns(club_columns.get('search_name', []), first_club_id),
+            batch_size
+        )
+        # Rows inserted with their ids leave the sequences of databases that have them behind.
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), SNAPSHOT_MODELS):
+                cursor.execute(sql)
+    return tuple(counts)
@@ -0,0 +1,88 @@
+"""Template tags for caching fragments under the versions of the users and clubs they show."""
+from clubs.caches import cache_fragment, get_cached_fragment, get_fragment_cache_key, get_versions
+from django import template
+from django.db.models import Model
+from django.template.base import token_kwargs
+
+register = template.Library()
+
+VERSIONED_KINDS = ('user', 'club')
+
+def get_object_ids(value):
+    """Get the ids of a user or club, a list of them, or a list of their ids, leaving out anonymous users."""
+
+    if value is None or isinstance(value, str):
+        return []
+    if isinstance(value, Model):
+        return [] if value.pk is None else [value.pk]
+    if isinstance(value, int):
+        return [value]
+    if isinstance(value, dict):
+        return get_object_ids(value.get('id'))
+    try:
+        return [object_id for item in value for object_id in get_object_ids(item)]
+    except TypeError:
+        # An anonymous user, which has no version.
+        return []
+
+def get_vary_value(value):
+    """Get a value that a fragment varies on in a form that is the same for the same data on every render."""
+
+    if isinstance(value, Model):
+        return (value._meta.label, value.pk)
+    if isinstance(value, (list, tuple)):
+        return tuple(get_vary_value(item) for item in value)
+    return value
+
+class VersionedCacheNode(template.Node):
+    """Node rendering a fragment from the cache, unless a user or club it shows has changed since."""
+
+    def __init__(self, nodelist, fragment_name, vary_on, versioned_on):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+        self.versioned_on = versioned_on
+
+    def render(self, context):
+        vary_on = [get_vary_value(value.resolve(context)) for value in self.vary_on]
+        versions = []
+        for kind, value in self.versioned_on.items():
+            object_ids = get_object_ids(value.resolve(context))
+            object_versions = get_versions(kind, object_ids)
+            versions.extend((kind, object_id, object_versions.get(object_id)) for object_id in object_ids)
+
+        key = get_fragment_cache_key(self.fragment_name, vary_on, versions)
+        fragment = get_cached_fragment(key)
+        if fragment is None:
+            fragment = self.nodelist.render(context)
+            cache_fragment(key, fragment)
+        return fragment
+
+@register.tag('versionedcache')
+def do_versioned_cache(parser, token):
+    """Cache a fragment until one of the users or clubs it shows is written to.
+
+    Usage: {% versionedcache fragment_name [vary_on ...] [user=users] [club=clubs] %} ... {% endversionedcache %}
+    The users and clubs may be objects, ids, or lists of either.
+    """
+
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise template.TemplateSyntaxError(f"'{bits[0]}' tag requires at least a fragment name.")
+    nodelist = parser.parse(('endversionedcache',))
+    parser.delete_first_token()
+
+    vary_on = []
+    versioned_on = {}
+    remaining_bits = bits[2:]
+    while remaining_bits:
+        kwarg = token_kwargs(remaining_bits, parser)
+        if kwarg:
+            kind, value = kwarg.popitem()
+            if kind not in VERSIONED_KINDS:
+                raise template.TemplateSyntaxError(f"'{bits[0]}' tag only has versions of {', '.join(VERSIONED_KINDS)}.")
+            versioned_on[kind] = value
+        else:
+            vary_on.append(parser.compile_filter(remaining_bits.pop(0)))
+
+    return VersionedCacheNode(nodelist, bits[1], vary_on, versioned_on)
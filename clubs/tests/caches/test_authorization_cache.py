@@ -0,0 +1,104 @@
+"""Unit tests for the authorization cache."""
+from clubs.caches import get_authorization_cache_stats, reset_authorization_cache_stats
+from clubs.helpers import get_authorization, get_authorization_text, remove_user_from_club, set_authorization
+from clubs.models import Club, Club_Member, User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHES, CACHE_STATS_SAMPLE_RATE=1)
+class AuthorizationCacheTestCase(TestCase):
+    """Unit tests for the authorization cache."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json'
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.get(email='bobsmith@example.org')
+        self.member = User.objects.get(email='bethsmith@example.org')
+        self.outsider = User.objects.get(email='johnsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        self.club_member = Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        reset_authorization_cache_stats()
+
+    def test_authorization_is_only_queried_once(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_authorization(self.member, self.club), Club_Member.MEMBER)
+            self.assertEqual(get_authorization(self.member, self.club), Club_Member.MEMBER)
+            self.assertEqual(get_authorization_text(self.member, self.club), 'Member')
+
+    def test_users_outside_the_club_are_cached(self):
+        with self.assertNumQueries(1):
+            self.assertIsNone(get_authorization(self.outsider, self.club))
+            self.assertIsNone(get_authorization_text(self.outsider, self.club))
+
+    def test_hits_and_misses_are_counted(self):
+        get_authorization(self.member, self.club)
+        get_authorization(self.member, self.club)
+        get_authorization(self.member, self.club)
+        stats = get_authorization_cache_stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+    @override_settings(CACHE_STATS_SAMPLE_RATE=0)
+    def test_lookups_outside_the_sample_are_not_counted(self):
+        get_authorization(self.member, self.club)
+        get_authorization(self.member, self.club)
+        self.assertEqual(get_authorization_cache_stats(), {'hits': 0, 'misses': 0, 'hit_rate': 0.0})
+
+    def test_set_authorization_invalidates_cache(self):
+        get_authorization(self.member, self.club)
+        set_authorization(self.member, self.club, Club_Member.OFFICER)
+        self.assertEqual(get_authorization(self.member, self.club), Club_Member.OFFICER)
+
+    def test_remove_user_from_club_invalidates_cache(self):
+        get_authorization(self.member, self.club)
+        remove_user_from_club(self.member, self.club)
+        self.assertIsNone(get_authorization(self.member, self.club))
+
+    def test_saving_club_member_invalidates_cache(self):
+        get_authorization(self.member, self.club)
+        self.club_member.authorization = Club_Member.OFFICER
+        self.club_member.save()
+        self.assertEqual(get_authorization(self.member, self.club), Club_Member.OFFICER)
+
+    def test_creating_club_member_invalidates_cache(self):
+        get_authorization(self.outsider, self.club)
+        Club_Member.objects.create(user=self.outsider, authorization=Club_Member.APPLICANT, club=self.club)
+        self.assertEqual(get_authorization(self.outsider, self.club), Club_Member.APPLICANT)
+
+    def test_moving_club_member_invalidates_previous_user(self):
+        get_authorization(self.member, self.club)
+        self.club_member.user = self.outsider
+        self.club_member.save()
+        self.assertIsNone(get_authorization(self.member, self.club))
+
+    def test_bulk_update_invalidates_cache(self):
+        get_authorization(self.owner, self.club)
+        get_authorization(self.member, self.club)
+        Club_Member.objects.filter(club=self.club).update(authorization=Club_Member.APPLICANT)
+        self.assertEqual(get_authorization(self.owner, self.club), Club_Member.APPLICANT)
+        self.assertEqual(get_authorization(self.member, self.club), Club_Member.APPLICANT)
+
+    def test_bulk_create_invalidates_cache(self):
+        get_authorization(self.outsider, self.club)
+        Club_Member.objects.bulk_create([Club_Member(user=self.outsider, authorization=Club_Member.MEMBER, club=self.club)])
+        self.assertEqual(get_authorization(self.outsider, self.club), Club_Member.MEMBER)
+
+    def test_deleting_club_invalidates_cache(self):
+        club_id = self.club.id
+        get_authorization(self.member, self.club)
+        self.club.delete()
+        self.club.id = club_id
+        self.assertIsNone(get_authorization(self.member, self.club))
@@ -0,0 +1,111 @@
+"""Unit tests for the template fragment cache."""
+from clubs.caches import get_fragment_cache_stats, get_versions, reset_fragment_cache_stats
+from clubs.models import Club, Club_Member, User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from io import StringIO
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+USER_NAMES_TEMPLATE = (
+    '{% load fragment_caches %}'
+    '{% versionedcache user_names title user=users %}'
+    '{{ title }}:{% for user in users %} {{ user.get_full_name }}{% endfor %}'
+    '{% endversionedcache %}'
+)
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHES, CACHE_STATS_SAMPLE_RATE=1)
+class FragmentCacheTestCase(TestCase):
+    """Unit tests for the template fragment cache."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.get(email='bobsmith@example.org')
+        self.other_user = User.objects.get(email='bethsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.other_club = Club.objects.get(name='Flying Orangutans 2')
+        self.club_member = Club_Member.objects.create(user=self.user, authorization=Club_Member.OWNER, club=self.club)
+        reset_fragment_cache_stats()
+
+    def render(self, users, title='Members'):
+        return Template(USER_NAMES_TEMPLATE).render(Context({'users': users, 'title': title}))
+
+    def test_fragment_is_rendered_once(self):
+        users = [self.user, self.other_user]
+        self.assertEqual(self.render(users), 'Members: Bob Smith Beth Smith')
+        self.user.first_name = 'Robert'
+        # Not saved, so the cached fragment is still up to date with the database.
+        self.assertEqual(self.render(users), 'Members: Bob Smith Beth Smith')
+        self.assertEqual(get_fragment_cache_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_fragment_varies_on_its_values_and_objects(self):
+        self.assertEqual(self.render([self.user]), 'Members: Bob Smith')
+        self.assertEqual(self.render([self.user], title='Owners'), 'Owners: Bob Smith')
+        self.assertEqual(self.render([self.other_user]), 'Members: Beth Smith')
+        self.assertEqual(get_fragment_cache_stats()['hits'], 0)
+
+    def test_fragment_varies_on_the_order_of_its_objects(self):
+        self.assertEqual(self.render([self.user, self.other_user]), 'Members: Bob Smith Beth Smith')
+        self.assertEqual(self.render([self.other_user, self.user]), 'Members: Beth Smith Bob Smith')
+        self.assertEqual(get_fragment_cache_stats()['hits'], 0)
+
+    def test_saving_a_user_renders_the_fragment_again(self):
+        self.render([self.user])
+        self.user.first_name = 'Robert'
+        self.user.save()
+        self.assertEqual(self.render([self.user]), 'Members: Robert Smith')
+
+    def test_membership_writes_bump_user_and_club_versions(self):
+        user_versions = get_versions('user', [self.user.id])
+        club_versions = get_versions('club', [self.club.id])
+        self.club_member.authorization = Club_Member.OFFICER
+        self.club_member.save()
+        self.assertNotEqual(get_versions('user', [self.user.id]), user_versions)
+        self.assertNotEqual(get_versions('club', [self.club.id]), club_versions)
+
+        club_versions = get_versions('club', [self.club.id])
+        Club_Member.objects.filter(club=self.club).update(authorization=Club_Member.MEMBER)
+        self.assertNotEqual(get_versions('club', [self.club.id]), club_versions)
+
+    def test_evicted_version_does_not_restart_from_an_old_value(self):
+        old_version = get_versions('club', [self.club.id])[self.club.id]
+        cache.delete(f'version:club:{self.club.id}')
+        self.assertGreater(get_versions('club', [self.club.id])[self.club.id], old_version)
+
+    def test_only_user_and_club_versions_can_be_used(self):
+        with self.assertRaises(TemplateSyntaxError):
+            Template('{% load fragment_caches %}{% versionedcache name member=users %}{% endversionedcache %}')
+
+    def test_renaming_a_club_renders_the_dashboard_cards_again(self):
+        self.client.login(email=self.user.email, password='Password123')
+        self.client.get(reverse('dashboard'))
+        self.club.name = 'Kerbal Chess Club'
+        self.club.save()
+        self.other_club.name = 'Pawn Stars'
+        self.other_club.save()
+        response = self.client.get(reverse('dashboard'))
+        self.assertContains(response, 'Kerbal Chess Club', count=2)
+        self.assertContains(response, 'Pawn Stars', count=1)
+        self.assertNotContains(response, 'Flying Orangutans')
+
+    def test_cache_stats_reports_fragment_hit_rate(self):
+        self.render([self.user])
+        self.render([self.user])
+        output = StringIO()
+        call_command('cache_stats', reset=True, stdout=output)
+        self.assertIn('Fragment cache: 1 hits, 1 misses, 50.0% hit rate', output.getvalue())
+        self.assertEqual(get_fragment_cache_stats()['hits'], 0)
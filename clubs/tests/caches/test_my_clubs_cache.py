@@ -0,0 +1,94 @@
+"""Unit tests for the my clubs cache."""
+from clubs.helpers import get_my_clubs_menu
+from clubs.models import Club, Club_Member, User
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHES)
+class MyClubsCacheTestCase(TestCase):
+    """Unit tests for the my clubs cache."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.get(email='bobsmith@example.org')
+        self.other_user = User.objects.get(email='bethsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.second_club = Club.objects.get(name='Flying Orangutans 2')
+        self.club_member = Club_Member.objects.create(user=self.user, authorization=Club_Member.OWNER, club=self.club)
+
+    def assert_my_clubs(self, user, clubs):
+        self.assertEqual(get_my_clubs_menu(user), [{'id': club.id, 'name': club.name} for club in clubs])
+
+    def test_my_clubs_are_only_queried_once(self):
+        with self.assertNumQueries(1):
+            self.assert_my_clubs(self.user, [self.club])
+            self.assert_my_clubs(self.user, [self.club])
+
+    def test_anonymous_user_has_no_clubs(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(get_my_clubs_menu(AnonymousUser()), [])
+
+    def test_joining_a_club_invalidates_my_clubs(self):
+        self.assert_my_clubs(self.user, [self.club])
+        Club_Member.objects.create(user=self.user, authorization=Club_Member.APPLICANT, club=self.second_club)
+        self.assert_my_clubs(self.user, [self.club, self.second_club])
+
+    def test_leaving_a_club_invalidates_my_clubs(self):
+        self.assert_my_clubs(self.user, [self.club])
+        self.club_member.delete()
+        self.assert_my_clubs(self.user, [])
+
+    def test_deleting_a_club_invalidates_my_clubs(self):
+        self.assert_my_clubs(self.user, [self.club])
+        self.club.delete()
+        self.assert_my_clubs(self.user, [])
+
+    def test_renaming_a_club_invalidates_my_clubs(self):
+        self.assert_my_clubs(self.user, [self.club])
+        self.club.name = 'Kerbal Chess Club'
+        self.club.save()
+        self.assert_my_clubs(self.user, [self.club])
+
+    def test_moving_a_membership_invalidates_my_clubs_of_both_users(self):
+        self.assert_my_clubs(self.user, [self.club])
+        self.assert_my_clubs(self.other_user, [])
+        self.club_member.user = self.other_user
+        self.club_member.save()
+        self.assert_my_clubs(self.user, [])
+        self.assert_my_clubs(self.other_user, [self.club])
+
+    def test_bulk_writes_invalidate_my_clubs(self):
+        self.assert_my_clubs(self.other_user, [])
+        Club_Member.objects.bulk_create([
+            Club_Member(user=self.other_user, authorization=Club_Member.MEMBER, club=self.club)
+        ])
+        self.assert_my_clubs(self.other_user, [self.club])
+        Club_Member.objects.filter(user=self.other_user).update(club=self.second_club)
+        self.assert_my_clubs(self.other_user, [self.second_club])
+        self.assert_my_clubs(self.user, [self.club])
+
+    def test_navbar_lists_my_clubs_from_the_cache(self):
+        self.client.login(email=self.user.email, password='Password123')
+        url = reverse('update_user')
+        self.client.get(url)
+        response = self.client.get(url)
+        self.assertContains(response, reverse('show_club', kwargs={'club_id': self.club.id}))
+        self.assertEqual(list(response.context['my_clubs']), [{'id': self.club.id, 'name': self.club.name}])
+        with self.assertNumQueries(2):
+            # Only the session and the user, the clubs of the user come from the cache.
+            self.client.get(url)
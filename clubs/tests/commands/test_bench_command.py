@@ -0,0 +1,64 @@
+"""Unit tests for the bench command."""
+from clubs.management.commands.bench import BENCHMARKS, Command
+from clubs.models import Club, Club_Member, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import json
+
+class BenchCommandTestCase(TestCase):
+    """Unit tests for the bench command."""
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'bench.json'
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def bench(self):
+        output = StringIO()
+        call_command(
+            'bench', clubs=5, users=60, memberships_per_club=20, repeat=2, output=str(self.path), stdout=output
+        )
+        return output.getvalue()
+
+    def test_benchmarks_every_url_within_its_budget(self):
+        output = self.bench()
+        self.assertIn('Every URL answered as expected within its query budget', output)
+        results = json.loads(self.path.read_text())
+        self.assertEqual(results['dataset'], {'clubs': 5, 'users': 60, 'memberships_per_club': 20})
+        self.assertEqual(results['repeat'], 2)
+        self.assertEqual(set(results['results']), {name for name, *_ in BENCHMARKS})
+        for result in results['results'].values():
+            self.assertLessEqual(result['p50_ms'], result['p95_ms'])
+            self.assertLessEqual(result['queries'], result['query_budget'])
+            self.assertEqual(result['status'], result['expected_status'])
+
+    def test_dataset_is_rolled_back(self):
+        self.bench()
+        self.assertEqual(User.objects.count(), 0)
+        self.assertEqual(Club.objects.count(), 0)
+        self.assertEqual(Club_Member.objects.count(), 0)
+
+    def test_urls_with_unexpected_statuses_are_found(self):
+        results = {
+            'home': {'status': 200, 'expected_status': 200},
+            'leave_club': {'status': 403, 'expected_status': 302},
+        }
+        self.assertEqual(Command().get_unexpected_statuses(results), ['leave_club'])
+
+    def test_urls_over_budget_are_found(self):
+        results = {
+            'home': {'queries': 0, 'query_budget': 0},
+            'dashboard': {'queries': 5, 'query_budget': 4},
+        }
+        self.assertEqual(Command().get_over_budget(results), ['dashboard'])
+
+    def test_seeded_database_is_not_benchmarked(self):
+        call_command('seed', clubs=1, users=30, memberships_per_club=5, stdout=StringIO())
+        with self.assertRaises(CommandError):
+            self.bench()
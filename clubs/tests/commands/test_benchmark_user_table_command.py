@@ -0,0 +1,20 @@
+"""Unit tests for the benchmark user table command."""
+from clubs.models import Club, User
+from django.core.management import call_command
+from django.test import TestCase
+from io import StringIO
+
+class BenchmarkUserTableCommandTestCase(TestCase):
+    """Unit tests for the benchmark user table command."""
+
+    def test_reports_cost_per_row_with_and_without_stored_hashes(self):
+        output = StringIO()
+        call_command('benchmark_user_table', rows=20, repeat=1, stdout=output)
+        self.assertIn('Rendered 20 rows hashing each email in', output.getvalue())
+        self.assertIn('Rendered 20 rows with the stored gravatar hashes in', output.getvalue())
+        self.assertIn('The stored hashes save', output.getvalue())
+
+    def test_benchmark_data_is_rolled_back(self):
+        call_command('benchmark_user_table', rows=20, repeat=1, stdout=StringIO())
+        self.assertEqual(User.objects.count(), 0)
+        self.assertEqual(Club.objects.count(), 0)
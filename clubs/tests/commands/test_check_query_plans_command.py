@@ -0,0 +1,45 @@
+"""Unit tests for the check query plans command."""
+from clubs.management.commands.check_query_plans import Command
+from clubs.models import Club, Club_Member, User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from io import StringIO
+
+class CheckQueryPlansCommandTestCase(TestCase):
+    """Unit tests for the check query plans command."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json'
+    ]
+
+    def setUp(self):
+        self.owner = User.objects.get(email='bobsmith@example.org')
+        self.member = User.objects.get(email='bethsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+
+    def test_no_helper_query_scans_a_table(self):
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        output = StringIO()
+        call_command('check_query_plans', stdout=output)
+        self.assertIn('No helper query scans a table.', output.getvalue())
+
+    def test_writes_are_rolled_back(self):
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.OFFICER, club=self.club)
+        call_command('check_query_plans', stdout=StringIO())
+        self.assertEqual(Club_Member.objects.get(user=self.member).authorization, Club_Member.OFFICER)
+
+    def test_walks_stopping_at_a_limit_are_scans(self):
+        plan = ['SCAN clubs_club USING INDEX club_search_name_id', 'SEARCH U0 USING INTEGER PRIMARY KEY (rowid=?)']
+        self.assertEqual(Command().get_scanned_tables(plan), {'clubs_club'})
+
+    def test_searches_are_not_scans(self):
+        plan = ['SEARCH clubs_club_member USING INDEX club_member_club_auth_user (club_id=?)']
+        self.assertEqual(Command().get_scanned_tables(plan), set())
+
+    def test_fails_without_club_members(self):
+        with self.assertRaises(CommandError):
+            call_command('check_query_plans', stdout=StringIO())
@@ -0,0 +1,106 @@
+"""Unit tests for the geocode clubs command."""
+from clubs.clusters import MAX_CLUSTER_ZOOM
+from clubs.geocoders import nominatim_circuit_breaker
+from clubs.geocoding import cache_location, get_address_key
+from clubs.models import Club, Club_Cluster
+from clubs.tests.helpers import StubGeocoder
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from io import StringIO
+from tempfile import TemporaryDirectory
+import json
+import os
+
+@override_settings(GEOCODER_RETRIES=0, GEOCODER_RETRY_DELAY=0)
+class GeocodeClubsCommandTestCase(TestCase):
+    """Unit tests for the geocode clubs command."""
+
+    def setUp(self):
+        nominatim_circuit_breaker.reset()
+        self.directory = TemporaryDirectory()
+        self.checkpoint = os.path.join(self.directory.name, 'checkpoint.json')
+        self.locations = {}
+        for i in range(12):
+            # Every other club shares its address with the one before.
+            address = f'{i // 2} Chess Street'
+            Club.objects.create(
+                name=f'Club {i}', address=address, city='London', postal_code='WC2B 4BG',
+                country='GB', description='A club'
+            )
+            if i < 10:
+                self.locations[f'{address}, London, WC2B 4BG, GB'] = (51.5 + i // 2 / 100, -0.1)
+
+    def tearDown(self):
+        nominatim_circuit_breaker.reset()
+        self.directory.cleanup()
+
+    def geocode_clubs(self, **options):
+        output = StringIO()
+        call_command('geocode_clubs', workers=3, batch_size=4, stdout=output, **options)
+        return output.getvalue()
+
+    def test_pending_clubs_are_geocoded(self):
+        with StubGeocoder(self.locations) as geocoder:
+            output = self.geocode_clubs()
+        # Each address is only asked about once.
+        self.assertEqual(len(geocoder.queries), 6)
+        self.assertEqual(Club.objects.filter(geocode_status=Club.GEOCODED).count(), 10)
+        self.assertEqual(Club.objects.filter(geocode_status=Club.NOT_FOUND).count(), 2)
+        self.assertIn('Geocoded 12 clubs: 10 found, 2 not found, 0 failed', output)
+        club = Club.objects.get(name='Club 3')
+        self.assertIsNotNone(club.grid_cell)
+        self.assertEqual(club.latitude, 51.51)
+
+    def test_clusters_are_rebuilt(self):
+        with StubGeocoder(self.locations):
+            self.geocode_clubs()
+        clusters = Club_Cluster.objects.filter(zoom=0)
+        self.assertEqual(sum(cluster.count for cluster in clusters), 10)
+        self.assertEqual(Club_Cluster.objects.filter(zoom=MAX_CLUSTER_ZOOM).count(), 5)
+
+    def test_only_pending_clubs_are_geocoded_unless_asked(self):
+        with StubGeocoder(self.locations):
+            self.geocode_clubs()
+        with StubGeocoder(self.locations) as geocoder:
+            self.geocode_clubs()
+        self.assertEqual(geocoder.queries, [])
+        with StubGeocoder(self.locations) as geocoder:
+            output = self.geocode_clubs(not_found=True)
+        # Known not to be found from the geocode cache.
+        self.assertEqual(geocoder.queries, [])
+        self.assertIn('Geocoded 2 clubs: 0 found, 2 not found', output)
+
+    def test_progress_is_checkpointed_and_resumed(self):
+        with StubGeocoder(self.locations):
+            self.geocode_clubs(checkpoint=self.checkpoint)
+        with open(self.checkpoint) as file:
+            self.assertEqual(json.load(file)['last_id'], Club.objects.order_by('id').last().id)
+
+        Club.objects.update(geocode_status=Club.PENDING)
+        with StubGeocoder(self.locations):
+            output = self.geocode_clubs(checkpoint=self.checkpoint)
+        self.assertIn('Geocoded 0 clubs', output)
+        with StubGeocoder(self.locations):
+            output = self.geocode_clubs(checkpoint=self.checkpoint, restart=True)
+        self.assertIn('Geocoded 12 clubs', output)
+
+    @override_settings(GEOCODER_CIRCUIT_FAILURES=2)
+    def test_failing_geocoder_stops_the_command(self):
+        with StubGeocoder(self.locations, status_codes=[503] * 20):
+            with self.assertRaises(CommandError):
+                self.geocode_clubs(checkpoint=self.checkpoint)
+        self.assertFalse(os.path.exists(self.checkpoint))
+        self.assertEqual(Club.objects.filter(geocode_status=Club.PENDING).count(), 12)
+
+    @override_settings(GEOCODER_CIRCUIT_FAILURES=2)
+    def test_clusters_are_rebuilt_when_the_command_stops(self):
+        # The first batch is geocoded from the geocode cache, before the geocoder fails on the second.
+        for club in Club.objects.order_by('id')[:4]:
+            cache_location(get_address_key(club), (51.5, -0.1))
+        with StubGeocoder(self.locations, status_codes=[503] * 20):
+            with self.assertRaises(CommandError):
+                self.geocode_clubs(checkpoint=self.checkpoint)
+        self.assertEqual(Club.objects.filter(geocode_status=Club.GEOCODED).count(), 4)
+        clusters = Club_Cluster.objects.filter(zoom=0)
+        self.assertEqual(sum(cluster.count for cluster in clusters), 4)
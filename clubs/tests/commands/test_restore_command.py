@@ -0,0 +1,76 @@
+"""Unit tests for the restore command."""
+from clubs.models import Club, Club_Member, Club_Word, User
+from clubs.snapshots import generate_snapshot, write_snapshot
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+class RestoreCommandTestCase(TestCase):
+    """Unit tests for the restore command."""
+
+    fixtures = ['clubs/tests/fixtures/default_user.json', 'clubs/tests/fixtures/default_club.json']
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'dataset.snapshot'
+        write_snapshot(self.path, generate_snapshot(30, 4, 5, workers=1, shard_size=7))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def restore(self):
+        output = StringIO()
+        call_command('restore', str(self.path), batch_size=7, stdout=output)
+        return output.getvalue()
+
+    def test_restores_snapshot_after_existing_rows(self):
+        output = self.restore()
+        self.assertIn('Restored 33 users, 4 clubs and 29 memberships', output)
+        self.assertEqual(User.objects.count(), 34)
+        self.assertEqual(Club.objects.count(), 5)
+        self.assertEqual(Club_Member.objects.count(), 29)
+        for club in Club.objects.exclude(name='Flying Orangutans'):
+            self.assertEqual(club.club_member_set.filter(authorization=Club_Member.OWNER).count(), 1)
+
+    def test_restored_rows_have_derived_fields(self):
+        self.restore()
+        for user in User.objects.all():
+            self.assertEqual(user.search_name, user.get_search_name())
+            self.assertEqual(user.chess_experience_level, user.get_chess_experience_level())
+            self.assertEqual(user.gravatar_hash, user.get_gravatar_hash())
+        for club in Club.objects.all():
+            self.assertEqual(club.search_name, club.get_search_name())
+            self.assertEqual(club.geocode_status, Club.PENDING)
+            self.assertEqual(
+                set(Club_Word.objects.filter(club=club).values_list('word', flat=True)), set(club.search_name.split())
+            )
+
+    def test_test_users_are_restored(self):
+        self.restore()
+        jeb = User.objects.get(email='jeb@example.org')
+        self.assertTrue(jeb.check_password('Password123'))
+        self.assertTrue(jeb.is_active)
+        kerbal = Club.objects.get(name='Kerbal Chess Club')
+        test_members = kerbal.club_member_set.filter(
+            user__email__in=['jeb@example.org', 'val@example.org', 'billie@example.org'],
+            authorization=Club_Member.MEMBER
+        )
+        self.assertEqual(test_members.count(), 3)
+        self.assertTrue(Club_Member.objects.filter(
+            user__email='val@example.org', authorization=Club_Member.OWNER
+        ).exists())
+
+    def test_restoring_twice_is_rejected(self):
+        self.restore()
+        with self.assertRaises(CommandError):
+            self.restore()
+        self.assertEqual(User.objects.count(), 34)
+        self.assertEqual(Club_Member.objects.count(), 29)
+
+    def test_unreadable_snapshot_is_rejected(self):
+        self.path.write_text('Not a snapshot')
+        with self.assertRaises(CommandError):
+            self.restore()
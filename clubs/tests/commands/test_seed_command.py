@@ -0,0 +1,102 @@
+"""Unit tests for the seed command."""
+from clubs.models import Club, Club_Member, User
+from clubs.snapshots import generate_snapshot, read_snapshot
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import numpy
+
+class SeedCommandTestCase(TestCase):
+    """Unit tests for the seed command."""
+
+    def seed(self, **options):
+        output = StringIO()
+        call_command('seed', clubs=4, users=30, memberships_per_club=5, batch_size=7, stdout=output, **options)
+        return output.getvalue()
+
+    def test_seeds_requested_numbers_of_rows(self):
+        output = self.seed()
+        self.assertIn('Seeded 30 users, 4 clubs and 24 memberships', output)
+        self.assertEqual(User.objects.count(), 33)
+        self.assertEqual(Club.objects.count(), 4)
+        # The random memberships and those of the test users.
+        self.assertEqual(Club_Member.objects.count(), 24 + 5)
+        for club in Club.objects.all():
+            self.assertEqual(club.club_member_set.filter(authorization=Club_Member.OWNER).count(), 1)
+
+    def test_seeded_rows_have_derived_fields(self):
+        self.seed()
+        for user in User.objects.all():
+            self.assertEqual(user.search_name, user.get_search_name())
+            self.assertEqual(user.chess_experience_level, user.get_chess_experience_level())
+            self.assertEqual(user.gravatar_hash, user.get_gravatar_hash())
+        for club in Club.objects.all():
+            self.assertEqual(club.search_name, club.get_search_name())
+            self.assertEqual(club.geocode_status, Club.PENDING)
+
+    def test_users_share_the_password(self):
+        self.seed()
+        self.assertEqual(User.objects.values('password').distinct().count(), 1)
+        self.assertTrue(User.objects.get(email='jeb@example.org').check_password('Password123'))
+
+    def test_test_users_are_in_the_first_clubs(self):
+        self.seed()
+        kerbal = Club.objects.get(name='Kerbal Chess Club')
+        members = kerbal.club_member_set.filter(authorization=Club_Member.MEMBER)
+        self.assertTrue(members.filter(user__email='jeb@example.org').exists())
+        self.assertTrue(members.filter(user__email='val@example.org').exists())
+        self.assertTrue(members.filter(user__email='billie@example.org').exists())
+        self.assertTrue(Club_Member.objects.filter(
+            user__email='val@example.org', authorization=Club_Member.OWNER
+        ).exists())
+
+    def test_seeding_again_adds_random_rows_only(self):
+        self.seed()
+        self.seed()
+        self.assertEqual(User.objects.count(), 63)
+        self.assertEqual(Club.objects.count(), 8)
+        self.assertEqual(Club.objects.filter(name='Kerbal Chess Club').count(), 1)
+
+    def test_seeded_rows_are_those_of_the_snapshot_of_the_same_seed(self):
+        self.seed()
+        columns = generate_snapshot(30, 4, 5)
+        self.assertEqual(
+            list(User.objects.order_by('id').values_list('email', flat=True)), columns['user.email'].tolist()
+        )
+        self.assertEqual(list(Club.objects.order_by('id').values_list('name', flat=True)), columns['club.name'].tolist())
+
+    def test_ids_of_unseeded_rows_are_not_used_again(self):
+        self.seed()
+        last_ids = [model.objects.order_by('id').last().id for model in [User, Club, Club_Member]]
+        call_command('unseed', stdout=StringIO())
+        self.seed()
+        for model, last_id in zip([User, Club, Club_Member], last_ids):
+            self.assertGreater(model.objects.order_by('id').first().id, last_id)
+        self.assertEqual(User.objects.create_user(email='new@example.org', first_name='New', last_name='User').id,
+            User.objects.order_by('id').last().id)
+
+    def test_more_memberships_per_club_than_other_users_is_rejected(self):
+        with self.assertRaises(CommandError):
+            call_command('seed', users=5, memberships_per_club=5, stdout=StringIO())
+        self.assertEqual(User.objects.count(), 0)
+
+    def test_snapshot_is_written_instead_of_seeding(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'dataset.snapshot'
+            output = self.seed(snapshot=str(path), workers=2)
+            columns = read_snapshot(path)
+        self.assertIn('Wrote 33 users, 4 clubs and 29 memberships', output)
+        self.assertEqual(User.objects.count(), 0)
+        self.assertEqual(len(columns['user.email']), 33)
+        self.assertEqual(columns['club.name'][0], 'Kerbal Chess Club')
+
+    def test_snapshot_only_depends_on_its_seed(self):
+        snapshot = generate_snapshot(30, 4, 5, seed=1, workers=1, shard_size=7)
+        same_snapshot = generate_snapshot(30, 4, 5, seed=1, workers=3, shard_size=7)
+        other_snapshot = generate_snapshot(30, 4, 5, seed=2, workers=1, shard_size=7)
+        for column, values in snapshot.items():
+            numpy.testing.assert_array_equal(values, same_snapshot[column])
+        self.assertFalse(numpy.array_equal(snapshot['user.email'], other_snapshot['user.email']))
@@ -0,0 +1,87 @@
+"""Unit tests for the unseed command."""
+from clubs.caches import get_versions
+from clubs.models import Club, Club_Cluster, Club_Member, Club_Word, User
+from django.contrib.admin.models import ADDITION, LogEntry
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from io import StringIO
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHES)
+class UnseedCommandTestCase(TestCase):
+    """Unit tests for the unseed command."""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/other_users.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json',
+    ]
+
+    def setUp(self):
+        self.staff = User.objects.create_user(
+            first_name='Staff', last_name='User', email='staff@example.org', password='Password123', is_staff=True
+        )
+        club = Club.objects.get(name='Flying Orangutans')
+        Club_Member.objects.create(user=self.staff, club=club, authorization=Club_Member.OWNER)
+        Club_Member.objects.create(user=User.objects.get(id=1), club=club, authorization=Club_Member.MEMBER)
+        Club_Cluster.objects.create(zoom=0, x=0, y=0, count=1, latitude_sum=51.5, longitude_sum=-0.1)
+        User.objects.get(id=1).groups.add(Group.objects.create(name='Players'))
+        LogEntry.objects.log_action(
+            user_id=1, content_type_id=ContentType.objects.get_for_model(Club).id, object_id=club.id,
+            object_repr=str(club), action_flag=ADDITION
+        )
+
+    def tearDown(self):
+        cache.clear()
+
+    def assert_unseeded(self):
+        self.assertEqual(list(User.objects.all()), [self.staff])
+        self.assertFalse(Club.objects.exists())
+        self.assertFalse(Club_Member.objects.exists())
+        self.assertFalse(Club_Cluster.objects.exists())
+        self.assertFalse(Club_Word.objects.exists())
+        self.assertTrue(Group.objects.exists())
+        self.assertFalse(LogEntry.objects.exists())
+
+    def test_unseed_deletes_all_but_staff(self):
+        output = StringIO()
+        call_command('unseed', stdout=output)
+        self.assert_unseeded()
+        self.assertIn('Deleted 2 club members in', output.getvalue())
+        self.assertIn('Unseeded in', output.getvalue())
+
+    def test_unseed_truncating_deletes_all_but_staff(self):
+        output = StringIO()
+        call_command('unseed', truncate=True, stdout=output)
+        self.assert_unseeded()
+        self.assertIn('club members and clubs in', output.getvalue())
+
+    def test_unseed_invalidates_the_cached_clubs_of_the_users_kept(self):
+        cache.set(f'my_clubs:{self.staff.id}', ['Flying Orangutans'])
+        call_command('unseed', stdout=StringIO())
+        self.assertIsNone(cache.get(f'my_clubs:{self.staff.id}'))
+
+    def test_unseed_invalidates_what_is_cached_about_the_deleted_rows(self):
+        user = User.objects.get(id=1)
+        club = Club.objects.get(name='Flying Orangutans')
+        cache.set(f'my_clubs:{user.id}', ['Flying Orangutans'])
+        cache.set(f'authorization:{user.id}:{club.id}', Club_Member.MEMBER)
+        versions = (get_versions('user', [user.id]), get_versions('club', [club.id]))
+        call_command('unseed', stdout=StringIO())
+        self.assertIsNone(cache.get(f'my_clubs:{user.id}'))
+        self.assertIsNone(cache.get(f'authorization:{user.id}:{club.id}'))
+        self.assertNotEqual((get_versions('user', [user.id]), get_versions('club', [club.id])), versions)
+
+    def test_unseed_keeps_the_rest_of_the_cache(self):
+        cache.set('other_app:key', 'value')
+        call_command('unseed', stdout=StringIO())
+        self.assertEqual(cache.get('other_app:key'), 'value')
@@ -1,9 +1,14 @@
 """Unit tests for the create club form."""
 from clubs.forms import CreateClubForm
+from clubs.geocoders import nominatim_circuit_breaker
 from clubs.models import Club
-from django.test import TestCase
+from clubs.tests.helpers import StubGeocoder
+from django.conf import settings
+from django.test import TestCase, override_settings
 
+FULL_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
 
+@override_settings(GEOCODING_WORKERS=0)
 class CreateClubFormTestCase(TestCase):
     """Unit tests for the create club form."""
 
@@ -51,44 +56,45 @@ class CreateClubFormTestCase(TestCase):
         self.assertEqual(club.country, 'GB')
         self.assertEqual(club.description, 'Aim to get the best orangutans out there')
 
-    """Negative tests"""
+    def test_form_geocodes_club_once_saved(self):
+        """Test that the club is geocoded after the transaction creating it commits"""
 
-    def test_form_must_not_save_correctly_bad_address(self):
-        self.valid_form_input['address'] = "badadress"
         form = CreateClubForm(data=self.valid_form_input)
-        before_count = Club.objects.count()
-        # assume for now form is valid may need to add validators to forms.py
-        with self.assertRaises(IndexError):
-            form.save()
-        after_count = Club.objects.count()
-        self.assertEqual(after_count, before_count)
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            with self.captureOnCommitCallbacks(execute=True):
+                club = form.save()
+                self.assertEqual(geocoder.queries, [])
+        self.assertEqual(geocoder.queries, [FULL_ADDRESS])
+        club.refresh_from_db()
+        self.assertEqual(club.geocode_status, Club.GEOCODED)
+        self.assertEqual(club.latitude, 51.5128)
+        self.assertEqual(club.longitude, -0.1173)
 
-    def test_form_must_not_save_correctly_bad_city(self):
-        self.valid_form_input['address'] = "badcity"
-        form = CreateClubForm(data=self.valid_form_input)
-        before_count = Club.objects.count()
-        # assume for now form is valid may need to add validators to forms.py
-        with self.assertRaises(IndexError):
-            form.save()
-        after_count = Club.objects.count()
-        self.assertEqual(after_count, before_count)
+    """Negative tests"""
 
-    def test_form_must_not_save_correctly_bad_postalcode(self):
-        self.valid_form_input['address'] = "badpostalcode"
+    def test_form_saves_club_with_unknown_address(self):
+        self.valid_form_input['address'] = "badadress"
         form = CreateClubForm(data=self.valid_form_input)
         before_count = Club.objects.count()
-        # assume for now form is valid may need to add validators to forms.py
-        with self.assertRaises(IndexError):
-            form.save()
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            with self.captureOnCommitCallbacks(execute=True):
+                club = form.save()
         after_count = Club.objects.count()
-        self.assertEqual(after_count, before_count)
+        self.assertEqual(after_count, before_count + 1)
+        club.refresh_from_db()
+        self.assertEqual(club.geocode_status, Club.NOT_FOUND)
+        self.assertIsNone(club.latitude)
+        self.assertIsNone(club.longitude)
 
-    def test_form_must_not_save_correctly_bad_country(self):
-        self.valid_form_input['address'] = "badcountry"
+    @override_settings(GEOCODER_RETRY_DELAY=0)
+    def test_form_saves_club_when_geocoder_is_unreachable(self):
+        self.addCleanup(nominatim_circuit_breaker.reset)
         form = CreateClubForm(data=self.valid_form_input)
-        before_count = Club.objects.count()
-        # assume for now form is valid may need to add validators to forms.py
-        with self.assertRaises(IndexError):
-            form.save()
-        after_count = Club.objects.count()
-        self.assertEqual(after_count, before_count)
+        with StubGeocoder({}) as geocoder:
+            url = settings.GEOCODER_URL
+        with override_settings(GEOCODER_URL=url), self.assertLogs('clubs.geocoding', 'ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                club = form.save()
+        club.refresh_from_db()
+        self.assertEqual(club.geocode_status, Club.PENDING)
+        self.assertIsNone(club.latitude)
@@ -0,0 +1,99 @@
+"""Unit tests for the gazetteer geocoder."""
+from clubs.geocoders import GazetteerGeocoder
+from clubs.geocoding import geocode
+from clubs.models import Club
+from clubs.tests.helpers import StubGeocoder
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from io import StringIO
+from tempfile import TemporaryDirectory
+import os
+
+FULL_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
+
+# Rows of a GeoNames postal code file: country, postal code, place, five admin columns, latitude, longitude, accuracy.
+GEONAMES_ROWS = [
+    ['GB', 'WC2B 4BG', 'London', 'England', 'ENG', '', '', '', '', '51.5128', '-0.1173', '6'],
+    ['GB', 'WC2B', 'London', 'England', 'ENG', '', '', '', '', '51.5150', '-0.1200', '4'],
+    ['GB', 'M1 1AA', 'Manchester', 'England', 'ENG', '', '', '', '', '53.4800', '-2.2400', '6'],
+    ['GB', 'M1 1AB', 'Manchester', 'England', 'ENG', '', '', '', '', '53.4810', '-2.2420', '6'],
+    ['FR', '75001', 'Paris', 'Île-de-France', '11', '', '', '', '', '48.8630', '2.3360', '5'],
+]
+
+class GazetteerGeocoderTestCase(TestCase):
+    """Unit tests for the gazetteer geocoder."""
+
+    fixtures = ['clubs/tests/fixtures/default_club.json']
+
+    def setUp(self):
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.directory = TemporaryDirectory()
+        self.output = self.build(self.directory.name, GEONAMES_ROWS)
+        self.settings = override_settings(GAZETTEER_PATH=self.directory.name)
+        self.settings.enable()
+
+    def tearDown(self):
+        self.settings.disable()
+        self.directory.cleanup()
+
+    def build(self, path, rows):
+        source = os.path.join(self.directory.name, 'postal_codes.txt')
+        with open(source, 'w', encoding='utf-8') as file:
+            for row in rows:
+                file.write('\t'.join(row) + '\n')
+        output = StringIO()
+        call_command('build_gazetteer', source, output=path, stdout=output)
+        return output
+
+    def assert_location(self, location, latitude, longitude):
+        self.assertAlmostEqual(location[0], latitude, places=4)
+        self.assertAlmostEqual(location[1], longitude, places=4)
+
+    def test_build_reports_number_of_keys(self):
+        # Four postal codes, five without spaces, and three cities.
+        self.assertIn('Built a gazetteer of 8 postal codes and cities', self.output.getvalue())
+
+    def test_postal_code_is_found_however_it_is_written(self):
+        self.club.postal_code = 'wc2b4bg'
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 51.5128, -0.1173)
+
+    def test_outward_code_is_found_without_full_postal_code(self):
+        self.club.postal_code = 'WC2B 9ZZ'
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 51.5150, -0.1200)
+
+    def test_city_centre_is_found_without_postal_code(self):
+        self.club.postal_code = 'ZZ1 1ZZ'
+        self.club.city = 'manchester'
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 53.4805, -2.2410)
+
+    def test_city_of_another_country_is_not_found(self):
+        self.club.postal_code = '75001'
+        self.club.city = 'Paris'
+        self.assertIsNone(GazetteerGeocoder().geocode(self.club))
+        self.club.country = 'FR'
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 48.8630, 2.3360)
+
+    def test_nothing_is_found_without_a_gazetteer(self):
+        with override_settings(GAZETTEER_PATH=os.path.join(self.directory.name, 'missing')):
+            self.assertIsNone(GazetteerGeocoder().geocode(self.club))
+
+    def test_gazetteer_built_after_being_missing_is_found(self):
+        path = os.path.join(self.directory.name, 'later')
+        with override_settings(GAZETTEER_PATH=path):
+            self.assertIsNone(GazetteerGeocoder().geocode(self.club))
+            self.build(path, GEONAMES_ROWS)
+            self.assert_location(GazetteerGeocoder().geocode(self.club), 51.5128, -0.1173)
+
+    def test_gazetteer_built_again_is_found(self):
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 51.5128, -0.1173)
+        self.build(self.directory.name, [['GB', 'WC2B 4BG', 'London', '', '', '', '', '', '', '51.0', '-0.5', '6']])
+        self.assert_location(GazetteerGeocoder().geocode(self.club), 51.0, -0.5)
+
+    @override_settings(GEOCODERS=['clubs.geocoders.GazetteerGeocoder', 'clubs.geocoders.NominatimGeocoder'])
+    def test_nominatim_is_only_asked_about_addresses_the_gazetteer_does_not_know(self):
+        with StubGeocoder({'Unknown, Nowhere, ZZ1 1ZZ, GB': (50.0, -1.0)}) as geocoder:
+            self.assert_location(geocode(self.club), 51.5128, -0.1173)
+            self.assertEqual(geocoder.queries, [])
+            self.club.address, self.club.city, self.club.postal_code = 'Unknown', 'Nowhere', 'ZZ1 1ZZ'
+            self.assertEqual(geocode(self.club), (50.0, -1.0))
+        self.assertEqual(geocoder.queries, ['Unknown, Nowhere, ZZ1 1ZZ, GB'])
@@ -0,0 +1,77 @@
+"""Unit tests for the cache of geocoded addresses."""
+from clubs.geocoders import NominatimGeocoder
+from clubs.geocoding import geocode_cached, get_address_key, location_memory_cache
+from clubs.models import Club, Geocoded_Address
+from clubs.tests.helpers import StubGeocoder
+from datetime import timedelta
+from django.test import TestCase, override_settings
+
+FULL_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
+
+class GeocodeCacheTestCase(TestCase):
+    """Unit tests for the cache of geocoded addresses."""
+
+    fixtures = ['clubs/tests/fixtures/default_club.json']
+
+    def setUp(self):
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.geocoder = NominatimGeocoder()
+        location_memory_cache.clear()
+
+    def tearDown(self):
+        location_memory_cache.clear()
+
+    def test_address_is_only_geocoded_once(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            self.assertEqual(geocode_cached(self.club, self.geocoder), (51.5128, -0.1173))
+            self.assertEqual(geocode_cached(self.club, self.geocoder), (51.5128, -0.1173))
+        self.assertEqual(geocoder.queries, [FULL_ADDRESS])
+        self.assertEqual(Geocoded_Address.objects.get().address_key, 'bush house|london|wc2b 4bg|gb')
+
+    def test_address_differing_in_case_and_spacing_is_cached(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            geocode_cached(self.club, self.geocoder)
+            self.club.address = '  BUSH   house '
+            self.assertEqual(geocode_cached(self.club, self.geocoder), (51.5128, -0.1173))
+        self.assertEqual(len(geocoder.queries), 1)
+
+    def test_unknown_address_is_cached(self):
+        with StubGeocoder({}) as geocoder:
+            self.assertIsNone(geocode_cached(self.club, self.geocoder))
+            self.assertIsNone(geocode_cached(self.club, self.geocoder))
+        self.assertEqual(len(geocoder.queries), 1)
+
+    def test_expired_location_is_geocoded_again(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            geocode_cached(self.club, self.geocoder)
+            geocoded_address = Geocoded_Address.objects.get()
+            geocoded_address.geocoded_at -= timedelta(days=31)
+            geocoded_address.save()
+            geocode_cached(self.club, self.geocoder)
+        self.assertEqual(len(geocoder.queries), 2)
+        self.assertEqual(Geocoded_Address.objects.count(), 1)
+
+    @override_settings(GEOCODE_NOT_FOUND_CACHE_TIMEOUT=0)
+    def test_unknown_address_expires_on_its_own_timeout(self):
+        with StubGeocoder({}) as geocoder:
+            geocode_cached(self.club, self.geocoder)
+            geocode_cached(self.club, self.geocoder)
+        self.assertEqual(len(geocoder.queries), 2)
+
+    @override_settings(GEOCODE_MEMORY_CACHE_SIZE=2)
+    def test_memory_cache_answers_without_querying(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            geocode_cached(self.club, self.geocoder)
+            with self.assertNumQueries(0):
+                self.assertEqual(geocode_cached(self.club, self.geocoder), (51.5128, -0.1173))
+
+    @override_settings(GEOCODE_MEMORY_CACHE_SIZE=2)
+    def test_memory_cache_drops_least_recently_used_address(self):
+        key = get_address_key(self.club)
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            geocode_cached(self.club, self.geocoder)
+            for city in ['Paris', 'Rome']:
+                self.club.city = city
+                geocode_cached(self.club, self.geocoder)
+        self.assertEqual(len(location_memory_cache.entries), 2)
+        self.assertNotIn(key, location_memory_cache.entries)
@@ -0,0 +1,80 @@
+"""Unit tests for the background geocoding jobs."""
+from clubs.geocoding import geocode_club, schedule_geocoding, wait_for_geocoding
+from clubs.models import Club
+from clubs.tests.helpers import FileTestDatabase, StubGeocoder
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+FULL_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
+
+@override_settings(GEOCODING_WORKERS=0)
+class GeocodeClubTestCase(TestCase):
+    """Unit tests for geocoding a club."""
+
+    fixtures = ['clubs/tests/fixtures/default_club.json']
+
+    def setUp(self):
+        self.club = Club.objects.get(name='Flying Orangutans')
+
+    def test_geocoding_stores_location(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            geocode_club(self.club.id)
+        self.assertEqual(geocoder.queries, [FULL_ADDRESS])
+        self.club.refresh_from_db()
+        self.assertEqual(self.club.geocode_status, Club.GEOCODED)
+        self.assertEqual((self.club.latitude, self.club.longitude), (51.5128, -0.1173))
+
+    def test_geocoding_does_not_save_over_other_changes(self):
+        Club.objects.filter(id=self.club.id).update(description='Changed while geocoding')
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            geocode_club(self.club.id)
+        self.club.refresh_from_db()
+        self.assertEqual(self.club.description, 'Changed while geocoding')
+
+    def test_geocoding_deleted_club_does_nothing(self):
+        club_id = self.club.id
+        self.club.delete()
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            geocode_club(club_id)
+        self.assertEqual(geocoder.queries, [])
+
+    def test_geocoding_is_scheduled_after_commit(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            with self.captureOnCommitCallbacks(execute=True):
+                schedule_geocoding(self.club)
+                self.assertEqual(geocoder.queries, [])
+        self.assertEqual(geocoder.queries, [FULL_ADDRESS])
+
+@override_settings(GEOCODING_WORKERS=2)
+class BackgroundGeocodingTestCase(TransactionTestCase):
+    """Unit tests for geocoding clubs on the worker threads, which need the club committed to see it."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.file_test_database = FileTestDatabase().__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.file_test_database.__exit__(None, None, None)
+        super().tearDownClass()
+
+    def test_clubs_are_geocoded_in_the_background(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}) as geocoder:
+            with transaction.atomic():
+                club = Club.objects.create(
+                    name='Flying Orangutans', address='Bush House', city='London',
+                    postal_code='WC2B 4BG', country='GB', description='Orangutans'
+                )
+                other_club = Club.objects.create(
+                    name='Nowhere', address='Nowhere', city='Nowhere',
+                    postal_code='N0 0WH', country='GB', description='Nowhere'
+                )
+                schedule_geocoding(club)
+                schedule_geocoding(other_club)
+            wait_for_geocoding(timeout=10)
+        self.assertEqual(len(geocoder.queries), 2)
+        club.refresh_from_db()
+        other_club.refresh_from_db()
+        self.assertEqual(club.geocode_status, Club.GEOCODED)
+        self.assertEqual(other_club.geocode_status, Club.NOT_FOUND)
@@ -0,0 +1,167 @@
+"""Unit tests for the Nominatim geocoder."""
+from clubs.geocoders import (GeocoderError, GeocoderUnavailable, NominatimGeocoder, get_geocoder_stats,
+    get_retry_after, nominatim_circuit_breaker)
+from clubs.models import Club
+from clubs.tests.helpers import StubGeocoder
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from email.utils import formatdate
+from io import StringIO
+from time import monotonic, time
+import requests
+
+FULL_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+@override_settings(
+    CACHES=LOCAL_MEMORY_CACHES,
+    GEOCODER_RETRIES=2,
+    GEOCODER_RETRY_DELAY=0,
+    GEOCODER_CIRCUIT_FAILURES=2,
+    GEOCODER_CIRCUIT_RESET_TIMEOUT=60
+)
+class NominatimGeocoderTestCase(TestCase):
+    """Unit tests for the Nominatim geocoder."""
+
+    fixtures = ['clubs/tests/fixtures/default_club.json']
+
+    def setUp(self):
+        cache.clear()
+        nominatim_circuit_breaker.reset()
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.geocoder = NominatimGeocoder()
+
+    def tearDown(self):
+        nominatim_circuit_breaker.reset()
+
+    def assert_stats(self, **counts):
+        expected = {'success': 0, 'not_found': 0, 'retry': 0, 'failure': 0, 'rejected': 0}
+        expected.update(counts)
+        self.assertEqual(get_geocoder_stats(), expected)
+
+    def test_location_is_found(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            self.assertEqual(self.geocoder.geocode(self.club), (51.5128, -0.1173))
+        self.assert_stats(success=1)
+
+    def test_unknown_address_is_not_found(self):
+        with StubGeocoder({}):
+            self.assertIsNone(self.geocoder.geocode(self.club))
+        self.assert_stats(not_found=1)
+
+    def test_answer_that_is_not_a_location_fails(self):
+        with StubGeocoder({FULL_ADDRESS: ('north', 'west')}):
+            with self.assertRaises(GeocoderError):
+                self.geocoder.geocode(self.club)
+        self.assert_stats(failure=1)
+        self.assertIsNone(nominatim_circuit_breaker.opened_at)
+
+    def test_server_errors_are_retried(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503, 429]) as geocoder:
+            self.assertEqual(self.geocoder.geocode(self.club), (51.5128, -0.1173))
+        self.assertEqual(len(geocoder.queries), 3)
+        self.assert_stats(success=1, retry=2)
+
+    def test_retries_are_bounded(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503, 503, 503, 503]) as geocoder:
+            with self.assertRaises(requests.HTTPError):
+                self.geocoder.geocode(self.club)
+        self.assertEqual(len(geocoder.queries), 3)
+        self.assert_stats(retry=2, failure=1)
+
+    def test_client_errors_are_not_retried(self):
+        with StubGeocoder({}, status_codes=[400]) as geocoder:
+            with self.assertRaises(requests.HTTPError):
+                self.geocoder.geocode(self.club)
+        self.assertEqual(len(geocoder.queries), 1)
+        self.assert_stats(failure=1)
+
+    @override_settings(GEOCODER_RETRIES=0)
+    def test_client_errors_open_the_circuit(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[403, 403]) as geocoder:
+            for _ in range(2):
+                with self.assertRaises(requests.HTTPError):
+                    self.geocoder.geocode(self.club)
+            with self.assertRaises(GeocoderUnavailable):
+                self.geocoder.geocode(self.club)
+        self.assertEqual(len(geocoder.queries), 2)
+        self.assert_stats(failure=2, rejected=1)
+
+    def test_retry_after_is_waited_for(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[429], retry_after=0.2):
+            start = monotonic()
+            self.assertEqual(self.geocoder.geocode(self.club), (51.5128, -0.1173))
+            self.assertGreaterEqual(monotonic() - start, 0.2)
+        self.assert_stats(success=1, retry=1)
+
+    @override_settings(GEOCODER_MAX_RETRY_AFTER=1)
+    def test_retry_after_longer_than_the_most_is_not_waited_for(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503], retry_after=3600) as geocoder:
+            with self.assertRaises(requests.HTTPError):
+                self.geocoder.geocode(self.club)
+        self.assertEqual(len(geocoder.queries), 1)
+        self.assert_stats(failure=1)
+
+    def test_retry_after_may_be_a_date(self):
+        response = requests.Response()
+        response.headers['Retry-After'] = formatdate(time() + 60, usegmt=True)
+        self.assertAlmostEqual(get_retry_after(response), 60, delta=2)
+        response.headers['Retry-After'] = 'soon'
+        self.assertIsNone(get_retry_after(response))
+
+    @override_settings(GEOCODER_RETRIES=0, GEOCODER_READ_TIMEOUT=0.05)
+    def test_slow_answer_times_out(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, delay=0.5):
+            with self.assertRaises(requests.Timeout):
+                self.geocoder.geocode(self.club)
+        self.assert_stats(failure=1)
+
+    def test_retry_delay_is_random_and_grows(self):
+        with override_settings(GEOCODER_RETRY_DELAY=1):
+            delays = [self.geocoder.get_retry_delay(2) for _ in range(20)]
+        self.assertTrue(all(0 <= delay <= 4 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    @override_settings(GEOCODER_RETRIES=0)
+    def test_circuit_opens_after_failures_in_a_row(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503, 503]) as geocoder:
+            for _ in range(2):
+                with self.assertRaises(requests.HTTPError):
+                    self.geocoder.geocode(self.club)
+            with self.assertRaises(GeocoderUnavailable):
+                self.geocoder.geocode(self.club)
+        self.assertEqual(len(geocoder.queries), 2)
+        self.assert_stats(failure=2, rejected=1)
+
+    @override_settings(GEOCODER_RETRIES=0, GEOCODER_CIRCUIT_RESET_TIMEOUT=0)
+    def test_circuit_closes_after_a_successful_trial(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503, 503, 503]) as geocoder:
+            for _ in range(3):
+                with self.assertRaises(requests.HTTPError):
+                    self.geocoder.geocode(self.club)
+            self.assertEqual(self.geocoder.geocode(self.club), (51.5128, -0.1173))
+        self.assertEqual(len(geocoder.queries), 4)
+        self.assertIsNone(nominatim_circuit_breaker.opened_at)
+
+    @override_settings(GEOCODER_RATE_LIMIT=20)
+    def test_requests_are_rate_limited(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}):
+            start = monotonic()
+            for _ in range(4):
+                self.geocoder.geocode(self.club)
+            # The first request is not waited for.
+            self.assertGreaterEqual(monotonic() - start, 0.14)
+
+    def test_geocoder_stats_reports_outcomes(self):
+        with StubGeocoder({FULL_ADDRESS: (51.5128, -0.1173)}, status_codes=[503]):
+            self.geocoder.geocode(self.club)
+        output = StringIO()
+        call_command('geocoder_stats', reset=True, stdout=output)
+        self.assertIn('1 success, 0 not found, 1 retry, 0 failure, 0 rejected', output.getvalue())
+        self.assert_stats()
@@ -1,6 +1,17 @@
 """Helper methods for the unit tests"""
+from contextlib import closing
+from django.db import connection
+from django.test import override_settings
 from django.urls import reverse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from time import sleep
+from urllib.parse import parse_qs, urlparse
 from with_asserts.mixin import AssertHTMLMixin
+import json
+import sqlite3
 
 def reverse_with_next(url_name, next_url):
     """Get the URL with next."""
@@ -58,3 +69,94 @@ class NavbarTesterMixin(AssertHTMLMixin):
 
         self.assertContains(response, "Club")
         self.assertContains(response, "Members")
+
+class StubGeocoder:
+    """Local server answering geocoder searches like Nominatim, used as the geocoder while entered."""
+
+    def __init__(self, locations, status_codes=(), delay=0, retry_after=None):
+        """Answer with the latitude and longitude each full address is mapped to, and nothing for any other.
+
+        The first requests are answered with the given error status codes instead, asking to be retried after
+        the given Retry-After if there is one, and every answer is sent after the given seconds.
+        """
+
+        self.locations = locations
+        self.status_codes = list(status_codes)
+        self.delay = delay
+        self.retry_after = retry_after
+        self.queries = []
+
+    def get_handler_class(self):
+        """Return the class handling each request to the server."""
+
+        geocoder = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+                geocoder.queries.append(query)
+                if geocoder.delay:
+                    sleep(geocoder.delay)
+                if geocoder.status_codes:
+                    self.send_response(geocoder.status_codes.pop(0))
+                    if geocoder.retry_after is not None:
+                        self.send_header('Retry-After', str(geocoder.retry_after))
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                location = geocoder.locations.get(query)
+                results = [] if location is None else [{'lat': str(location[0]), 'lon': str(location[1])}]
+                body = json.dumps(results).encode()
+                try:
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up waiting.
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.get_handler_class())
+        Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True).start()
+        host, port = self.server.server_address
+        self.settings = override_settings(GEOCODER_URL=f'http://{host}:{port}/search')
+        self.settings.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.settings.disable()
+        self.server.shutdown()
+        self.server.server_close()
+
+class FileTestDatabase:
+    """Copy of the SQLite test database in a file, used as the test database while entered.
+
+    The test database is in memory, where a connection writing to a table fails the others at once. In a file,
+    connections wait for each other's locks instead, as the threads of the background geocoding do.
+    """
+
+    def __enter__(self):
+        self.directory = TemporaryDirectory()
+        path = str(Path(self.directory.name) / 'test_db.sqlite3')
+        connection.ensure_connection()
+        with closing(sqlite3.connect(path)) as file_connection:
+            connection.connection.backup(file_connection)
+        # The database in memory only lasts while a connection to it is open, so this one is kept for afterwards.
+        self.memory_connection = connection.connection
+        self.memory_name = connection.settings_dict['NAME']
+        connection.connection = None
+        connection.settings_dict['NAME'] = path
+        return self
+
+    def __exit__(self, *exc_info):
+        connection.close()
+        connection.settings_dict['NAME'] = self.memory_name
+        connection.connection = self.memory_connection
+        self.directory.cleanup()
@@ -52,3 +52,23 @@ class ClubMemberTest(TestCase):
         self.club_member.authorization = ""
         with self.assertRaises(ValidationError):
             self.club_member.full_clean()
+
+    """Unit tests for the copies of the user's fields the members are sorted by"""
+
+    def test_user_sort_keys_are_copied(self):
+        self.assertEqual(self.club_member.search_name, self.user.search_name)
+        self.assertEqual(self.club_member.chess_experience_level, self.user.chess_experience_level)
+
+    def test_user_sort_keys_follow_the_user(self):
+        self.user.first_name = 'Robert'
+        self.user.chess_experience = User.ADVANCED
+        self.user.save()
+        self.club_member.refresh_from_db()
+        self.assertEqual(self.club_member.search_name, 'robert smith')
+        self.assertEqual(self.club_member.chess_experience_level, 3)
+
+    def test_user_sort_keys_are_copied_in_bulk(self):
+        self.club_member.delete()
+        Club_Member.objects.bulk_create([Club_Member(user_id=self.user.id, club=self.club)])
+        club_member = Club_Member.objects.get(user=self.user, club=self.club)
+        self.assertEqual(club_member.search_name, self.user.search_name)
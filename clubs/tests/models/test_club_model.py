@@ -1,5 +1,5 @@
 """Unit tests for Club model."""
-from clubs.models import Club
+from clubs.models import Club, Club_Word
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -119,6 +119,26 @@ class ClubModelTestCase(TestCase):
         self.club.country = self.second_club.country
         self.assert_club_is_valid()
 
+    """ Unit tests for search name """
+
+    def test_search_name_is_normalised_name(self):
+        self.assertEqual(self.club.search_name, 'flying orangutans')
+
+    def test_search_name_follows_name_on_save(self):
+        self.club.name = '  Kerbal   Chess Club '
+        self.club.save()
+        self.club.refresh_from_db()
+        self.assertEqual(self.club.search_name, 'kerbal chess club')
+
+    def test_words_of_the_name_are_indexed(self):
+        self.assertEqual(self.get_words(), {'flying', 'orangutans'})
+        self.club.name = 'Flying Kerbals'
+        self.club.save()
+        self.assertEqual(self.get_words(), {'flying', 'kerbals'})
+
+    def get_words(self):
+        return set(Club_Word.objects.filter(club=self.club).values_list('word', flat=True))
+
     def assert_club_is_valid(self):
         try:
             self.club.full_clean()
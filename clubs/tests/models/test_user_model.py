@@ -2,6 +2,7 @@
 from clubs.models import User
 from django.core.exceptions import ValidationError
 from django.test import TestCase
+from libgravatar import Gravatar
 
 
 class UserModelTestCase(TestCase):
@@ -216,6 +217,48 @@ class UserModelTestCase(TestCase):
                 is_active=True,
             )
 
+    """ Unit tests for search name """
+
+    def test_search_name_is_normalised_full_name(self):
+        self.assertEqual(self.user.search_name, 'bob smith')
+        self.assertEqual(self.superuser.search_name, 'bob smith')
+
+    def test_search_name_follows_full_name_on_save(self):
+        self.user.first_name = 'Jean Luc'
+        self.user.last_name = 'PICARD'
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.search_name, 'jean luc picard')
+
+    """ Unit tests for chess experience level """
+
+    def test_chess_experience_level_follows_chess_experience_on_save(self):
+        self.assertEqual(self.user.chess_experience_level, 1)
+        self.user.chess_experience = User.ADVANCED
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.chess_experience_level, 3)
+
+    """ Unit tests for gravatar """
+
+    def test_gravatar_matches_libgravatar(self):
+        for size in [100, 60, 1]:
+            self.assertEqual(
+                self.user.gravatar(size=size),
+                Gravatar(self.user.email).get_image(size=size, default='mp')
+            )
+        self.assertEqual(self.user.mini_gravatar(), Gravatar(self.user.email).get_image(size=60, default='mp'))
+
+    def test_gravatar_hash_follows_email_on_save(self):
+        self.user.email = ' Jean.Luc@Example.org '
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.gravatar(), Gravatar('jean.luc@example.org').get_image(size=100, default='mp'))
+
+    def test_gravatar_of_unsaved_user(self):
+        user = User(email='jeanluc@example.org')
+        self.assertEqual(user.gravatar(), Gravatar(user.email).get_image(size=100, default='mp'))
+
     def assert_superuser_is_valid(self):
         try:
             self.superuser.full_clean()
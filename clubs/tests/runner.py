@@ -0,0 +1,36 @@
+"""Test runners applying the settings the tests run with."""
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+from django_heroku import HerokuDiscoverRunner
+
+# Test cases roll back the database without sending any signals, so nothing is cached between them, in the
+# shared cache or in the memory of the process. Cache tests override this with a real cache. Geocoding goes to a
+# stub Nominatim server, whichever gazetteer is built locally, as fast as it answers.
+TEST_SETTINGS = {
+    'CACHES': {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    },
+    'GEOCODE_MEMORY_CACHE_SIZE': 0,
+    'GEOCODERS': ['clubs.geocoders.NominatimGeocoder'],
+    'GEOCODER_RATE_LIMIT': None,
+}
+
+class TestSettingsMixin:
+    """Mixin of the test runners overriding the settings with TEST_SETTINGS while the tests run."""
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.test_settings = override_settings(**TEST_SETTINGS)
+        self.test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.test_settings.disable()
+        super().teardown_test_environment(**kwargs)
+
+class TestRunner(TestSettingsMixin, DiscoverRunner):
+    """Test runner of the project."""
+
+class HerokuTestRunner(TestSettingsMixin, HerokuDiscoverRunner):
+    """Test runner of the project on Heroku CI."""
@@ -26,16 +26,16 @@ class SignUpViewTestCase(TestCase, LogInTester, AssertHTMLMixin):
 
         self.club = Club.objects.get(name='Flying Orangutans')
         self.club_applicant = Club_Member.objects.create(
-            user=self.applicant, authorization='AP', club=self.club
+            user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club
         )
         self.club_member = Club_Member.objects.create(
-            user=self.member, authorization='ME', club=self.club
+            user=self.member, authorization=Club_Member.MEMBER, club=self.club
         )
         self.club_officer = Club_Member.objects.create(
-            user=self.officer, authorization='OF', club=self.club
+            user=self.officer, authorization=Club_Member.OFFICER, club=self.club
         )
         self.club_owner = Club_Member.objects.create(
-            user=self.owner, authorization='OW', club=self.club
+            user=self.owner, authorization=Club_Member.OWNER, club=self.club
         )
         self.valid_form_input = {
             'email': 'bellasmith@example.org',
@@ -21,10 +21,10 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         self.applicant = User.objects.get(email='johnsmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
 
         self.url = reverse('apply_club', kwargs={'club_id': self.club.id})
 
@@ -54,7 +54,7 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_applying = Club_Member.objects.get(user=self.user).authorization
-        self.assertEqual(auth_after_applying, 'AP')
+        self.assertEqual(auth_after_applying, Club_Member.APPLICANT)
 
     """Unit tests for user trying to apply for the same club"""
 
@@ -65,7 +65,7 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('dashboard')
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth, 'OW')
+        self.assertEqual(auth, Club_Member.OWNER)
 
     def test_get_officer_apply_same_club(self):
         self.client.login(email=self.officer.email, password='Password123')
@@ -74,7 +74,7 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('dashboard')
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth, 'OF')
+        self.assertEqual(auth, Club_Member.OFFICER)
 
     def test_get_member_apply_same_club(self):
         self.client.login(email=self.member.email, password='Password123')
@@ -83,7 +83,7 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('dashboard')
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth, 'ME')
+        self.assertEqual(auth, Club_Member.MEMBER)
 
     def test_get_applicant_apply_same_club(self):
         self.client.login(email=self.applicant.email, password='Password123')
@@ -92,4 +92,4 @@ class ApplyClubViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('dashboard')
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth, 'AP')
+        self.assertEqual(auth, Club_Member.APPLICANT)
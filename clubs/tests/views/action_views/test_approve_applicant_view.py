@@ -24,13 +24,13 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.another_member = User.objects.get(email='jamessmith@example.org')
         self.another_applicant = User.objects.get(email='kellysmith@example.org')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
-        Club_Member.objects.create(user=self.another_officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.another_member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.another_applicant, authorization='AP', club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
+        Club_Member.objects.create(user=self.another_officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.another_member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.another_applicant, authorization=Club_Member.APPLICANT, club=self.club)
 
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.applicant.id})
 
@@ -44,12 +44,12 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
 
         self.assertFalse(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse_with_next('log_in', self.url)
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'AP')
+        self.assertEqual(auth_after_approve, Club_Member.APPLICANT)
 
     """Unit tests for successfully approving applicant"""
 
@@ -57,7 +57,7 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         response_message = self.client.get(reverse('dashboard'))
         messages_list = list(response_message.context['messages'])
@@ -66,7 +66,7 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
 
 
@@ -74,7 +74,7 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         response_message = self.client.get(reverse('dashboard'))
         messages_list = list(response_message.context['messages'])
@@ -83,7 +83,7 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     """Unit tests for not being able to approve applicant"""
 
@@ -91,34 +91,34 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'AP')
+        self.assertEqual(auth_after_approve, Club_Member.APPLICANT)
 
     def test_approve_applicant_with_another_applicant(self):
         self.client.login(email=self.another_applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'AP')
+        self.assertEqual(auth_after_approve, Club_Member.APPLICANT)
 
     def test_approve_applicant_with_themselves(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_approve, 'AP')
+        self.assertEqual(auth_before_approve, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_approve, 'AP')
+        self.assertEqual(auth_after_approve, Club_Member.APPLICANT)
 
     """Unit tests for not being able to approve member"""
 
@@ -127,60 +127,60 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_approve, 'ME')
+        self.assertEqual(auth_before_approve, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     def test_approve_member_with_officer(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.member.id})
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_approve, 'ME')
+        self.assertEqual(auth_before_approve, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     def test_approve_member_with_another_member(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.member.id})
         self.client.login(email=self.another_member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_approve, 'ME')
+        self.assertEqual(auth_before_approve, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     def test_approve_member_with_applicant(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.member.id})
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_approve, 'ME')
+        self.assertEqual(auth_before_approve, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     def test_approve_member_with_themselves(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.member.id})
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_approve, 'ME')
+        self.assertEqual(auth_before_approve, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_approve, 'ME')
+        self.assertEqual(auth_after_approve, Club_Member.MEMBER)
 
     """Unit tests for not being able to approve officer"""
 
@@ -189,60 +189,60 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_approve, 'OF')
+        self.assertEqual(auth_before_approve, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_approve, 'OF')
+        self.assertEqual(auth_after_approve, Club_Member.OFFICER)
 
     def test_approve_officer_with_another_officer(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.officer.id})
         self.client.login(email=self.another_officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_approve, 'OF')
+        self.assertEqual(auth_before_approve, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_approve, 'OF')
+        self.assertEqual(auth_after_approve, Club_Member.OFFICER)
 
     def test_approve_officer_with_member(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.officer.id})
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_approve, 'OF')
+        self.assertEqual(auth_before_approve, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_approve, 'OF')
+        self.assertEqual(auth_after_approve, Club_Member.OFFICER)
 
     def test_approve_officer_with_applicant(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.officer.id})
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_approve, 'OF')
+        self.assertEqual(auth_before_approve, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_approve, 'OF')
+        self.assertEqual(auth_after_approve, Club_Member.OFFICER)
 
     def test_approve_officer_with_themselves(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.officer.id})
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_approve, 'OF')
+        self.assertEqual(auth_before_approve, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_approve, 'OF')
+        self.assertEqual(auth_after_approve, Club_Member.OFFICER)
 
     """Unit tests for not being able to approve owner"""
 
@@ -251,45 +251,45 @@ class ApproveApplicantTestCase(TestCase, LogInTester):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_approve, 'OW')
+        self.assertEqual(auth_before_approve, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_approve, 'OW')
+        self.assertEqual(auth_after_approve, Club_Member.OWNER)
 
     def test_approve_owner_with_member(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.owner.id})
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_approve, 'OW')
+        self.assertEqual(auth_before_approve, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_approve, 'OW')
+        self.assertEqual(auth_after_approve, Club_Member.OWNER)
 
     def test_approve_owner_with_applicant(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.owner.id})
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_approve, 'OW')
+        self.assertEqual(auth_before_approve, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_approve, 'OW')
+        self.assertEqual(auth_after_approve, Club_Member.OWNER)
 
     def test_approve_owner_with_themselves(self):
         self.url = reverse('approve_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.owner.id})
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_approve, 'OW')
+        self.assertEqual(auth_before_approve, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('applicants_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_approve = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_approve, 'OW')
+        self.assertEqual(auth_after_approve, Club_Member.OWNER)
@@ -20,7 +20,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.member = User.objects.get(email="kellysmith@example.org")
         self.user = User.objects.get(email='bethsmith@example.org')
         self.club_owner = Club_Member.objects.create(
-            user=self.owner, authorization='OW', club=self.club
+            user=self.owner, authorization=Club_Member.OWNER, club=self.club
         )
         self.secondary_user = User.objects.get(email='harrysmith@example.org')
         self.url = reverse('delete_account')
@@ -60,7 +60,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_applicant = Club_Member.objects.create(
             user=self.user,
-            authorization='AP',
+            authorization=Club_Member.APPLICANT,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -84,7 +84,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_member = Club_Member.objects.create(
             user=self.user,
-            authorization='ME',
+            authorization=Club_Member.MEMBER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -108,7 +108,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_officer = Club_Member.objects.create(
             user=self.user,
-            authorization='OF',
+            authorization=Club_Member.OFFICER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -153,7 +153,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_applicant = Club_Member.objects.create(
             user=self.user,
-            authorization='AP',
+            authorization=Club_Member.APPLICANT,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -179,7 +179,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_member = Club_Member.objects.create(
             user=self.member,
-            authorization='ME',
+            authorization=Club_Member.MEMBER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -224,7 +224,7 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_officer = Club_Member.objects.create(
             user=self.user,
-            authorization='OF',
+            authorization=Club_Member.OFFICER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -265,10 +265,10 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
 
         club_applicant = Club_Member.objects.create(
-            user=self.secondary_user, authorization='AP', club=self.club
+            user=self.secondary_user, authorization=Club_Member.APPLICANT, club=self.club
         )
         club_officer = Club_Member.objects.create(
-            user=self.user, authorization='OF', club=self.club
+            user=self.user, authorization=Club_Member.OFFICER, club=self.club
         )
         before_count_user = User.objects.count()
         before_count_club_member = Club_Member.objects.count()
@@ -309,13 +309,13 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_applicant = Club_Member.objects.create(
             user=self.secondary_user,
-            authorization='AP',
+            authorization=Club_Member.APPLICANT,
             club=self.club
         )
 
         club_member = Club_Member.objects.create(
             user=self.user,
-            authorization='ME',
+            authorization=Club_Member.MEMBER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -362,13 +362,13 @@ class DeleteAccountViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         club_member = Club_Member.objects.create(
             user=self.secondary_user,
-            authorization='ME',
+            authorization=Club_Member.MEMBER,
             club=self.club
         )
 
         club_officer = Club_Member.objects.create(
             user=self.user,
-            authorization='OF',
+            authorization=Club_Member.OFFICER,
             club=self.club
         )
         before_count_user = User.objects.count()
@@ -24,13 +24,13 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.another_applicant = User.objects.get(email='kellysmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
-        Club_Member.objects.create(user=self.another_officer, authorization='OF',club=self.club)
-        Club_Member.objects.create(user=self.another_member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.another_applicant, authorization='AP',club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
+        Club_Member.objects.create(user=self.another_officer, authorization=Club_Member.OFFICER,club=self.club)
+        Club_Member.objects.create(user=self.another_member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.another_applicant, authorization=Club_Member.APPLICANT,club=self.club)
 
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
 
@@ -44,12 +44,12 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
 
         self.assertFalse(self._is_logged_in())
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse_with_next('log_in', self.url)
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'OF')
+        self.assertEqual(auth_after_demotion, Club_Member.OFFICER)
 
     def test_get_owner_demote_officer(self):
         """Test for the owner successfully demoting an officer."""
@@ -57,7 +57,7 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         response_message = self.client.get(reverse('members_list', kwargs={'club_id': self.club.id}))
         messages_list = list(response_message.context['messages'])
@@ -66,7 +66,7 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     """Unit tests for owner not being able to demote user"""
 
@@ -75,36 +75,36 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
         auth_before_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_demotion, 'ME')
+        self.assertEqual(auth_before_demotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     def test_get_owner_demote_applicant(self):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_demotion, 'AP')
+        self.assertEqual(auth_before_demotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_demotion, 'AP')
+        self.assertEqual(auth_after_demotion, Club_Member.APPLICANT)
 
     def test_get_owner_demote_themselves(self):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         auth_before_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_demotion, 'OW')
+        self.assertEqual(auth_before_demotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_demotion, 'OW')
+        self.assertEqual(auth_after_demotion, Club_Member.OWNER)
 
     """Unit tests for officer not being able to demote user"""
 
@@ -113,59 +113,59 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         auth_before_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_demotion, 'OW')
+        self.assertEqual(auth_before_demotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_demotion, 'OW')
+        self.assertEqual(auth_after_demotion, Club_Member.OWNER)
 
     def test_get_another_officer_demote_officer(self):
         self.client.login(email=self.another_officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'OF')
+        self.assertEqual(auth_after_demotion, Club_Member.OFFICER)
 
     def test_get_officer_demote_member(self):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
         auth_before_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_demotion, 'ME')
+        self.assertEqual(auth_before_demotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     def test_get_officer_demote_applicant(self):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_demotion, 'AP')
+        self.assertEqual(auth_before_demotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_demotion, 'AP')
+        self.assertEqual(auth_after_demotion, Club_Member.APPLICANT)
 
     def test_get_officer_demote_themselves(self):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'OF')
+        self.assertEqual(auth_after_demotion, Club_Member.OFFICER)
 
     """Unit tests for member not being able to demote user"""
 
@@ -174,59 +174,59 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         auth_before_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_demotion, 'OW')
+        self.assertEqual(auth_before_demotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_demotion, 'OW')
+        self.assertEqual(auth_after_demotion, Club_Member.OWNER)
 
     def test_get_member_demote_officer(self):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'OF')
+        self.assertEqual(auth_after_demotion, Club_Member.OFFICER)
 
     def test_get_another_member_demote_member(self):
         self.client.login(email=self.another_member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
         auth_before_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_demotion, 'ME')
+        self.assertEqual(auth_before_demotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     def test_get_member_demote_applicant(self):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_demotion, 'AP')
+        self.assertEqual(auth_before_demotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_demotion, 'AP')
+        self.assertEqual(auth_after_demotion, Club_Member.APPLICANT)
 
     def test_get_member_demote_themselves(self):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
         auth_before_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_demotion, 'ME')
+        self.assertEqual(auth_before_demotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     """Unit tests for applicant not being able to demote user"""
 
@@ -235,56 +235,56 @@ class DemoteOfficerViewTestCase(TestCase, LogInTester):
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         auth_before_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_demotion, 'OW')
+        self.assertEqual(auth_before_demotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_demotion, 'OW')
+        self.assertEqual(auth_after_demotion, Club_Member.OWNER)
 
     def test_get_applicant_demote_officer(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_demotion, 'OF')
+        self.assertEqual(auth_before_demotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_demotion, 'OF')
+        self.assertEqual(auth_after_demotion, Club_Member.OFFICER)
 
     def test_get_applicant_demote_member(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
         auth_before_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_demotion, 'ME')
+        self.assertEqual(auth_before_demotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_demotion, 'ME')
+        self.assertEqual(auth_after_demotion, Club_Member.MEMBER)
 
     def test_get_another_applicant_demote_applicant(self):
         self.client.login(email=self.another_applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_demotion, 'AP')
+        self.assertEqual(auth_before_demotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_demotion, 'AP')
+        self.assertEqual(auth_after_demotion, Club_Member.APPLICANT)
 
     def test_get_applicant_demote_themselves(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('demote_officer', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_demotion, 'AP')
+        self.assertEqual(auth_before_demotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_demotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_demotion, 'AP')
+        self.assertEqual(auth_after_demotion, Club_Member.APPLICANT)
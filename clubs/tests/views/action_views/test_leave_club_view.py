@@ -25,10 +25,10 @@ class LeaveClubViewTestCase(TestCase, LogInTester):
         self.club = Club.objects.get(name='Flying Orangutans')
         self.wrong_club = Club.objects.get(name='Flying Orangutans 2')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
 
         self.url = reverse('leave_club', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
 
@@ -24,13 +24,13 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.another_applicant = User.objects.get(email='kellysmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.another_officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.another_member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
-        Club_Member.objects.create(user=self.another_applicant, authorization='AP', club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.another_officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.another_member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
+        Club_Member.objects.create(user=self.another_applicant, authorization=Club_Member.APPLICANT, club=self.club)
 
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.member.id})
 
@@ -47,7 +47,7 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         redirect_url = reverse_with_next('log_in', self.url)
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'ME')
+        self.assertEqual(auth_after_promotion, Club_Member.MEMBER)
 
     def test_get_owner_promote_member(self):
         """Test for the owner successfully promoting a member."""
@@ -55,7 +55,7 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_promotion, 'ME')
+        self.assertEqual(auth_before_promotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         response_message = self.client.get(redirect_url)
@@ -64,7 +64,16 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.assertEqual(messages_list[0].level, messages.SUCCESS)
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
+
+    def test_owner_promote_member_resolves_membership_once(self):
+        """Test that the club and the owner's membership are only queried once."""
+
+        self.client.login(email=self.owner.email, password='Password123')
+        # session, user, membership with club, member, member's authorization,
+        # rows to invalidate in the authorization cache, update
+        with self.assertNumQueries(7):
+            self.client.get(self.url)
 
     """Unit tests for user not being able to promote a member"""
 
@@ -72,45 +81,45 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_promotion, 'ME')
+        self.assertEqual(auth_before_promotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'ME')
+        self.assertEqual(auth_after_promotion, Club_Member.MEMBER)
 
     def test_get_another_member_promote_member(self):
         self.client.login(email=self.another_member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_promotion, 'ME')
+        self.assertEqual(auth_before_promotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'ME')
+        self.assertEqual(auth_after_promotion, Club_Member.MEMBER)
 
     def test_get_applicant_promote_member(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_promotion, 'ME')
+        self.assertEqual(auth_before_promotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'ME')
+        self.assertEqual(auth_after_promotion, Club_Member.MEMBER)
 
     def test_get_member_promote_themselves(self):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_before_promotion, 'ME')
+        self.assertEqual(auth_before_promotion, Club_Member.MEMBER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(auth_after_promotion, 'ME')
+        self.assertEqual(auth_after_promotion, Club_Member.MEMBER)
 
     """Unit tests for user not being able to promote an officer"""
 
@@ -119,60 +128,60 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_promotion, 'OF')
+        self.assertEqual(auth_before_promotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
 
     def test_get_another_officer_promote_officer(self):
         self.client.login(email=self.another_officer.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_promotion, 'OF')
+        self.assertEqual(auth_before_promotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
 
     def test_get_member_promote_officer(self):
         self.client.login(email=self.member.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_promotion, 'OF')
+        self.assertEqual(auth_before_promotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
 
     def test_get_applicant_promote_officer(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_promotion, 'OF')
+        self.assertEqual(auth_before_promotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
 
     def test_get_officer_promote_themselves(self):
         self.client.login(email=self.officer.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
         auth_before_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_before_promotion, 'OF')
+        self.assertEqual(auth_before_promotion, Club_Member.OFFICER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(auth_after_promotion, 'OF')
+        self.assertEqual(auth_after_promotion, Club_Member.OFFICER)
 
     """Unit tests for user not being able to promote an applicant"""
 
@@ -181,60 +190,60 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_promotion, 'AP')
+        self.assertEqual(auth_before_promotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_promotion, 'AP')
+        self.assertEqual(auth_after_promotion, Club_Member.APPLICANT)
 
     def test_get_officer_promote_applicant(self):
         self.client.login(email=self.officer.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_promotion, 'AP')
+        self.assertEqual(auth_before_promotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_promotion, 'AP')
+        self.assertEqual(auth_after_promotion, Club_Member.APPLICANT)
 
     def test_get_member_promote_applicant(self):
         self.client.login(email=self.member.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_promotion, 'AP')
+        self.assertEqual(auth_before_promotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_promotion, 'AP')
+        self.assertEqual(auth_after_promotion, Club_Member.APPLICANT)
 
     def test_get_another_applicant_promote_applicant(self):
         self.client.login(email=self.another_applicant.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_promotion, 'AP')
+        self.assertEqual(auth_before_promotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_promotion, 'AP')
+        self.assertEqual(auth_after_promotion, Club_Member.APPLICANT)
 
     def test_get_applicant_promote_themselves(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.applicant.id})
         auth_before_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_before_promotion, 'AP')
+        self.assertEqual(auth_before_promotion, Club_Member.APPLICANT)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(auth_after_promotion, 'AP')
+        self.assertEqual(auth_after_promotion, Club_Member.APPLICANT)
 
     """Unit tests for user not being able to promote an owner"""
 
@@ -243,45 +252,45 @@ class PromoteMemberViewTestCase(TestCase, LogInTester):
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_promotion, 'OW')
+        self.assertEqual(auth_before_promotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_promotion, 'OW')
+        self.assertEqual(auth_after_promotion, Club_Member.OWNER)
 
     def test_get_member_promote_owner(self):
         self.client.login(email=self.member.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_promotion, 'OW')
+        self.assertEqual(auth_before_promotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_promotion, 'OW')
+        self.assertEqual(auth_after_promotion, Club_Member.OWNER)
 
     def test_get_applicant_promote_owner(self):
         self.client.login(email=self.applicant.email, password='Password123')
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         self.assertTrue(self._is_logged_in())
         auth_before_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_promotion, 'OW')
+        self.assertEqual(auth_before_promotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('waiting_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_promotion, 'OW')
+        self.assertEqual(auth_after_promotion, Club_Member.OWNER)
 
     def test_get_owner_promote_themselves(self):
         self.client.login(email=self.owner.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         self.url = reverse('promote_member', kwargs={'club_id': self.club.id, 'member_id': self.owner.id})
         auth_before_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_before_promotion, 'OW')
+        self.assertEqual(auth_before_promotion, Club_Member.OWNER)
         response = self.client.get(self.url)
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         auth_after_promotion = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(auth_after_promotion, 'OW')
+        self.assertEqual(auth_after_promotion, Club_Member.OWNER)
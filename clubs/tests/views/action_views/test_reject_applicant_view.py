@@ -22,11 +22,11 @@ class RejectApplicantViewTestCase(TestCase, LogInTester):
         self.applicant = User.objects.get(email='bethsmith@example.org')
         self.another_applicant = User.objects.get(email='jamessmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
-        Club_Member.objects.create(user=self.another_applicant, authorization='AP', club=self.club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
+        Club_Member.objects.create(user=self.another_applicant, authorization=Club_Member.APPLICANT, club=self.club)
         self.url = reverse('reject_applicant', kwargs={'club_id': self.club.id, 'applicant_id': self.applicant.id})
 
     def test_reject_applicant_url(self):
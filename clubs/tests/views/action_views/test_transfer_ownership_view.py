@@ -27,11 +27,11 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         self.club = Club.objects.get(name='Flying Orangutans')
         self.other_club = Club.objects.get(name='Flying Orangutans 2')
 
-        Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
-        Club_Member.objects.create(user=self.officer, authorization='OF', club=self.club)
-        Club_Member.objects.create(user=self.member, authorization='ME', club=self.club)
-        Club_Member.objects.create(user=self.applicant, authorization='AP', club=self.club)
-        Club_Member.objects.create(user=self.user_from_other_club, authorization='OF', club=self.other_club)
+        Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
+        Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
+        Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
+        Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
+        Club_Member.objects.create(user=self.user_from_other_club, authorization=Club_Member.OFFICER, club=self.other_club)
 
         self.url = reverse('transfer_ownership', kwargs={'club_id': self.club.id, 'member_id': self.officer.id})
 
@@ -61,9 +61,9 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         self.assertEqual(messages_list[0].level, messages.SUCCESS)
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         owner_auth_after_transfer = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(owner_auth_after_transfer, 'OF')
+        self.assertEqual(owner_auth_after_transfer, Club_Member.OFFICER)
         officer_auth_after_transfer = Club_Member.objects.get(user=self.officer).authorization
-        self.assertEqual(officer_auth_after_transfer, 'OW')
+        self.assertEqual(officer_auth_after_transfer, Club_Member.OWNER)
 
     """Unit tests for not being able to transfer ownership"""
 
@@ -75,9 +75,9 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         owner_auth_after_transfer = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(owner_auth_after_transfer, 'OW')
+        self.assertEqual(owner_auth_after_transfer, Club_Member.OWNER)
         member_auth_after_transfer = Club_Member.objects.get(user=self.member).authorization
-        self.assertEqual(member_auth_after_transfer, 'ME')
+        self.assertEqual(member_auth_after_transfer, Club_Member.MEMBER)
 
     def test_get_owner_transfer_ownership_to_applicant(self):
         self.client.login(email=self.owner.email, password='Password123')
@@ -87,9 +87,9 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         owner_auth_after_transfer = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(owner_auth_after_transfer, 'OW')
+        self.assertEqual(owner_auth_after_transfer, Club_Member.OWNER)
         applicant_auth_after_transfer = Club_Member.objects.get(user=self.applicant).authorization
-        self.assertEqual(applicant_auth_after_transfer, 'AP')
+        self.assertEqual(applicant_auth_after_transfer, Club_Member.APPLICANT)
 
     def test_get_owner_transfer_ownership_to_user_from_other_club(self):
         self.client.login(email=self.owner.email, password='Password123')
@@ -100,9 +100,9 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         owner_auth_after_transfer = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(owner_auth_after_transfer, 'OW')
+        self.assertEqual(owner_auth_after_transfer, Club_Member.OWNER)
         user_from_other_club_auth_after_transfer = Club_Member.objects.get(user=self.user_from_other_club).authorization
-        self.assertEqual(user_from_other_club_auth_after_transfer, 'OF')
+        self.assertEqual(user_from_other_club_auth_after_transfer, Club_Member.OFFICER)
 
     def test_get_owner_transfer_ownership_to_clubless_user(self):
         self.client.login(email=self.owner.email, password='Password123')
@@ -112,6 +112,6 @@ class TransferOwnershipViewTestCase(TestCase, LogInTester):
         redirect_url = reverse('members_list', kwargs={'club_id': self.club.id})
         self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
         owner_auth_after_transfer = Club_Member.objects.get(user=self.owner).authorization
-        self.assertEqual(owner_auth_after_transfer, 'OW')
+        self.assertEqual(owner_auth_after_transfer, Club_Member.OWNER)
         with self.assertRaises(ObjectDoesNotExist):
             Club_Member.objects.get(user=self.clubless_user, club=self.club)
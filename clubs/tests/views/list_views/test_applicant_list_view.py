@@ -1,7 +1,7 @@
 """Unit tests for the applicant list view."""
 from clubs.models import Club, Club_Member, User
 from clubs.tests.helpers import LogInTester, NavbarTesterMixin, reverse_with_next
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.contrib import messages
 
@@ -24,16 +24,16 @@ class ApplicantListViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.club = Club.objects.get(name='Flying Orangutans')
 
         Club_Member.objects.create(
-            user=self.owner, authorization='OW', club=self.club
+            user=self.owner, authorization=Club_Member.OWNER, club=self.club
         )
         self.club_officer = Club_Member.objects.create(
-            user=self.officer, authorization='OF', club=self.club
+            user=self.officer, authorization=Club_Member.OFFICER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.member, authorization='ME', club=self.club
+            user=self.member, authorization=Club_Member.MEMBER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.applicant, authorization='AP', club=self.club
+            user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club
         )
 
         self.url = reverse('applicants_list', kwargs={'club_id': self.club.id})
@@ -75,6 +75,29 @@ class ApplicantListViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assert_main_navbar(response)
         self.assert_club_navbar(response, self.club.id)
 
+    @override_settings(USERS_PAGE_SIZE=1)
+    def test_get_applicants_list_is_paginated(self):
+        other_applicant = User.objects.get(email='jamessmith@example.org')
+        Club_Member.objects.create(
+            user=other_applicant, authorization=Club_Member.APPLICANT, club=self.club
+        )
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['applicants'], [other_applicant])
+        next_page_url = response.context['next_page_url']
+
+        response = self.client.get(next_page_url)
+        self.assertEqual(response.context['applicants'], [self.applicant])
+        self.assertEqual(response.context['first_page_url'], self.url)
+        self.assertNotIn('next_page_url', response.context)
+
+    def test_get_applicants_list_search_by_full_name(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'john'})
+        self.assertEqual(response.context['applicants'], [self.applicant])
+        response = self.client.get(self.url, {'q': 'beth'})
+        self.assertEqual(response.context['applicants'], [])
+
     def test_get_applicants_list_redirects_user_when_authorization_is_member(self):
         """Test for redirecting member to member list from applicant list"""
 
@@ -0,0 +1,128 @@
+"""Unit tests for the club clusters view"""
+from clubs.clusters import MAX_CLUSTER_ZOOM, get_cluster_cell
+from clubs.geocoding import geocode_club
+from clubs.models import User, Club, Club_Cluster
+from clubs.tests.helpers import LogInTester, StubGeocoder, reverse_with_next
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from io import StringIO
+import random
+
+LONDON_ADDRESS = 'Bush House, London, WC2B 4BG, GB'
+LONDON = (51.5128, -0.1173)
+
+@override_settings(GEOCODING_WORKERS=0, CLUSTERS_MAX_CELLS=64)
+class ClubClustersViewTestCase(TestCase, LogInTester):
+    """Unit tests for the club clusters view"""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(email='bobsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+        self.other_club = Club.objects.get(name='Flying Orangutans 2')
+        self.url = reverse('club_clusters')
+
+    def locate_club(self, club, latitude, longitude):
+        club.latitude = latitude
+        club.longitude = longitude
+        club.save()
+
+    def get_clusters(self, south, west, north, east, zoom):
+        self.client.login(email=self.user.email, password='Password123')
+        return self.client.get(
+            self.url, {'south': south, 'west': west, 'north': north, 'east': east, 'zoom': zoom}
+        )
+
+    def assert_cluster_counts(self, latitude, longitude, count):
+        for zoom in range(MAX_CLUSTER_ZOOM + 1):
+            x, y = get_cluster_cell(latitude, longitude, zoom)
+            cluster = Club_Cluster.objects.filter(zoom=zoom, x=x, y=y).first()
+            self.assertEqual(cluster.count if cluster else 0, count)
+
+    def test_club_clusters_url(self):
+        self.assertEqual(self.url, '/club_clusters/')
+
+    def test_geocoded_club_is_added_to_its_clusters(self):
+        with StubGeocoder({LONDON_ADDRESS: LONDON}):
+            geocode_club(self.club.id)
+        self.assert_cluster_counts(*LONDON, 1)
+        self.assertEqual(Club_Cluster.objects.count(), MAX_CLUSTER_ZOOM + 1)
+
+    def test_geocoding_club_again_moves_it(self):
+        self.locate_club(self.club, 48.8566, 2.3522)
+        with StubGeocoder({LONDON_ADDRESS: LONDON}):
+            geocode_club(self.club.id)
+        self.assert_cluster_counts(*LONDON, 1)
+        self.assert_cluster_counts(48.8566, 2.3522, 0)
+
+    def test_moved_and_deleted_clubs_leave_their_clusters(self):
+        self.locate_club(self.club, *LONDON)
+        self.locate_club(self.other_club, *LONDON)
+        self.assert_cluster_counts(*LONDON, 2)
+        self.locate_club(self.other_club, 48.8566, 2.3522)
+        self.assert_cluster_counts(*LONDON, 1)
+        self.club.delete()
+        self.assert_cluster_counts(*LONDON, 0)
+        self.assertEqual(Club_Cluster.objects.count(), MAX_CLUSTER_ZOOM + 1)
+
+    def test_renaming_a_club_leaves_its_clusters(self):
+        self.locate_club(self.club, *LONDON)
+        self.club.name = 'Kerbal Chess Club'
+        self.club.save()
+        self.assert_cluster_counts(*LONDON, 1)
+
+    def test_clusters_in_box_are_returned(self):
+        self.locate_club(self.club, *LONDON)
+        self.locate_club(self.other_club, 51.5033, -0.1195)
+        response = self.get_clusters(51, -1, 52, 1, 6)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['zoom'], 6)
+        self.assertEqual(response.json()['clusters'], [{'latitude': 51.50805, 'longitude': -0.1184, 'count': 2}])
+        response = self.get_clusters(51.50, -0.125, 51.52, -0.11, 12)
+        self.assertEqual(response.json()['zoom'], 12)
+        self.assertEqual(len(response.json()['clusters']), 2)
+        response = self.get_clusters(40, 10, 45, 20, 6)
+        self.assertEqual(response.json()['clusters'], [])
+
+    def test_large_box_is_shown_zoomed_out_with_bounded_clusters(self):
+        randomness = random.Random(7)
+        for i in range(300):
+            club = Club.objects.create(name=f'Random Club {i}', description='Another club')
+            self.locate_club(club, randomness.uniform(-60, 60), randomness.uniform(-180, 180))
+        response = self.get_clusters(-85, -180, 85, 180, 12)
+        self.assertEqual(response.json()['zoom'], 0)
+        clusters = response.json()['clusters']
+        self.assertLessEqual(len(clusters), 64)
+        self.assertEqual(sum(cluster['count'] for cluster in clusters), 300)
+
+    def test_box_across_the_antimeridian(self):
+        self.locate_club(self.club, -18.1, 179.95)
+        self.locate_club(self.other_club, -18.1, -179.95)
+        response = self.get_clusters(-19, 179, -17, -179, 10)
+        self.assertEqual(sum(cluster['count'] for cluster in response.json()['clusters']), 2)
+
+    def test_invalid_box_is_rejected(self):
+        response = self.get_clusters(52, -1, 51, 1, 6)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('north', response.json()['errors'])
+
+    def test_rebuilt_clusters_match_the_kept_ones(self):
+        self.locate_club(self.club, *LONDON)
+        self.locate_club(self.other_club, 48.8566, 2.3522)
+        Club.objects.filter(id=self.other_club.id).update(latitude=40.4168, longitude=-3.7038)
+        output = StringIO()
+        call_command('rebuild_clusters', stdout=output)
+        self.assertIn('Rebuilt', output.getvalue())
+        self.assert_cluster_counts(*LONDON, 1)
+        self.assert_cluster_counts(40.4168, -3.7038, 1)
+        self.assert_cluster_counts(48.8566, 2.3522, 0)
+
+    def test_get_club_clusters_redirects_when_not_logged_in(self):
+        response = self.client.get(self.url)
+        self.assertRedirects(response, reverse_with_next('log_in', self.url), status_code=302, target_status_code=200)
@@ -2,9 +2,16 @@
 from clubs.helpers import get_all_clubs, get_my_clubs, get_other_clubs
 from clubs.models import User, Club, Club_Member
 from clubs.tests.helpers import LogInTester, reverse_with_next, NavbarTesterMixin
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
 
 # Used this from Clucker project with some modifications
 class DashboardViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
@@ -22,11 +29,11 @@ class DashboardViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.second_user = User.objects.get(email='bethsmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
         self.club_owner = Club_Member.objects.create(
-            user=self.user, authorization='OW', club=self.club
+            user=self.user, authorization=Club_Member.OWNER, club=self.club
         )
         self.second_club = Club.objects.get(name='Flying Orangutans 2')
         self.second_club_owner = Club_Member.objects.create(
-            user=self.second_user, authorization='OW', club=self.club
+            user=self.second_user, authorization=Club_Member.OWNER, club=self.club
         )
         self.url = reverse('dashboard')
 
@@ -64,6 +71,67 @@ class DashboardViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertEqual(all_clubs_count, (my_clubs_count + other_clubs_count))
         self.assertNotEqual(get_my_clubs(self.user), get_other_clubs(self.user))
 
+    def test_get_clubs_paired_with_authorization(self):
+        """Test that each of the user's clubs is shown with the user's authorization in it"""
+
+        Club_Member.objects.create(user=self.user, authorization=Club_Member.MEMBER, club=self.second_club)
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        club_auth = sorted(response.context['club_auth'], key=lambda pair: pair[0].id)
+        self.assertEqual(club_auth, [(self.club, 'Owner'), (self.second_club, 'Member')])
+        self.assertCountEqual(response.context['my_clubs'], [self.club, self.second_club])
+
+    def test_get_clubs_search_by_name(self):
+        """Test that only the clubs with a word of their name starting with the search are shown"""
+
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'flying orangutans 2'})
+        self.assertEqual(response.context['club_auth'], [])
+        self.assertEqual(response.context['other_clubs'], [self.second_club])
+        self.assertEqual(response.context['my_clubs'], [self.club])
+
+        response = self.client.get(self.url, {'q': 'Flying'})
+        self.assertEqual(response.context['club_auth'], [(self.club, 'Owner')])
+        self.assertEqual(response.context['other_clubs'], [self.second_club])
+
+        response = self.client.get(self.url, {'q': 'orangutans'})
+        self.assertEqual(response.context['club_auth'], [(self.club, 'Owner')])
+        self.assertEqual(response.context['other_clubs'], [self.second_club])
+
+        response = self.client.get(self.url, {'q': 'rangutans'})
+        self.assertEqual(response.context['club_auth'], [])
+        self.assertEqual(response.context['other_clubs'], [])
+
+    def test_get_clubs_sorted_by_city(self):
+        """Test that both the user's clubs and the other clubs are sorted by the given field"""
+
+        Club_Member.objects.create(user=self.user, authorization=Club_Member.MEMBER, club=self.second_club)
+        third_club = Club.objects.create(name='Kerbal Chess Club', city='Bath', country='GB', description='Chess')
+        fourth_club = Club.objects.create(name='Pawn Stars', city='Aberdeen', country='GB', description='Chess')
+        Club_Member.objects.create(user=self.user, authorization=Club_Member.MEMBER, club=third_club)
+        self.second_club.city = 'York'
+        self.second_club.save()
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url, {'sort': 'city'})
+        self.assertEqual(
+            [club for club, auth in response.context['club_auth']],
+            [third_club, self.club, self.second_club]
+        )
+        self.assertEqual(response.context['other_clubs'], [fourth_club])
+
+    @override_settings(CACHES=LOCAL_MEMORY_CACHES)
+    def test_other_clubs_cached_in_one_order_are_shown_in_another(self):
+        Club.objects.create(name='Aardvarks', city='York', country='GB', description='Chess')
+        Club.objects.create(name='Zebras', city='Aberdeen', country='GB', description='Chess')
+        self.client.login(email=self.user.email, password='Password123')
+        try:
+            content = self.client.get(self.url, {'sort': 'name'}).content.decode()
+            self.assertLess(content.index('Aardvarks'), content.index('Zebras'))
+            content = self.client.get(self.url, {'sort': 'city'}).content.decode()
+            self.assertLess(content.index('Zebras'), content.index('Aardvarks'))
+        finally:
+            cache.clear()
+
     """Unit tests to redirect when not logged in"""
 
     def test_get_dashboard_redirects_when_not_logged_in(self):
@@ -1,5 +1,5 @@
 """Unit tests for members list"""
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from clubs.models import User, Club_Member, Club
 from django.urls import reverse
 from clubs.tests.helpers import reverse_with_next
@@ -25,16 +25,16 @@ class MembersListViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.club = Club.objects.get(name='Flying Orangutans')
 
         Club_Member.objects.create(
-            user=self.owner, authorization='OW', club=self.club
+            user=self.owner, authorization=Club_Member.OWNER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.officer, authorization='OF', club=self.club
+            user=self.officer, authorization=Club_Member.OFFICER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.member, authorization='ME', club=self.club
+            user=self.member, authorization=Club_Member.MEMBER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.applicant, authorization='AP', club=self.club
+            user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club
         )
 
         self.url = reverse('members_list', kwargs={'club_id': self.club.id})
@@ -95,6 +95,127 @@ class MembersListViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assert_main_navbar(response)
         self.assert_club_navbar(response, self.club.id)
 
+    def test_get_members_list_groups_users_by_authorization(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['officers'], [self.officer])
+        self.assertEqual(response.context['members'], [self.member])
+        self.assertNotContains(response, self.applicant.get_full_name())
+
+    @override_settings(USERS_PAGE_SIZE=2)
+    def test_get_members_list_is_paginated(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['officers'], [self.officer])
+        self.assertEqual(response.context['members'], [])
+        self.assertNotIn('first_page_url', response.context)
+        next_page_url = response.context['next_page_url']
+        self.assertContains(response, next_page_url)
+
+        response = self.client.get(next_page_url)
+        self.assertEqual(response.context['owners'], [])
+        self.assertEqual(response.context['officers'], [])
+        self.assertEqual(response.context['members'], [self.member])
+        self.assertEqual(response.context['first_page_url'], self.url)
+        self.assertNotIn('next_page_url', response.context)
+
+    def test_get_members_list_with_invalid_cursor_shows_first_page(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'cursor': 'invalid'})
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['members'], [self.member])
+
+    def test_get_members_list_with_malformed_cursor_shows_first_page(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        # A cursor of ["bob", 3], where the chess experience level should be a number.
+        response = self.client.get(self.url, {'sort': 'experience', 'cursor': 'WyJib2IiLCAzXQ=='})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['members'], [self.member])
+
+    def test_get_members_list_search_by_full_name(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'q': ' B'})
+        self.assertEqual(response.context['search'], ' B')
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['officers'], [])
+        self.assertEqual(response.context['members'], [self.member])
+        self.assertNotContains(response, self.officer.get_full_name())
+
+        response = self.client.get(self.url, {'q': 'harry SMITH'})
+        self.assertEqual(response.context['officers'], [self.officer])
+        self.assertEqual(response.context['owners'], [])
+
+        response = self.client.get(self.url, {'q': 'john'})
+        self.assertEqual(response.context['members'], [])
+
+    def test_get_members_list_search_by_surname(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'SMI'})
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['officers'], [self.officer])
+        self.assertEqual(response.context['members'], [self.member])
+
+        # Only the start of each word is matched.
+        response = self.client.get(self.url, {'q': 'mith'})
+        self.assertEqual(response.context['owners'] + response.context['officers'] + response.context['members'], [])
+
+    @override_settings(USERS_PAGE_SIZE=1)
+    def test_get_members_list_search_is_paginated(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'q': 'b'})
+        self.assertEqual(response.context['owners'], [self.owner])
+        next_page_url = response.context['next_page_url']
+        self.assertIn('q=b', next_page_url)
+
+        response = self.client.get(next_page_url)
+        self.assertEqual(response.context['members'], [self.member])
+        self.assertNotIn('next_page_url', response.context)
+
+    @override_settings(USERS_PAGE_SIZE=1)
+    def test_get_members_list_sorted_by_name(self):
+        other_member = User.objects.create_user(
+            email='adamsmith@example.org', first_name='Adam', last_name='Smith', password='Password123'
+        )
+        Club_Member.objects.create(user=other_member, authorization=Club_Member.MEMBER, club=self.club)
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'sort': 'name'})
+        self.assertEqual(response.context['sort'], 'name')
+        listed_users = []
+        while True:
+            listed_users += response.context['owners'] + response.context['officers'] + response.context['members']
+            if 'next_page_url' not in response.context:
+                break
+            self.assertIn('sort=name', response.context['next_page_url'])
+            response = self.client.get(response.context['next_page_url'])
+        # By name within each authorization, as the users are listed by authorization.
+        self.assertEqual(listed_users, [self.owner, self.officer, other_member, self.member])
+
+    def test_get_members_list_sorted_by_experience(self):
+        other_member = User.objects.create_user(
+            email='adamsmith@example.org', first_name='Adam', last_name='Smith', password='Password123',
+            chess_experience=User.INTERMEDIATE
+        )
+        Club_Member.objects.create(user=other_member, authorization=Club_Member.MEMBER, club=self.club)
+        # Saved after joining, so the experience the members are sorted by is updated.
+        self.member.chess_experience = User.ADVANCED
+        self.member.save()
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'sort': 'experience'})
+        self.assertEqual(response.context['sort'], 'experience')
+        self.assertEqual(response.context['owners'], [self.owner])
+        self.assertEqual(response.context['officers'], [self.officer])
+        self.assertEqual(response.context['members'], [self.member, other_member])
+        self.assertContains(response, '<option value="experience" selected>')
+
+    def test_get_members_list_with_unknown_sort_is_sorted_by_role(self):
+        self.client.login(email=self.owner.email, password='Password123')
+        response = self.client.get(self.url, {'sort': 'password'})
+        self.assertEqual(response.context['sort'], 'role')
+        self.assertEqual(response.context['owners'], [self.owner])
+
     def test_get_members_list_by_applicant(self):
         """Test for redirecting applicant to waiting list from members list."""
 
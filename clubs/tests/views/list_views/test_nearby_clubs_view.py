@@ -0,0 +1,142 @@
+"""Unit tests for the nearby clubs views"""
+from clubs.forms import NearbyClubsForm
+from clubs.geo import get_distance, get_grid_cell
+from clubs.models import User, Club
+from clubs.tests.helpers import LogInTester, reverse_with_next
+from django.test import TestCase, override_settings
+from django.urls import reverse
+import random
+
+# Bush House in London, and other places the clubs are in.
+LONDON = (51.5128, -0.1173)
+PLACES = {
+    'Flying Orangutans': LONDON,
+    'Flying Orangutans 2': (51.5033, -0.1195),
+    'Cambridge Club': (52.2053, 0.1218),
+    'Paris Club': (48.8566, 2.3522),
+    'Sydney Club': (-33.8688, 151.2093),
+}
+
+class NearbyClubsViewTestCase(TestCase, LogInTester):
+    """Unit tests for the nearby clubs views"""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(email='bobsmith@example.org')
+        Club.objects.create(name='Cambridge Club', city='Cambridge', description='Another club')
+        Club.objects.create(name='Paris Club', city='Paris', description='Another club')
+        Club.objects.create(name='Sydney Club', city='Sydney', description='Another club')
+        Club.objects.create(name='Club Not Geocoded', description='Another club')
+        for name, (latitude, longitude) in PLACES.items():
+            self.locate_club(Club.objects.get(name=name), latitude, longitude)
+        self.url = reverse('nearby_clubs')
+        self.search_url = reverse('nearby_clubs_search')
+
+    def locate_club(self, club, latitude, longitude):
+        Club.objects.filter(id=club.id).update(
+            latitude=latitude,
+            longitude=longitude,
+            grid_cell=get_grid_cell(latitude, longitude),
+            geocode_status=Club.GEOCODED
+        )
+
+    def search(self, **params):
+        self.client.login(email=self.user.email, password='Password123')
+        return self.client.get(self.search_url, {'latitude': LONDON[0], 'longitude': LONDON[1], **params})
+
+    def get_club_names(self, response):
+        return [club['name'] for club in response.json()['clubs']]
+
+    def test_nearby_clubs_urls(self):
+        self.assertEqual(self.url, '/nearby_clubs/')
+        self.assertEqual(self.search_url, '/nearby_clubs/search/')
+
+    def test_nearest_clubs_are_found_in_order(self):
+        response = self.search(count=3)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.get_club_names(response),
+            ['Flying Orangutans', 'Flying Orangutans 2', 'Cambridge Club']
+        )
+        distances = [club['distance'] for club in response.json()['clubs']]
+        self.assertEqual(distances[0], 0)
+        self.assertAlmostEqual(distances[1], 1.07, places=1)
+
+    def test_nearest_clubs_are_found_however_far_away(self):
+        response = self.search(count=10)
+        self.assertEqual(len(response.json()['clubs']), 5)
+        self.assertEqual(self.get_club_names(response)[-1], 'Sydney Club')
+
+    def test_clubs_within_radius_are_found(self):
+        response = self.search(radius=100)
+        self.assertEqual(
+            self.get_club_names(response),
+            ['Flying Orangutans', 'Flying Orangutans 2', 'Cambridge Club']
+        )
+
+    def test_nearest_clubs_within_radius_are_found(self):
+        response = self.search(radius=400, count=10)
+        self.assertEqual(self.get_club_names(response)[-1], 'Paris Club')
+        response = self.search(radius=400, count=1)
+        self.assertEqual(self.get_club_names(response), ['Flying Orangutans'])
+
+    def test_default_number_of_clubs_is_found(self):
+        form = NearbyClubsForm({'latitude': 0, 'longitude': 0})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['count'], 10)
+
+    def test_most_clubs_are_found_within_radius(self):
+        form = NearbyClubsForm({'latitude': 0, 'longitude': 0, 'radius': 500})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['count'], 100)
+
+    @override_settings(NEARBY_CLUBS_MAX_COUNT=2)
+    def test_clubs_within_radius_are_capped(self):
+        response = self.search(radius=100)
+        self.assertEqual(self.get_club_names(response), ['Flying Orangutans', 'Flying Orangutans 2'])
+
+    def test_clubs_across_the_antimeridian_are_found(self):
+        fiji = Club.objects.create(name='Fiji Club', city='Suva', description='Another club')
+        self.locate_club(fiji, -18.1, 179.95)
+        response = self.search(latitude=-18.1, longitude=-179.95, radius=20)
+        self.assertEqual(self.get_club_names(response), ['Fiji Club'])
+
+    def test_nearest_clubs_match_every_distance(self):
+        randomness = random.Random(42)
+        for i in range(200):
+            club = Club.objects.create(name=f'Random Club {i}', description='Another club')
+            self.locate_club(club, randomness.uniform(49, 55), randomness.uniform(-5, 3))
+        clubs = Club.objects.filter(latitude__isnull=False)
+        expected = sorted(clubs, key=lambda club: (get_distance(*LONDON, club.latitude, club.longitude), club.id))
+        response = self.search(count=25)
+        self.assertEqual([club['id'] for club in response.json()['clubs']], [club.id for club in expected[:25]])
+
+    def test_invalid_point_is_rejected(self):
+        response = self.search(latitude=91)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('latitude', response.json()['errors'])
+
+    def test_get_nearby_clubs_page(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'nearby_clubs.html')
+        self.assertNotIn('nearby_clubs', response.context)
+        response = self.client.get(self.url, {'latitude': LONDON[0], 'longitude': LONDON[1], 'radius': 2})
+        self.assertEqual([club.name for club in response.context['nearby_clubs']], ['Flying Orangutans', 'Flying Orangutans 2'])
+        self.assertContains(response, '1.1 km away')
+
+    def test_dashboard_links_to_nearby_clubs(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('dashboard'))
+        self.assertContains(response, f'href="{self.url}"')
+
+    def test_get_nearby_clubs_redirects_when_not_logged_in(self):
+        for url in [self.url, self.search_url]:
+            response = self.client.get(url)
+            self.assertRedirects(response, reverse_with_next('log_in', url), status_code=302, target_status_code=200)
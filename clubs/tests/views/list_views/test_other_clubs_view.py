@@ -0,0 +1,91 @@
+"""Unit tests for the other clubs view"""
+from clubs.models import User, Club, Club_Member
+from clubs.tests.helpers import LogInTester, reverse_with_next
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+
+@override_settings(CLUBS_PAGE_SIZE=2)
+class OtherClubsViewTestCase(TestCase, LogInTester):
+    """Unit tests for the other clubs view"""
+
+    fixtures = [
+        'clubs/tests/fixtures/default_user.json',
+        'clubs/tests/fixtures/default_club.json',
+        'clubs/tests/fixtures/other_clubs.json'
+    ]
+
+    def setUp(self):
+        self.user = User.objects.get(email='bobsmith@example.org')
+        self.club = Club.objects.get(name='Flying Orangutans')
+        Club_Member.objects.create(user=self.user, authorization=Club_Member.OWNER, club=self.club)
+        for i in range(3, 6):
+            Club.objects.create(name=f'Flying Orangutans {i}', description='Another club')
+        self.other_clubs = list(Club.objects.exclude(id=self.club.id).order_by('id'))
+        self.url = reverse('other_clubs')
+
+    def test_other_clubs_url(self):
+        self.assertEqual(self.url, '/dashboard/other_clubs/')
+
+    def test_dashboard_shows_first_page_of_other_clubs(self):
+        self.client.login(email=self.user.email, password='Password123')
+        response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.context['other_clubs'], self.other_clubs[:2])
+        self.assertContains(response, 'id="other_clubs_sentinel"')
+
+    def test_get_other_clubs_pages(self):
+        self.client.login(email=self.user.email, password='Password123')
+        dashboard_response = self.client.get(reverse('dashboard'))
+        next_url = dashboard_response.context['other_clubs_next_url']
+        loaded_club_ids = []
+        while next_url:
+            page = self.client.get(next_url).json()
+            loaded_club_ids += [club['id'] for club in page['clubs']]
+            next_url = page['next_url']
+        self.assertEqual(loaded_club_ids, [club.id for club in self.other_clubs[2:]])
+
+    def test_get_other_clubs_excludes_my_clubs(self):
+        self.client.login(email=self.user.email, password='Password123')
+        page = self.client.get(self.url).json()
+        self.assertNotIn(self.club.id, [club['id'] for club in page['clubs']])
+        self.assertEqual(page['clubs'][0]['url'], reverse('show_club', kwargs={'club_id': self.other_clubs[0].id}))
+
+    def test_get_other_clubs_with_invalid_cursor_starts_from_first_page(self):
+        self.client.login(email=self.user.email, password='Password123')
+        page = self.client.get(self.url, {'cursor': 'not a cursor'}).json()
+        self.assertEqual([club['id'] for club in page['clubs']], [club.id for club in self.other_clubs[:2]])
+
+    def test_get_other_clubs_with_malformed_cursor_starts_from_first_page(self):
+        self.client.login(email=self.user.email, password='Password123')
+        # A cursor of ["abc"], where the id of a club should be.
+        page = self.client.get(self.url, {'cursor': 'WyJhYmMiXQ=='}).json()
+        self.assertEqual([club['id'] for club in page['clubs']], [club.id for club in self.other_clubs[:2]])
+
+    def test_get_other_clubs_search_by_name(self):
+        self.client.login(email=self.user.email, password='Password123')
+        dashboard_response = self.client.get(reverse('dashboard'), {'q': 'flying orangutans '})
+        self.assertEqual(dashboard_response.context['search'], 'flying orangutans ')
+        next_url = dashboard_response.context['other_clubs_next_url']
+        self.assertIn('q=flying', next_url)
+
+        page = self.client.get(next_url).json()
+        self.assertEqual([club['name'] for club in page['clubs']], ['Flying Orangutans 4', 'Flying Orangutans 5'])
+        self.assertIsNone(page['next_url'])
+
+    def test_get_other_clubs_sorted_by_name(self):
+        self.client.login(email=self.user.email, password='Password123')
+        dashboard_response = self.client.get(reverse('dashboard'), {'sort': 'name'})
+        next_url = dashboard_response.context['other_clubs_next_url']
+        self.assertIn('sort=name', next_url)
+        loaded_club_names = [club.name for club in dashboard_response.context['other_clubs']]
+        while next_url:
+            page = self.client.get(next_url).json()
+            loaded_club_names += [club['name'] for club in page['clubs']]
+            next_url = page['next_url']
+        self.assertEqual(loaded_club_names, sorted(club.name for club in self.other_clubs))
+
+    def test_get_other_clubs_redirects_when_not_logged_in(self):
+        redirect_url = reverse_with_next('log_in', self.url)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, redirect_url, status_code=302, target_status_code=200)
+        self.assertFalse(self._is_logged_in())
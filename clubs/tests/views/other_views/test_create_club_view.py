@@ -22,10 +22,10 @@ class CreateClubViewTestCase(TestCase, LogInTester, NavbarTesterMixin, AssertHTM
         self.secondary_user = User.objects.get(email='bethsmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
         Club_Member.objects.create(
-            user=self.user, authorization='ME', club=self.club
+            user=self.user, authorization=Club_Member.MEMBER, club=self.club
         )
         Club_Member.objects.create(
-            user=self.secondary_user, authorization='AP', club=self.club
+            user=self.secondary_user, authorization=Club_Member.APPLICANT, club=self.club
         )
         self.valid_form_input = {
             'name': 'Orangutan',
@@ -92,50 +92,21 @@ class CreateClubViewTestCase(TestCase, LogInTester, NavbarTesterMixin, AssertHTM
 
     """Unit tests to post unsuccessful create club form by any user"""
 
-    def test_unsuccesful_create_club_via_bad_address(self):
+    def test_create_club_does_not_wait_for_geocoding(self):
         self.client.login(email=self.user.email, password='Password123')
         before_count_club = Club.objects.count()
-        before_count_clubmember = Club_Member.objects.count()
         self.valid_form_input['address'] = "AAAAAAAAAAAAAAAAAbdadress"
-        response = self.client.post(self.url, self.valid_form_input, follow=True)
-        self.assert_main_navbar(response)
-        after_count_club = Club.objects.count()
-        self.assertEqual(after_count_club, before_count_club)
-        after_count_clubmember = Club_Member.objects.count()
-        self.assertEqual(after_count_clubmember, before_count_clubmember)
-        response_url = reverse('create_club')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'create_club.html')
-
-    def test_unsuccesful_create_club_via_bad_city(self):
-        self.client.login(email=self.user.email, password='Password123')
-        before_count_club = Club.objects.count()
-        before_count_clubmember = Club_Member.objects.count()
-        self.valid_form_input['city'] = "ldn"
-        response = self.client.post(self.url, self.valid_form_input, follow=True)
-        self.assert_main_navbar(response)
-        after_count_club = Club.objects.count()
-        self.assertEqual(after_count_club, before_count_club)
-        after_count_clubmember = Club_Member.objects.count()
-        self.assertEqual(after_count_clubmember, before_count_clubmember)
-        response_url = reverse('create_club')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'create_club.html')
-
-    def test_unsuccesful_create_club_via_bad_postal_code(self):
-        self.client.login(email=self.user.email, password='Password123')
-        before_count_club = Club.objects.count()
-        before_count_clubmember = Club_Member.objects.count()
-        self.valid_form_input['postal_code'] = "badpostalcode"
-        response = self.client.post(self.url, self.valid_form_input, follow=True)
-        self.assert_main_navbar(response)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(self.url, self.valid_form_input, follow=True)
+        self.assertRedirects(response, reverse('dashboard'), status_code=302, target_status_code=200)
         after_count_club = Club.objects.count()
-        self.assertEqual(after_count_club, before_count_club)
-        after_count_clubmember = Club_Member.objects.count()
-        self.assertEqual(after_count_clubmember, before_count_clubmember)
-        response_url = reverse('create_club')
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'create_club.html')
+        self.assertEqual(after_count_club, before_count_club + 1)
+        # The geocoding job only runs once the club is committed.
+        self.assertEqual(len(callbacks), 1)
+        club = Club.objects.get(name='Orangutan')
+        self.assertEqual(club.geocode_status, Club.PENDING)
+        self.assertIsNone(club.latitude)
+        self.assertIsNone(club.longitude)
 
     def test_unsuccesful_create_club_via_bad_country(self):
         self.client.login(email=self.user.email, password='Password123')
@@ -18,7 +18,7 @@ class HomeViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.user = User.objects.get(email='bobsmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
         self.club_applicant = Club_Member.objects.create(
-            user=self.user, authorization='AP', club=self.club
+            user=self.user, authorization=Club_Member.APPLICANT, club=self.club
         )
 
     def test_get_home_page(self):
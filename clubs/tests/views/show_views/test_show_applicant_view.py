@@ -19,17 +19,17 @@ class ShowApplicantViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
     def setUp(self):
         self.applicant = User.objects.get(email='bobsmith@example.org')
         self.club = Club.objects.get(name='Flying Orangutans')
-        self.club_applicant = Club_Member.objects.create(user=self.applicant, authorization="AP", club=self.club)
+        self.club_applicant = Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
         self.member = User.objects.get(email='jamessmith@example.org')
-        self.club_member = Club_Member.objects.create(user=self.member, authorization="ME", club=self.club)
+        self.club_member = Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
         self.officer = User.objects.get(email='bethsmith@example.org')
-        self.officer_club = Club_Member.objects.create(user=self.officer, authorization="OF", club=self.club)
+        self.officer_club = Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
         self.owner = User.objects.get(email='kellysmith@example.org')
-        self.club_owner = Club_Member.objects.create(user=self.owner, authorization="OW", club=self.club)
+        self.club_owner = Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
 
         self.different_applicant = User.objects.get(email='bobjone@example.org')
         self.different_club = Club.objects.get(name='Flying Orangutans 2')
-        self.different_club_applicant = Club_Member.objects.create(user=self.different_applicant, authorization="AP",
+        self.different_club_applicant = Club_Member.objects.create(user=self.different_applicant, authorization=Club_Member.APPLICANT,
                                                                    club=self.different_club)
 
         self.target_user = User.objects.get(email='bobsmith@example.org')
@@ -85,7 +85,7 @@ class ShowApplicantViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         user1 = User.objects.create_user(email="a@example.com", first_name="a", last_name="a", chess_experience="BG",
                                          password='Password123')
-        club_member1 = Club_Member.objects.create(user=user1, authorization='ME', club=self.club)
+        club_member1 = Club_Member.objects.create(user=user1, authorization=Club_Member.MEMBER, club=self.club)
         target_user1 = User.objects.get(email='a@example.com')
         url1 = reverse('show_applicant', kwargs={'club_id': self.club.id, 'applicant_id': target_user1.id})
         response = self.client.get(url1, follow=True)
@@ -99,7 +99,7 @@ class ShowApplicantViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.assertTrue(self._is_logged_in())
         user1 = User.objects.create_user(email="a@example.com", first_name="a", last_name="a", chess_experience="BG",
                                          password='Password123')
-        club_member1 = Club_Member.objects.create(user=user1, authorization='ME', club=self.club)
+        club_member1 = Club_Member.objects.create(user=user1, authorization=Club_Member.MEMBER, club=self.club)
         target_user1 = User.objects.get(email='a@example.com')
         url1 = reverse('show_applicant', kwargs={'club_id': self.club.id, 'applicant_id': target_user1.id})
         response = self.client.get(url1, follow=True)
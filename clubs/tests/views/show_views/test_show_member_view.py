@@ -20,17 +20,17 @@ class ShowMemberViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
     def setUp(self):
         self.club = Club.objects.get(name='Flying Orangutans')
         self.applicant = User.objects.get(email='kellysmith@example.org')
-        self.club_applicant = Club_Member.objects.create(user=self.applicant, authorization="AP", club=self.club)
+        self.club_applicant = Club_Member.objects.create(user=self.applicant, authorization=Club_Member.APPLICANT, club=self.club)
         self.owner = User.objects.get(email='bobsmith@example.org')
-        self.club_owner = Club_Member.objects.create(user=self.owner, authorization='OW', club=self.club)
+        self.club_owner = Club_Member.objects.create(user=self.owner, authorization=Club_Member.OWNER, club=self.club)
         self.officer = User.objects.get(email='bethsmith@example.org')
-        self.officer_club = Club_Member.objects.create(user=self.officer, authorization="OF", club=self.club)
+        self.officer_club = Club_Member.objects.create(user=self.officer, authorization=Club_Member.OFFICER, club=self.club)
         self.member = User.objects.get(email='jamessmith@example.org')
-        self.club_member = Club_Member.objects.create(user=self.member, authorization="ME", club=self.club)
+        self.club_member = Club_Member.objects.create(user=self.member, authorization=Club_Member.MEMBER, club=self.club)
 
         self.different_applicant = User.objects.get(email='bobjone@example.org')
         self.different_club = Club.objects.get(name='Flying Orangutans 2')
-        self.different_club_applicant = Club_Member.objects.create(user=self.different_applicant, authorization="AP",
+        self.different_club_applicant = Club_Member.objects.create(user=self.different_applicant, authorization=Club_Member.APPLICANT,
                                                                    club=self.different_club)
 
         self.target_user = User.objects.get(email='jamessmith@example.org')
@@ -77,7 +77,7 @@ class ShowMemberViewTestCase(TestCase, LogInTester, NavbarTesterMixin):
         self.client.login(email=self.member.email, password='Password123')
         self.assertTrue(self._is_logged_in())
         member2 = User.objects.get(email='marrysmith@example.org')
-        club_member2 = Club_Member.objects.create(user=member2, authorization="ME", club=self.club)
+        club_member2 = Club_Member.objects.create(user=member2, authorization=Club_Member.MEMBER, club=self.club)
         response = self.client.get(self.url)
         self.assert_main_navbar(response)
         self.assertEqual(response.status_code, 200)
@@ -92,14 +92,6 @@ class UpdateUserView(LoginRequiredMixin, UpdateView):
         user = self.request.user
         return user
 
-    def get_context_data(self, **kwargs):
-        """Generate context data to be shown in the template."""
-
-        context = super().get_context_data(**kwargs)
-        context['my_clubs'] = get_my_clubs(self.request.user)
-
-        return context
-
     def get_success_url(self):
         """Return redirect URL to dashboard after successful update."""
 
@@ -130,14 +122,6 @@ class ChangePasswordView(LoginRequiredMixin, FormView):
         else:
             return super().form_invalid(form)
 
-    def get_context_data(self, **kwargs):
-        """Generate context data to be shown in the template."""
-
-        context = super().get_context_data(**kwargs)
-        context['my_clubs'] = get_my_clubs(self.request.user)
-
-        return context
-
     def get_success_url(self):
         """Return redirect URL to dashboard after changing the password successfully."""
 
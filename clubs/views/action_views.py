@@ -5,16 +5,18 @@ from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView
 
-class ActionView(TemplateView):
+class ActionView(ClubMembershipMixin, TemplateView):
     """Abstract Class for Views that make an action in the application."""
 
     def get(self, request, *args, **kwargs):
         """Handle get request."""
 
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         current_user = request.user
         user = get_user(kwargs[self.id_name])
-        if (self.is_actionable(current_user, user, club)):
+        # The current user's authorization came with the membership, so only the user's is fetched.
+        user_authorization = get_authorization(user, club) if user else None
+        if (self.is_actionable(self.membership.authorization, user_authorization)):
             self.action(current_user, user, club)
         return redirect(self.redirect_location, kwargs['club_id'])
 
@@ -24,14 +26,15 @@ class ApproveApplicantView(OfficersRequiredMixin, ActionView):
     redirect_location = 'applicants_list'
     id_name = 'applicant_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if the user can be promoted."""
-        return (is_officer(current_user, club) or is_owner(current_user, club)) and is_applicant(user, club)
+        return (is_authorization_at_least(current_authorization, Club_Member.OFFICER)
+            and user_authorization == Club_Member.APPLICANT)
 
     def action(self, current_user, user, club):
         """Change user's authorization from applicant to member"""
         messages.success(self.request, f"You have approved applicant")
-        set_authorization(user, club, "ME")
+        set_authorization(user, club, Club_Member.MEMBER)
 
     def get(self, request, *args, **kwargs):
         """Handle get request."""
@@ -44,10 +47,11 @@ class RejectApplicantView(OfficersRequiredMixin, ActionView):
     redirect_location = 'applicants_list'
     id_name = 'applicant_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if the applicant can be rejected."""
 
-        return (is_officer(current_user, club) or is_owner(current_user, club)) and is_applicant(user, club)
+        return (is_authorization_at_least(current_authorization, Club_Member.OFFICER)
+            and user_authorization == Club_Member.APPLICANT)
 
     def action(self, current_user, user, club):
         """Remove the applicant from the club."""
@@ -65,15 +69,15 @@ class PromoteMemberView(OwnersRequiredMixin, ActionView):
     redirect_location = 'members_list'
     id_name = 'member_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if the member can be promoted."""
 
-        return is_owner(current_user, club) and is_member(user, club)
+        return current_authorization == Club_Member.OWNER and user_authorization == Club_Member.MEMBER
 
     def action(self, current_user, user, club):
         """Promote member to officer."""
         messages.success(self.request, f"You have promoted the member successfully")
-        set_authorization(user, club, "OF")
+        set_authorization(user, club, Club_Member.OFFICER)
 
     def get(self, request, *args, **kwargs):
         """Handle get request."""
@@ -86,15 +90,15 @@ class DemoteOfficerView(OwnersRequiredMixin, ActionView):
     redirect_location = 'members_list'
     id_name = 'member_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if officer can be demoted."""
 
-        return is_owner(current_user, club) and is_officer(user, club)
+        return current_authorization == Club_Member.OWNER and user_authorization == Club_Member.OFFICER
 
     def action(self, current_user, user, club):
         """Demote the officer to member"""
         messages.success(self.request, f"You have demoted the member successfully")
-        set_authorization(user, club, "ME")
+        set_authorization(user, club, Club_Member.MEMBER)
 
     def get(self, request, *args, **kwargs):
         """Handle get request."""
@@ -107,14 +111,13 @@ class RemoveUserView(OfficersRequiredMixin, ActionView):
     redirect_location = 'members_list'
     id_name = 'user_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if the user can be removed."""
 
-        cu_is_owner = is_owner(current_user, club)
-        cu_is_officer = is_officer(current_user, club)
-        u_is_officer = is_officer(user, club)
-        u_is_member = is_member(user, club)
-        return (cu_is_owner and (u_is_officer or u_is_member)) or (cu_is_officer and u_is_member)
+        # Officers can remove members, and owners can remove officers and members.
+        return (is_authorization_at_least(current_authorization, Club_Member.OFFICER)
+            and is_authorization_at_least(user_authorization, Club_Member.MEMBER)
+            and user_authorization < current_authorization)
 
     def action(self, current_user, user, club):
         """Remove user from the club"""
@@ -132,16 +135,16 @@ class TransferOwnershipView(OwnersRequiredMixin, ActionView):
     redirect_location = 'members_list'
     id_name = 'member_id'
 
-    def is_actionable(self, current_user, user, club):
+    def is_actionable(self, current_authorization, user_authorization):
         """Check if the ownership can be transferred to a valid officer."""
 
-        return is_owner(current_user, club) and is_officer(user, club)
+        return current_authorization == Club_Member.OWNER and user_authorization == Club_Member.OFFICER
 
     def action(self, current_user, user, club):
         """Transfer ownership to officer and demote owner to officer."""
         messages.success(self.request, f"You have transferred the ownership successfully")
-        set_authorization(user, club, "OW")
-        set_authorization(current_user, club, "OF")
+        set_authorization(user, club, Club_Member.OWNER)
+        set_authorization(current_user, club, Club_Member.OFFICER)
 
     def get(self, request, *args, **kwargs):
         """Handle get request."""
@@ -153,10 +156,10 @@ class LeaveClubView(LoginRequiredMixin, ActionView):
 
     redirect_location = 'dashboard'
 
-    def is_actionable(self, current_user, club):
+    def is_actionable(self, current_authorization):
         """Check if the user can leave the club."""
         # Only members and officers can leave a club
-        return is_member(current_user, club) or is_officer(current_user, club)
+        return current_authorization in (Club_Member.MEMBER, Club_Member.OFFICER)
 
     def action(self, current_user, club):
         """Remove the user from the club."""
@@ -166,14 +169,14 @@ class LeaveClubView(LoginRequiredMixin, ActionView):
     def get(self, request, *args, **kwargs):
         """Handle get request and redirect the user to dashboard if the user is not able to leave the club."""
 
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         current_user = request.user
-        if (self.is_actionable(current_user, club)):
+        if (self.is_actionable(self.membership.authorization)):
             self.action(current_user, club)
         return redirect(self.redirect_location)
 
 #Mainined ActionView REVIEW IF CAN BE AN ActionView
-class ApplyClubView(LoginRequiredMixin, TemplateView):
+class ApplyClubView(LoginRequiredMixin, ClubMembershipMixin, TemplateView):
     """View that allows user to apply for a club."""
 
     redirect_location = 'dashboard'
@@ -181,18 +184,18 @@ class ApplyClubView(LoginRequiredMixin, TemplateView):
     def is_actionable(self, current_user, user, club):
         """Check if the user is in the club that the user is trying to apply to."""
 
-        return not is_user_in_club(current_user, club)
+        return self.membership.club_member is None
 
     def action(self, current_user, user, club):
         """Set the user's authorization to an applicant for the club and redirect to waiting list."""
         messages.success(self.request, f"You have applied to the club successfully")
-        Club_Member.objects.create(user=current_user, club=club, authorization='AP')
+        Club_Member.objects.create(user=current_user, club=club, authorization=Club_Member.APPLICANT)
         self.redirect_location = 'waiting_list'
 
     def get(self, request, *args, **kwargs):
         """Handle get request and redirect user to dashboard if user is not able to apply for the club."""
 
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         current_user = request.user
         user = None
 
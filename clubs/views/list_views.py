@@ -1,8 +1,11 @@
 """Views for list-related purposes."""
+from clubs.forms import ClubClustersForm, NearbyClubsForm
 from clubs.helpers import *
 from clubs.views.mixins import *
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.views.generic import TemplateView
+from django.http import JsonResponse
+from django.urls import reverse
+from django.views.generic import TemplateView, View
 
 class MembersListView(MembersRequiredMixin, TemplateView):
     """View to display member list"""
@@ -13,15 +16,20 @@ class MembersListView(MembersRequiredMixin, TemplateView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        club = get_club(kwargs['club_id'])
-        current_user = self.request.user
+        club = self.membership.club
 
         context['club_id'] = kwargs['club_id']
-        context['my_clubs'] = get_my_clubs(current_user)
-        context['my_authorization'] = get_authorization_text(current_user, club)
-        context['members'] = get_members(club)
-        context['officers'] = get_officers(club)
-        context['owners'] = get_owners(club)
+        context['my_authorization'] = self.membership.authorization_text
+        cursor = self.request.GET.get('cursor')
+        search = self.request.GET.get('q', '')
+        sort = get_users_sort(self.request.GET.get('sort'), search)
+        roster, next_cursor = get_roster_page(club, Club_Member.MEMBER, cursor, search=search, sort=sort)
+        context['search'] = search
+        context['sort'] = sort
+        context['members'] = roster[Club_Member.MEMBER]
+        context['officers'] = roster[Club_Member.OFFICER]
+        context['owners'] = roster[Club_Member.OWNER]
+        add_page_urls(context, self.request, cursor, next_cursor)
 
         return context
 
@@ -34,13 +42,17 @@ class ApplicantsListView(OfficersRequiredMixin, TemplateView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        club = get_club(kwargs['club_id'])
-        current_user = self.request.user
+        club = self.membership.club
 
         context['club_id'] = kwargs['club_id']
-        context['my_clubs'] = get_my_clubs(current_user)
-        context['my_authorization'] = get_authorization_text(current_user, club)
-        context['applicants'] = get_applicants(club)
+        context['my_authorization'] = self.membership.authorization_text
+        cursor = self.request.GET.get('cursor')
+        search = self.request.GET.get('q', '')
+        sort = get_users_sort(self.request.GET.get('sort'), search)
+        context['applicants'], next_cursor = get_applicants_page(club, cursor, search=search, sort=sort)
+        context['search'] = search
+        context['sort'] = sort
+        add_page_urls(context, self.request, cursor, next_cursor)
 
         return context
 
@@ -54,10 +66,103 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
         context = super().get_context_data(**kwargs)
         current_user = self.request.user
-        my_clubs = get_my_clubs(current_user)
+        search = self.request.GET.get('q', '')
+        sort = self.request.GET.get('sort', '')
+        club_auth = get_club_to_auth(current_user)
+
+        # Already fetched along with the authorizations, so the menu needs no cached copy here.
+        context['my_clubs'] = [club for club, auth in club_auth]
+        context['club_auth'] = sort_club_to_auth(search_club_to_auth(club_auth, search), sort)
+        context['search'] = search
+        context['sort'] = sort
+        other_clubs, next_cursor = get_other_clubs_page(current_user, search=search, sort=sort)
+        context['other_clubs'] = other_clubs
+        if next_cursor:
+            context['other_clubs_next_url'] = get_page_url(self.request, next_cursor, reverse('other_clubs'))
+
+        return context
+
+class OtherClubsView(LoginRequiredMixin, View):
+    """View to load the next page of other clubs shown in the dashboard"""
+
+    def get(self, request, *args, **kwargs):
+        """Handle get request."""
+
+        other_clubs, next_cursor = get_other_clubs_page(
+            request.user,
+            request.GET.get('cursor'),
+            search=request.GET.get('q', ''),
+            sort=request.GET.get('sort', '')
+        )
+        return JsonResponse({
+            'clubs': [
+                {
+                    'id': club.id,
+                    'name': club.name,
+                    'city': club.city,
+                    'url': reverse('show_club', kwargs={'club_id': club.id}),
+                }
+                for club in other_clubs
+            ],
+            'next_url': get_page_url(request, next_cursor) if next_cursor else None,
+        })
+
+class NearbyClubsView(LoginRequiredMixin, TemplateView):
+    """View to display the clubs near a point"""
+
+    template_name = "nearby_clubs.html"
 
-        context['my_clubs'] = my_clubs
-        context['club_auth'] = get_club_to_auth(current_user, my_clubs)
-        context['other_clubs'] = get_other_clubs(current_user)
+    def get_context_data(self, **kwargs):
+        """Generate context data to be shown in the template."""
+
+        context = super().get_context_data(**kwargs)
+        form = NearbyClubsForm(self.request.GET or None)
+        context['form'] = form
+        if form.is_valid():
+            context['nearby_clubs'] = get_nearby_clubs(**form.cleaned_data)
 
         return context
+
+class NearbyClubsSearchView(LoginRequiredMixin, View):
+    """View to look for the clubs near a point, answering with their distances"""
+
+    def get(self, request, *args, **kwargs):
+        """Handle get request."""
+
+        form = NearbyClubsForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+        return JsonResponse({
+            'clubs': [
+                {
+                    'id': club.id,
+                    'name': club.name,
+                    'city': club.city,
+                    'latitude': club.latitude,
+                    'longitude': club.longitude,
+                    'distance': round(club.distance, 3),
+                    'url': reverse('show_club', kwargs={'club_id': club.id}),
+                }
+                for club in get_nearby_clubs(**form.cleaned_data)
+            ],
+        })
+
+class ClubClustersView(LoginRequiredMixin, View):
+    """View to show the clubs in a box of the map as clusters"""
+
+    def get(self, request, *args, **kwargs):
+        """Handle get request."""
+
+        form = ClubClustersForm(request.GET)
+        if not form.is_valid():
+            return JsonResponse({'errors': form.errors}, status=400)
+        zoom, clusters = get_club_clusters(**form.cleaned_data)
+        cluster_data = []
+        for cluster in clusters:
+            latitude, longitude = cluster.get_location()
+            cluster_data.append({
+                'latitude': round(latitude, 6),
+                'longitude': round(longitude, 6),
+                'count': cluster.count,
+            })
+        return JsonResponse({'zoom': zoom, 'clusters': cluster_data})
@@ -1,9 +1,11 @@
 """Mixins for the views."""
-from clubs.helpers import get_authorization, get_club
+from clubs.helpers import get_club, get_club_member
+from clubs.models import Club_Member
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.shortcuts import redirect
+from django.utils.functional import cached_property
 
 class LoginProhibitedMixin():
     """Mixin that redirects when a user is logged in."""
@@ -15,15 +17,72 @@ class LoginProhibitedMixin():
             return redirect(settings.REDIRECT_URL_WHEN_LOGGED_IN)
         return super().dispatch(*args, **kwargs)
 
-class ClubAuthorizationRequiredMixin(LoginRequiredMixin):
-    """Mixin that redirects the user if the user does not have an authorization."""
+class ClubMembership():
+    """The club given in the URL and the current user's membership of it."""
+
+    def __init__(self, user, club_id):
+        self.user = user
+        self.club_id = club_id
+        self.club_member = get_club_member(user, club_id)
+
+    @cached_property
+    def club(self):
+        """Return the club, reusing the one fetched with the membership when there is one."""
+
+        if self.club_member is not None:
+            return self.club_member.club
+        return get_club(self.club_id)
+
+    @property
+    def authorization(self):
+        """Return the authorization of the user, the same way get_authorization does."""
+
+        if self.user is None or self.user.is_anonymous:
+            return ""
+        if self.club_member is None:
+            return None
+        return self.club_member.authorization
+
+    @property
+    def authorization_text(self):
+        """Return the full text of the authorization of the user."""
+
+        if self.club_member is None:
+            return None
+        return self.club_member.get_authorization_display()
+
+class ClubMembershipMixin():
+    """Mixin that resolves the club and the current user's membership once per request."""
+
+    @cached_property
+    def membership(self):
+        """Return the membership of the current user in the club given in the URL."""
+
+        return ClubMembership(self.request.user, self.kwargs['club_id'])
+
+class ClubAuthorizationRequiredMixin(ClubMembershipMixin, LoginRequiredMixin):
+    """Mixin that redirects the user if the user does not have the required authorization."""
+
+    required_authorization = Club_Member.APPLICANT
+
+    # Message and redirect for each authorization lower than the required one.
+    insufficient_authorization_redirects = {
+        Club_Member.APPLICANT: ("You are not a member of this club", settings.REDIRECT_URL_WHEN_APPLICANT),
+        Club_Member.MEMBER: ("You are not an officer of this club", settings.REDIRECT_URL_WHEN_MEMBER),
+        Club_Member.OFFICER: ("You are not the owner of this club", settings.REDIRECT_URL_WHEN_OFFICER),
+    }
 
     def dispatch(self, *args, **kwargs):
-        """Redirect when user does not have an authorization, or dispatch as normal otherwise."""
+        """Redirect when user does not have the required authorization, or dispatch as normal otherwise."""
 
-        if get_authorization(self.request.user, get_club(self.kwargs['club_id'])) == None:
+        authorization = self.membership.authorization
+        if authorization == None:
             messages.add_message(self.request, messages.ERROR, "You are not a part of this club")
             return redirect(settings.REDIRECT_URL_WHEN_NO_CLUB_AUTHORIZATION)
+        if authorization and authorization < self.required_authorization:
+            message, redirect_url = self.insufficient_authorization_redirects[authorization]
+            messages.add_message(self.request, messages.ERROR, message)
+            return redirect(redirect_url, self.kwargs['club_id'])
         return super().dispatch(*args, **kwargs)
 
 class ApplicantsOnlyMixin(ClubAuthorizationRequiredMixin):
@@ -32,7 +91,7 @@ class ApplicantsOnlyMixin(ClubAuthorizationRequiredMixin):
     def dispatch(self, *args, **kwargs):
         """Redirect when user is not applicant, or dispatch as normal otherwise."""
 
-        if get_authorization(self.request.user, get_club(self.kwargs['club_id'])) != 'AP':
+        if self.membership.authorization != Club_Member.APPLICANT:
             messages.add_message(self.request, messages.ERROR, "You are not an applicant")
             return redirect(settings.REDIRECT_URL_WHEN_MEMBER, self.kwargs['club_id'])
         return super().dispatch(*args, **kwargs)
@@ -40,32 +99,14 @@ class ApplicantsOnlyMixin(ClubAuthorizationRequiredMixin):
 class MembersRequiredMixin(ClubAuthorizationRequiredMixin):
     """Mixin that redirects the user if the user is applicant."""
 
-    def dispatch(self, *args, **kwargs):
-        """Redirect when user is applicant, or dispatch as normal otherwise."""
-
-        if get_authorization(self.request.user, get_club(self.kwargs['club_id'])) == 'AP':
-            messages.add_message(self.request, messages.ERROR, "You are not a member of this club")
-            return redirect(settings.REDIRECT_URL_WHEN_APPLICANT, self.kwargs['club_id'])
-        return super().dispatch(*args, **kwargs)
+    required_authorization = Club_Member.MEMBER
 
-class OfficersRequiredMixin(MembersRequiredMixin):
+class OfficersRequiredMixin(ClubAuthorizationRequiredMixin):
     """Mixin that redirects the user if the user is member."""
 
-    def dispatch(self, *args, **kwargs):
-        """Redirect when user is member, or dispatch as normal otherwise."""
+    required_authorization = Club_Member.OFFICER
 
-        if get_authorization(self.request.user, get_club(self.kwargs['club_id'])) == 'ME':
-            messages.add_message(self.request, messages.ERROR, "You are not an officer of this club")
-            return redirect(settings.REDIRECT_URL_WHEN_MEMBER, self.kwargs['club_id'])
-        return super().dispatch(*args, **kwargs)
-
-class OwnersRequiredMixin(OfficersRequiredMixin):
+class OwnersRequiredMixin(ClubAuthorizationRequiredMixin):
     """Mixin that redirects the user if the user is officer."""
 
-    def dispatch(self, *args, **kwargs):
-        """Redirect when user is officer, or dispatch as normal otherwise."""
-
-        if get_authorization(self.request.user, get_club(self.kwargs['club_id'])) == 'OF':
-            messages.add_message(self.request, messages.ERROR, "You are not the owner of this club")
-            return redirect(settings.REDIRECT_URL_WHEN_OFFICER, self.kwargs['club_id'])
-        return super().dispatch(*args, **kwargs)
+    required_authorization = Club_Member.OWNER
@@ -5,9 +5,9 @@ from clubs.models import *
 from clubs.views.mixins import *
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.views.generic import TemplateView
 from django.views.generic.edit import FormView
-from django.shortcuts import render
 from django.urls import reverse
 
 class HomeView(LoginProhibitedMixin, TemplateView):
@@ -24,18 +24,12 @@ class CreateClubView(LoginRequiredMixin, FormView):
     def form_valid(self,form):
         """Proccess the form."""
 
-        current_user = self.request.user
-        try:
-            # Create the club with the owner being the user who filled the form.
+        # Create the club with the owner being the user who filled the form, its address is geocoded once both exist.
+        with transaction.atomic():
             club_created = form.save()
-            Club_Member.objects.create(user=current_user, club=club_created, authorization='OW')
-            messages.success(self.request, "Club created Successfully")
-            return super().form_valid(form)
-        except IndexError:
-            # Render the form again if the address is invalid
-            messages.error(self.request, "Invalid address")
-            form_new = CreateClubForm()
-            return render(self.request,'create_club.html',{'form': form_new})
+            Club_Member.objects.create(user=self.request.user, club=club_created, authorization=Club_Member.OWNER)
+        messages.success(self.request, "Club created Successfully")
+        return super().form_valid(form)
 
     def get_success_url(self):
         """Return redirect URL to dashboard after creating a club successfully."""
@@ -51,10 +45,6 @@ class WaitingListView(ApplicantsOnlyMixin, TemplateView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        current_user = self.request.user
-        club = get_club(kwargs['club_id'])
-
-        context['my_clubs'] = get_my_clubs(current_user)
-        context['my_authorization'] = get_authorization_text(current_user, club)
+        context['my_authorization'] = self.membership.authorization_text
 
         return context
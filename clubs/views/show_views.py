@@ -4,7 +4,7 @@ from clubs.views.mixins import *
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import TemplateView
 
-class ShowView(TemplateView):
+class ShowView(ClubMembershipMixin, TemplateView):
     """Abstract Class for Views that show an object in the application."""
 
     def get(self, request, *args, **kwargs):
@@ -19,12 +19,9 @@ class ShowView(TemplateView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        club = get_club(kwargs['club_id'])
-        current_user = self.request.user
 
         context['club_id'] = kwargs['club_id']
-        context['my_clubs'] = get_my_clubs(current_user)
-        context['my_authorization'] = get_authorization_text(current_user, club)
+        context['my_authorization'] = self.membership.authorization_text
 
         return context
 
@@ -36,8 +33,7 @@ class ShowClubView(LoginRequiredMixin, ShowView):
     def is_show_correct(self, **kwargs):
         """Check if the club exist."""
 
-        club = get_club(kwargs['club_id'])
-        return club != None
+        return self.membership.club != None
 
     def incorrect_show_redirect(self, **kwargs):
         """Redirect the user to dashboard if the club that needs to be shown does not exist."""
@@ -48,13 +44,12 @@ class ShowClubView(LoginRequiredMixin, ShowView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         owner = get_owners(club).first()
-        current_user = self.request.user
 
         context['club'] = club
         context['owner'] = owner
-        context['is_user_in_club'] = is_user_in_club(current_user, club)
+        context['is_user_in_club'] = self.membership.club_member != None
 
         return context
 
@@ -69,7 +64,7 @@ class ShowClubUserView(ShowView):
     def is_show_correct(self, **kwargs):
         """Check if the user exist and if the user is in the given club."""
 
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         user = get_user(kwargs[self.id_name])
         return user != None and self.is_show_user_correct(user, club)
 
@@ -102,7 +97,7 @@ class ShowMemberView(MembersRequiredMixin, ShowClubUserView):
         """Generate context data to be shown in the template."""
 
         context = super().get_context_data(**kwargs)
-        club = get_club(kwargs['club_id'])
+        club = self.membership.club
         user = get_user(kwargs[self.id_name])
         context['authorizationText'] = get_authorization_text(user, club)
         context['chess_experience'] = get_chess_experience_text(user)
@@ -72,6 +72,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'clubs.context_processors.my_clubs',
             ],
         },
     },
@@ -133,6 +134,9 @@ STATICFILES_DIRS = [
 ]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Test runner overriding the settings for the tests, on Heroku CI with the database it provides
+TEST_RUNNER = 'clubs.tests.runner.HerokuTestRunner' if 'CI' in os.environ else 'clubs.tests.runner.TestRunner'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
@@ -159,10 +163,106 @@ REDIRECT_URL_WHEN_MEMBER = 'members_list'
 # URL to Redirect when an officer
 REDIRECT_URL_WHEN_OFFICER = 'members_list'
 
+# Caches
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+# Cached data is invalidated on writes, so every worker process must share the
+# same cache. Without a shared cache nothing is cached, as a cache of each
+# process would go on serving what the other processes invalidated.
+if 'MEMCACHED_LOCATION' in os.environ:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': os.environ['MEMCACHED_LOCATION'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
+# Seconds a cached club authorization is kept for, as a safety net for writes that bypass invalidation
+AUTHORIZATION_CACHE_TIMEOUT = 60 * 60
+
+# Seconds the clubs of a user shown in the navigation bar are cached for, for the same reason
+MY_CLUBS_CACHE_TIMEOUT = 60 * 60
+
+# Share of the cache lookups counted in the hit and miss counters, as counting takes round trips to the cache too
+CACHE_STATS_SAMPLE_RATE = 0.01
+
+# Seconds a rendered template fragment is cached for, None as its key changes whenever what it shows does
+FRAGMENT_CACHE_TIMEOUT = None
+
+# Number of clubs shown at once in a list of clubs
+CLUBS_PAGE_SIZE = 24
+
+# Number of users shown at once in a list of users
+USERS_PAGE_SIZE = 50
+
+# Geocoders the addresses of clubs are looked up with, in order until one knows the address
+GEOCODERS = [
+    'clubs.geocoders.GazetteerGeocoder',
+    'clubs.geocoders.NominatimGeocoder',
+]
+
+# Most requests a second each process makes to the geocoder, None for no limit. The Nominatim usage policy allows one.
+GEOCODER_RATE_LIMIT = 1
+
+# Directory of the local gazetteer of postal codes and cities, built with the build_gazetteer command
+GAZETTEER_PATH = os.environ.get('GAZETTEER_PATH', os.path.join(BASE_DIR, 'gazetteer'))
+
+# Nominatim server the addresses of clubs are searched with when the gazetteer does not know them
+GEOCODER_URL = os.environ.get('GEOCODER_URL', 'https://nominatim.openstreetmap.org/search')
+
+# Identifies the app to the geocoder, as the Nominatim usage policy asks
+GEOCODER_USER_AGENT = 'chess-club-management-system'
+
+# Seconds to wait for a connection to the geocoder, and then for each read of its answer
+GEOCODER_CONNECT_TIMEOUT = 3.05
+GEOCODER_READ_TIMEOUT = 10
+
+# Number of times a request to the geocoder that failed in a way that may pass is retried, and the
+# seconds the random delay before the first retry is at most, doubling for each retry after it
+GEOCODER_RETRIES = 2
+GEOCODER_RETRY_DELAY = 0.5
+
+# Most seconds a retry waits for when the geocoder asks to be waited for, failing at once if it asks for longer
+GEOCODER_MAX_RETRY_AFTER = 30
+
+# Number of geocoder calls failing in a row after which each process stops calling it, and the seconds
+# until it tries again
+GEOCODER_CIRCUIT_FAILURES = 5
+GEOCODER_CIRCUIT_RESET_TIMEOUT = 60
+
+# Seconds a location the geocoder gave for an address is reused for, and for an address it did not know
+GEOCODE_CACHE_TIMEOUT = 30 * 24 * 60 * 60
+GEOCODE_NOT_FOUND_CACHE_TIMEOUT = 24 * 60 * 60
+
+# Number of recently used locations of addresses each process keeps in memory, in front of the database
+GEOCODE_MEMORY_CACHE_SIZE = 1024
+
+# Number of threads geocoding clubs in the background, 0 to geocode while the request waits
+GEOCODING_WORKERS = 2
+
+# Kilometres around a point the nearest clubs are first looked for within, growing until there are enough
+NEARBY_CLUBS_SEARCH_RADIUS = 10
+
+# Largest radius in kilometres, and number of clubs, that can be asked for when looking for clubs near a point
+NEARBY_CLUBS_MAX_RADIUS = 500
+NEARBY_CLUBS_MAX_COUNT = 100
+
+# Number of nearest clubs shown when neither a radius nor a number is asked for
+NEARBY_CLUBS_DEFAULT_COUNT = 10
+
+# Most cells of the map a box of clusters of clubs may have, zooming out until it has no more
+CLUSTERS_MAX_CELLS = 1024
+
 MESSAGE_TAGS = {
     message_constants.DEBUG: 'dark',
     message_constants.ERROR: 'danger',
 }
 
-# Activate Django Heroku
-django_heroku.settings(locals())
+# Activate Django Heroku, whose test runner is extended by TEST_RUNNER
+django_heroku.settings(locals(), test_runner=False)
@@ -38,6 +38,10 @@ urlpatterns = [
     path('<int:club_id>/members_list/', views.MembersListView.as_view(), name='members_list'),
     path('<int:club_id>/applicants_list/', views.ApplicantsListView.as_view(), name='applicants_list'),
     path('dashboard/',views.DashboardView.as_view(), name='dashboard'),
+    path('dashboard/other_clubs/',views.OtherClubsView.as_view(), name='other_clubs'),
+    path('nearby_clubs/', views.NearbyClubsView.as_view(), name='nearby_clubs'),
+    path('nearby_clubs/search/', views.NearbyClubsSearchView.as_view(), name='nearby_clubs_search'),
+    path('club_clusters/', views.ClubClustersView.as_view(), name='club_clusters'),
     #Other views#
     path('', views.HomeView.as_view(), name='home'),
     path('create_club/',views.CreateClubView.as_view(), name='create_club'),